@@ -148,10 +148,20 @@ from . import distances
 from . import similarities
 from . import misc
 from . import sets
+from ._pairwise import pairwise
+from ._plans import make_measure
+from ._config import config, get_config, set_config
+from ._cache import FeatureCache
 
 __all__ = (
     "distances",
     "similarities",
     "misc",
-    "sets"
+    "sets",
+    "pairwise",
+    "make_measure",
+    "config",
+    "get_config",
+    "set_config",
+    "FeatureCache"
 )
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+from collections.abc import Callable
+import weakref
+import numpy as np
+
+from ._config import _get_option
+from .sets import IntuitionisticFuzzySet
+
+
+class FeatureCache:
+    """ Least recently used cache of the terms of the measures that depend on a single set.
+
+    When a set is measured against many others, terms such as the norms of its values
+    in `ye` are calculated once and reused. Sets are identified by the memory, shape and
+    strides of their membership values, non-membership values and hesitation degrees, so the views of an IFSBatch row
+    are recognized as the same set, and an entry is discarded if the arrays holding the
+    values are freed.
+    The values of the sets must not be modified in place while the cache is in use.
+    Looking up a term costs a few microseconds, so the cache pays off for sets of hundreds
+    of elements or more.
+
+    Enable it through the configuration of fsmpy:
+
+    >>> import fsmpy
+    >>> with fsmpy.config(feature_cache=fsmpy.FeatureCache(maxsize=4096)):
+    ...     similarities = [ye(A, B) for B in sets]
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of cached terms.
+    hits : int
+        Number of terms found in the cache.
+    misses : int
+        Number of terms calculated.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """ Constructor method.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of cached terms, the least recently used are evicted first.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1, not {}".format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, S: IntuitionisticFuzzySet, compute: Callable) -> np.ndarray:
+        """ Returns the term compute(S), calculating it only if it is not cached.
+
+        Parameters
+        ----------
+        S : IntuitionisticFuzzySet
+            The set.
+        compute : Callable
+            Calculates the term given the set, it also identifies the term in the cache.
+
+        Returns
+        -------
+        np.ndarray
+            The term, read-only.
+        """
+        arrays = (S.membership_values, S.non_membership_values, S.hesitation_degrees)
+        key = (compute,) + tuple((array.ctypes.data, array.shape, array.strides, array.dtype.str) for array in arrays)
+        entry = self._entries.get(key)
+        if entry is not None:
+            references, value = entry
+            if all(reference() is _root(array) for reference, array in zip(references, arrays)):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        value = np.asarray(compute(S))
+        value.flags.writeable = False
+        self._entries[key] = (tuple(weakref.ref(_root(array)) for array in arrays), value)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def discard(self, array: np.ndarray) -> None:
+        """ Removes the cached terms of the sets whose values are held by the memory of array,
+        e.g. before the array is refilled with other values.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            The array, or a view of it.
+        """
+        root = _root(array)
+        for key in [key for key, (references, _) in self._entries.items()
+                    if any(reference() is root for reference in references)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """ Removes all cached terms. """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def currsize(self) -> int:
+        """ Number of cached terms.
+
+        Returns
+        -------
+        int
+        """
+        return len(self._entries)
+
+
+def _root(array: np.ndarray) -> np.ndarray:
+    """ The array owning the memory of a view. """
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def _discard_array(array: np.ndarray) -> None:
+    """ Removes the terms cached for the memory of array from the feature cache, if it is enabled. """
+    cache = _get_option("feature_cache")
+    if cache is not False:
+        cache.discard(array)
+
+
+def _set_term(S: IntuitionisticFuzzySet, compute: Callable) -> np.ndarray:
+    """ Calculates compute(S), a term depending only on the set S, through the feature cache if it is enabled. """
+    cache = _get_option("feature_cache")
+    if cache is False:
+        return compute(S)
+    return cache.get(S, compute)
@@ -0,0 +1,100 @@
+from contextlib import contextmanager
+import threading
+
+_global_config = {
+    "validate": True,
+    "feature_cache": False,
+}
+_threadlocal = threading.local()
+
+
+def _get_threadlocal_config() -> dict:
+    """ Overrides of the global configuration for the current thread, set by `config`. """
+    if not hasattr(_threadlocal, "config"):
+        _threadlocal.config = {}
+    return _threadlocal.config
+
+
+def get_config() -> dict:
+    """ Retrieves the current configuration of fsmpy.
+
+    Returns
+    -------
+    dict
+        Keys are the parameter names that can be passed to `set_config`.
+
+    See also
+    --------
+    fsmpy.config, fsmpy.set_config
+    """
+    return {**_global_config, **_get_threadlocal_config()}
+
+
+def set_config(validate: bool = None, feature_cache=None) -> None:
+    """ Sets the global configuration of fsmpy.
+
+    Parameters
+    ----------
+    validate : bool, optional
+        If False, the measures skip the validation of their input (cardinality of the sets, p,
+        weights and omegas checks), which saves a significant part of the cost for small sets.
+        Only disable it for inputs that are already validated. Default is True.
+    feature_cache : FeatureCache or False, optional
+        Cache of the terms of the measures that depend on a single set, used when a set
+        is measured against many others. False disables it, which is the default.
+
+    See also
+    --------
+    fsmpy.config, fsmpy.get_config
+    """
+    if validate is not None:
+        _global_config["validate"] = validate
+    if feature_cache is not None:
+        _global_config["feature_cache"] = feature_cache
+
+
+def _get_option(name: str):
+    """ Current value of a configuration parameter, read without building the configuration dict
+    of `get_config`, for the checks done in every measure call.
+    """
+    local_config = getattr(_threadlocal, "config", None)
+    if local_config and name in local_config:
+        return local_config[name]
+    return _global_config[name]
+
+
+def _validation_enabled() -> bool:
+    """ Whether the measures validate their input, see `set_config`. """
+    return _get_option("validate")
+
+
+@contextmanager
+def config(validate: bool = None, feature_cache=None):
+    """ Context manager for the configuration of fsmpy, in the current thread.
+
+    The configuration is restored when exiting the context.
+
+    Parameters
+    ----------
+    validate : bool, optional
+        If False, the measures skip the validation of their input, see `set_config`.
+    feature_cache : FeatureCache or False, optional
+        Cache of the terms of the measures that depend on a single set, see `set_config`.
+
+    Examples
+    --------
+    >>> import fsmpy
+    >>> with fsmpy.config(validate=False):
+    ...     similarities = [ye(A, B) for A, B in pairs]
+    """
+    local_config = _get_threadlocal_config()
+    previous = local_config.copy()
+    if validate is not None:
+        local_config["validate"] = validate
+    if feature_cache is not None:
+        local_config["feature_cache"] = feature_cache
+    try:
+        yield
+    finally:
+        local_config.clear()
+        local_config.update(previous)
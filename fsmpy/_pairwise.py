@@ -0,0 +1,176 @@
+from collections.abc import Callable
+from typing import Iterable, Optional, Union
+import numpy as np
+
+from ._config import config, _validation_enabled
+from .sets import IntuitionisticFuzzySet, IFSBatch, as_batch
+from . import distances, similarities, misc
+
+# measures whose computations broadcast over the leading axes of the sets' values,
+# reducing only the last (elements) axis
+_BROADCAST_MEASURES = frozenset([
+    distances.atanassov, distances.szmidt_kacprzyk, distances.wang_xin, distances.yang_chiclana,
+    distances.grzegorzewski, distances.vlachos_sergiadis,
+    similarities.dengfeng_chuntian, similarities.liang_shi, similarities.park_kwun_lim, similarities.mitchell,
+    similarities.julian_hung_lin, similarities.hung_yang_1, similarities.ye, similarities.hwang_yang,
+    similarities.hung_yang_2, similarities.zhang_fu, similarities.hung_yang_3, similarities.chen_1,
+    similarities.hung_yang_4, similarities.hong_kim, similarities.chen_2, similarities.liu, similarities.iancu,
+    similarities.song_wang_lei_xue, similarities.intarapaiboon, similarities.deng_jiang_fu, similarities.nguyen,
+    similarities.chen_cheng_lan, similarities.muthukumar_krishnanb,
+    misc.fuzzy_divergence,
+])
+
+# rough number of full-size temporaries a measure allocates, used to size the tiles
+_TEMPORARIES = 16
+
+
+def pairwise(X: Union[IFSBatch, Iterable[IntuitionisticFuzzySet]], Y: Optional[Union[IFSBatch, Iterable[IntuitionisticFuzzySet]]],
+             measure: Union[Callable, str], *, working_memory: int = 8, **params) -> np.ndarray:
+    """ Computes the measure between every set of X and every set of Y.
+
+    The sets are processed in tiles of X and Y rows, so that the temporaries of each
+    tile fit in about `working_memory` MiB. The measures of fsmpy.distances and fsmpy.similarities
+    are evaluated on each tile in a single broadcast call, any other callable is called
+    once for each pair of sets. The cardinality of all the sets and the parameters are validated
+    once, before measuring the sets.
+
+    The sums of products of `ye`, `hwang_yang` and `muthukumar_krishnanb` are calculated
+    as matrix products, which use the multi-threaded BLAS that numpy is linked to.
+
+    Parameters
+    ----------
+    X : IFSBatch, 3-d np.ndarray or Iterable[IntuitionisticFuzzySet]
+        The first group of sets.
+    Y : IFSBatch, 3-d np.ndarray, Iterable[IntuitionisticFuzzySet] or None
+        The second group of sets. If None, X is measured against itself, e.g. `pairwise(X, None, "ye")`.
+    measure : Callable or str
+        The measure function or its name, e.g. `"hung_yang_3"`.
+    working_memory : int, optional
+        Approximate memory, in MiB, used for the temporaries of each tile. Tiles that
+        fit in the CPU caches are usually the fastest.
+    **params : measure arguments
+        Passed to the measure.
+
+    Returns
+    -------
+    np.ndarray
+        Matrix of shape `(len(X), len(Y))`, holding the measure between X[i] and Y[j].
+
+    Examples
+    --------
+    >>> from fsmpy import pairwise, HUNG_YANG_3_SIMILARITY_3
+    >>> pairwise(patients, diagnoses, "hung_yang_3", similarity_type=HUNG_YANG_3_SIMILARITY_3)
+    """
+    measure = _get_measure(measure)
+    X = as_batch(X)
+    Y = X if Y is None else as_batch(Y)
+    if X.cardinality != Y.cardinality:
+        raise ValueError("X and Y sets must be have the same sizes.({} and {})".format(X.cardinality, Y.cardinality))
+
+    # the cardinality of all the sets is checked above, the parameters are checked by measuring a pair of sets,
+    # then every pair of sets is measured without validation
+    if _validation_enabled() and len(X) > 0 and len(Y) > 0:
+        measure(X[0], Y[0], **params)
+    result = np.empty((len(X), len(Y)), dtype=np.float64)
+    with config(validate=False):
+        if not _is_broadcast(measure):
+            for i, A in enumerate(X):
+                for j, B in enumerate(Y):
+                    result[i, j] = measure(A, B, **params)
+            return result
+
+        matmul_measure = _MATMUL_MEASURES.get(getattr(measure, "func", measure))
+        if matmul_measure is not None and not getattr(measure, "args", ()):
+            params = {**getattr(measure, "keywords", {}), **params}
+            return matmul_measure(X, Y, result, working_memory, **params)
+        return _tiled(X, Y, measure, result, working_memory, **params)
+
+
+def _tiled(X: IFSBatch, Y: IFSBatch, measure: Callable, result: np.ndarray, working_memory: int, **params) -> np.ndarray:
+    """ Evaluates a broadcast measure on tiles of X and Y, writing to result. """
+    x_tile, y_tile = _tile_sizes(len(X), len(Y), X.cardinality, working_memory)
+    for i in range(0, len(X), x_tile):
+        A = IntuitionisticFuzzySet(*X.values[:, i:i + x_tile, None, :])
+        for j in range(0, len(Y), y_tile):
+            B = IntuitionisticFuzzySet(*Y.values[:, None, j:j + y_tile, :])
+            result[i:i + x_tile, j:j + y_tile] = measure(A, B, **params)
+    return result
+
+
+def _ye_matmul(X: IFSBatch, Y: IFSBatch, result: np.ndarray, working_memory: int, weights: Iterable = None) -> np.ndarray:
+    """ similarities.ye, where the sum of the products of the normalized values is a matrix product. """
+    def normalized(S):
+        norms = np.sqrt(S.membership_values ** 2.0 + S.non_membership_values ** 2.0)
+        return np.hstack([S.membership_values / norms, S.non_membership_values / norms])
+
+    if weights is None:
+        weights = 1.0 / X.cardinality
+    else:
+        weights = np.tile(weights, 2)
+    return np.matmul(normalized(X) * weights, normalized(Y).T, out=result)
+
+
+def _hwang_yang_matmul(X: IFSBatch, Y: IFSBatch, result: np.ndarray, working_memory: int) -> np.ndarray:
+    """ similarities.hwang_yang, where C1 and C2 are matrix products. C3 is not separable and is broadcast. """
+    def normalized(S):
+        f = 1.0 + S.membership_values - S.non_membership_values
+        norms = np.sqrt(f ** 2.0 + (2.0 * S.non_membership_values) ** 2.0)
+        return np.hstack([f / norms, 2.0 * S.non_membership_values / norms])
+
+    _tiled(X, Y, similarities._hwang_yang_c3, result, working_memory)
+    result += _ye_matmul(X, Y, np.empty_like(result), working_memory)
+    result += (normalized(X) / X.cardinality) @ normalized(Y).T
+    result /= 3.0
+    return result
+
+
+def _muthukumar_krishnanb_matmul(X: IFSBatch, Y: IFSBatch, result: np.ndarray, working_memory: int,
+                                 weights: Iterable = None) -> np.ndarray:
+    """ similarities.muthukumar_krishnanb, where the numerator is a matrix product. The denominator is broadcast. """
+    _tiled(X, Y, similarities._muthukumar_krishnanb_denominator, result, working_memory)
+    nominator = np.hstack([X.membership_values, X.non_membership_values])
+    if weights is not None:
+        nominator = nominator * np.tile(weights, 2) / np.sum(weights)
+    nominator = nominator @ np.hstack([Y.membership_values, Y.non_membership_values]).T
+    return np.divide(nominator, result, out=result)
+
+
+# measures with a faster pairwise evaluation through matrix products
+_MATMUL_MEASURES = {
+    similarities.ye: _ye_matmul,
+    similarities.hwang_yang: _hwang_yang_matmul,
+    similarities.muthukumar_krishnanb: _muthukumar_krishnanb_matmul,
+}
+
+
+def _one_to_many(A: IntuitionisticFuzzySet, B: Union[IFSBatch, Iterable[IntuitionisticFuzzySet]],
+                 measure: Callable, **params) -> np.ndarray:
+    """ Measures A against every set of B, in a single broadcast call when the measure supports it. """
+    if _is_broadcast(measure):
+        B = as_batch(B)
+        return np.broadcast_to(measure(A, B, **params), (len(B),))
+    return np.array([measure(A, b, **params) for b in B])
+
+
+def _is_broadcast(measure: Callable) -> bool:
+    """ Whether the measure, possibly bound to its arguments with functools.partial, broadcasts. """
+    return getattr(measure, "func", measure) in _BROADCAST_MEASURES
+
+
+def _tile_sizes(n_x: int, n_y: int, cardinality: int, working_memory: int) -> tuple:
+    """ Number of X and Y rows per tile, so that a tile's temporaries fit in working_memory MiB. """
+    pairs = max(1, (working_memory * 2 ** 20) // (_TEMPORARIES * 8 * max(cardinality, 1)))
+    y_tile = int(min(n_y, pairs))
+    x_tile = int(max(1, min(n_x, pairs // y_tile)))
+    return x_tile, y_tile
+
+
+def _get_measure(measure: Union[Callable, str]) -> Callable:
+    """ Resolves a measure name to the measure function of fsmpy.similarities, fsmpy.distances or fsmpy.misc. """
+    if callable(measure):
+        return measure
+    for module in (similarities, distances, misc):
+        caller = getattr(module, measure, None)
+        if caller in _BROADCAST_MEASURES:
+            return caller
+    raise ValueError("Unknown measure {}.".format(measure))
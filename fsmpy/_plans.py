@@ -0,0 +1,71 @@
+from collections.abc import Callable
+from functools import partial
+from typing import Union
+import warnings
+import numpy as np
+
+from .sets import IntuitionisticFuzzySet
+from ._config import config
+from ._pairwise import _get_measure, _is_broadcast
+from .utils._measure_input_validation import _as_set
+
+
+class _MeasurePlan(partial):
+    """ A measure bound to its validated parameters, that only checks the cardinality of the sets when called. """
+
+    def __call__(self, A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
+        sets = _as_set(A), _as_set(B)
+        if len(sets[0]) != len(sets[1]):
+            raise ValueError("A and B sets must be have the same sizes.({} and {})".format(len(sets[0]), len(sets[1])))
+        # the batches are converted once, the measures outside fsmpy receive the sets as passed
+        if _is_broadcast(self.func):
+            A, B = sets
+        with config(validate=False):
+            return super().__call__(A, B)
+
+
+def make_measure(measure: Union[Callable, str], **params) -> Callable:
+    """ Binds a measure to its parameters, for measuring many pairs of sets with the same configuration.
+
+    The weights and omegas are converted to arrays and the parameters (p, weights, omegas and the
+    measure type) are validated once, when the measure is made, so a wrong parameter raises here.
+    The returned measure calls the measure with `config(validate=False)`, after checking that the sets
+    have the same cardinality. The returned callable can be passed wherever a measure is expected, e.g. to `pairwise`,
+    `FuzzyTextClassifier` or `threshold`, and keeps the broadcasting of the fsmpy measures.
+
+    Parameters
+    ----------
+    measure : Callable or str
+        The measure function or its name, e.g. `"hung_yang_4"`.
+    **params : measure arguments
+        The arguments of the measure, e.g. `similarity_type`, `p` or `weights`.
+
+    Returns
+    -------
+    Callable
+        The measure, called as `measure(A, B)`.
+
+    Raises
+    ------
+    ValueError
+        If the measure is unknown or its parameters are not valid.
+
+    Examples
+    --------
+    >>> from fsmpy import make_measure, HUNG_YANG_4_SIMILARITY_2
+    >>> measure = make_measure("hung_yang_4", similarity_type=HUNG_YANG_4_SIMILARITY_2, p=2)
+    >>> measure(A, B)
+    """
+    measure = _get_measure(measure)
+    for name in ("weights", "omegas"):
+        if params.get(name) is not None:
+            params[name] = np.asarray(params[name], dtype=np.float64)
+    if _is_broadcast(measure):
+        # the parameters are checked on sets of the cardinality of the weights
+        weights = params.get("weights")
+        n = 1 if weights is None else max(weights.size, 1)
+        S = IntuitionisticFuzzySet(np.full(n, 0.5), np.full(n, 0.25))
+        with warnings.catch_warnings(), np.errstate(all="ignore"):
+            warnings.simplefilter("ignore")
+            measure(S, S, **params)
+    return _MeasurePlan(measure, **params)
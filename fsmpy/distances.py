@@ -15,8 +15,8 @@ def atanassov(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_typ
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     distance_type: str, optional
         Type of computed distance: 
 
@@ -30,12 +30,13 @@ def atanassov(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_typ
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     if distance_type == DISTANCE_HAMMING:
         return (
             np.sum(
                 np.absolute(A.membership_values - B.membership_values) + 
-                np.absolute(A.non_membership_values - B.non_membership_values)
+                np.absolute(A.non_membership_values - B.non_membership_values),
+                axis=-1
             )
             ) / 2.0
 
@@ -43,21 +44,24 @@ def atanassov(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_typ
         return np.sqrt(
                 np.sum(
                     np.power(A.membership_values - B.membership_values, 2.0) + 
-                    np.power(A.non_membership_values - B.non_membership_values, 2.0)
+                    np.power(A.non_membership_values - B.non_membership_values, 2.0),
+                    axis=-1
                 ) / 2.0
             )
 
     elif distance_type == DISTANCE_NORMALIZED_HAMMING:
         return np.sum(
                 np.absolute(A.membership_values - B.membership_values) + 
-                np.absolute(A.non_membership_values - B.non_membership_values)
+                np.absolute(A.non_membership_values - B.non_membership_values),
+                axis=-1
             ) / (2.0 * len(A))
 
     elif distance_type == DISTANCE_NORMALIZED_EUCLIDEAN:
         return np.sqrt(
             np.sum(
                 np.power(A.membership_values - B.membership_values, 2.0) + 
-                np.power(A.non_membership_values - B.non_membership_values, 2.0)
+                np.power(A.non_membership_values - B.non_membership_values, 2.0),
+                axis=-1
             ) / (2.0 * len(A))
         )
 
@@ -73,8 +77,8 @@ def szmidt_kacprzyk(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distan
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     distance_type: str, optional
         Type of computed distance: 
         
@@ -88,12 +92,13 @@ def szmidt_kacprzyk(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distan
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     if distance_type == DISTANCE_HAMMING:
         return np.sum(
             np.absolute(A.membership_values - B.membership_values) +
             np.absolute(A.non_membership_values - B.non_membership_values) +
-            np.absolute(A.hesitation_degrees - B.hesitation_degrees)
+            np.absolute(A.hesitation_degrees - B.hesitation_degrees),
+            axis=-1
         ) / 2.0
 
     elif distance_type == DISTANCE_EUCLIDEAN:
@@ -102,7 +107,7 @@ def szmidt_kacprzyk(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distan
                 np.sum(
                     np.power(A.membership_values - B.membership_values, 2.0) +
                     np.power(A.non_membership_values - B.non_membership_values, 2.0) +
-                    np.power(A.hesitation_degrees - B.hesitation_degrees, 2.0))
+                    np.power(A.hesitation_degrees - B.hesitation_degrees, 2.0), axis=-1)
             ) / 2.0
         )
 
@@ -110,7 +115,8 @@ def szmidt_kacprzyk(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distan
         return np.sum(
             np.absolute(A.membership_values - B.membership_values) + 
             np.absolute(A.non_membership_values - B.non_membership_values) + 
-            np.absolute(A.hesitation_degrees - B.hesitation_degrees)
+            np.absolute(A.hesitation_degrees - B.hesitation_degrees),
+            axis=-1
         ) / (2.0 * len(A))
 
     elif distance_type == DISTANCE_NORMALIZED_EUCLIDEAN:
@@ -118,7 +124,8 @@ def szmidt_kacprzyk(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distan
             np.sum(
                 np.power(A.membership_values - B.membership_values, 2.0) + 
                 np.power(A.non_membership_values - B.non_membership_values, 2.0) + 
-                np.power(A.hesitation_degrees - B.hesitation_degrees, 2.0)
+                np.power(A.hesitation_degrees - B.hesitation_degrees, 2.0),
+                axis=-1
             ) / (2.0 * len(A))
         )
 
@@ -135,8 +142,8 @@ def wang_xin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_type
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         distance_type: int, optional
         Type of computed distance: 
     
@@ -153,7 +160,7 @@ def wang_xin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_type
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p, distance_type, measure_types_required=[WANGXIN_DISTANCE_2])
     check_weights(weights, len(A), distance_type, measure_types_required=[WANGXIN_DISTANCE_1])
     n = len(A)
@@ -165,19 +172,22 @@ def wang_xin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance_type
         if weights is None:
             return np.sum(
                 (m_diff + v_diff) / 4.0 +
-                np.maximum(m_diff, v_diff) / 2.0
+                np.maximum(m_diff, v_diff) / 2.0,
+                axis=-1
             ) / n
         else:
             return np.sum(
                 weights *
                 ((m_diff + v_diff) / 4.0 +
-                 np.maximum(m_diff, v_diff) / 2.0)
+                 np.maximum(m_diff, v_diff) / 2.0),
+                axis=-1
             ) / np.sum(weights)
 
     elif distance_type == WANGXIN_DISTANCE_2:
         multiplier = (1. / math.pow(n, 1. / p))
         summation = np.sum(
-            np.power((m_diff + v_diff) / 2., p)
+            np.power((m_diff + v_diff) / 2., p),
+            axis=-1
         )
         return multiplier * np.power(summation, (1.0 / p))
 
@@ -189,8 +199,8 @@ def yang_chiclana(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  distanc
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     distance_type: str, optional
         Type of computed distance: 
 
@@ -204,7 +214,7 @@ def yang_chiclana(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  distanc
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     n = len(A)
     delta_memberships = np.absolute(A.membership_values - B.membership_values)
     delta_non_memberships = np.absolute(A.non_membership_values - B.non_membership_values)
@@ -212,22 +222,26 @@ def yang_chiclana(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  distanc
 
     if distance_type == DISTANCE_HAMMING:
         return np.sum(
-            np.amax((delta_memberships, delta_non_memberships, delta_hesitations), axis=0)
+            np.amax((delta_memberships, delta_non_memberships, delta_hesitations), axis=0),
+            axis=-1
         )
     elif distance_type == DISTANCE_EUCLIDEAN:
         return np.sqrt(
             np.sum(
-                np.amax((delta_memberships ** 2, delta_non_memberships ** 2, delta_hesitations ** 2), axis=0)
+                np.amax((delta_memberships ** 2, delta_non_memberships ** 2, delta_hesitations ** 2), axis=0),
+                axis=-1
             )
         )
     elif distance_type == DISTANCE_NORMALIZED_HAMMING:
         return np.sum(
-            np.amax((delta_memberships, delta_non_memberships, delta_hesitations), axis=0)
+            np.amax((delta_memberships, delta_non_memberships, delta_hesitations), axis=0),
+            axis=-1
         ) / n
     elif distance_type == DISTANCE_NORMALIZED_EUCLIDEAN:
         return np.sqrt(
             np.sum(
-                np.amax((delta_memberships ** 2, delta_non_memberships ** 2, delta_hesitations ** 2), axis=0)
+                np.amax((delta_memberships ** 2, delta_non_memberships ** 2, delta_hesitations ** 2), axis=0),
+                axis=-1
             ) / n
         )
     else:
@@ -243,8 +257,8 @@ def grzegorzewski(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     distance_type: str, optional
         Type of computed distance: 
         >>> DISTANCE_HAMMING
@@ -257,18 +271,18 @@ def grzegorzewski(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, distance
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     m_diff = A.membership_values - B.membership_values
     v_diff = A.non_membership_values - B.non_membership_values
 
     if distance_type == DISTANCE_HAMMING:
-        return np.sum(np.maximum(np.absolute(m_diff), np.absolute(v_diff)))
+        return np.sum(np.maximum(np.absolute(m_diff), np.absolute(v_diff)), axis=-1)
     elif distance_type == DISTANCE_EUCLIDEAN:
-        return np.sqrt(np.sum(np.maximum(m_diff ** 2, v_diff ** 2)))
+        return np.sqrt(np.sum(np.maximum(m_diff ** 2, v_diff ** 2), axis=-1))
     elif distance_type == DISTANCE_NORMALIZED_HAMMING:
-        return np.sum(np.maximum(np.absolute(m_diff), np.absolute(v_diff))) / float(len(A))
+        return np.sum(np.maximum(np.absolute(m_diff), np.absolute(v_diff)), axis=-1) / float(len(A))
     elif distance_type == DISTANCE_NORMALIZED_EUCLIDEAN:
-        return np.sqrt(np.sum(np.maximum((m_diff) ** 2, v_diff ** 2)) / float(len(A)))
+        return np.sqrt(np.sum(np.maximum((m_diff) ** 2, v_diff ** 2), axis=-1) / float(len(A)))
     else:
         raise ValueError(
             "Invalid distance type provided. Please check the available flags.")
@@ -281,15 +295,15 @@ def vlachos_sergiadis(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet) -> n
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The distance between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     def _log(arr):
         invalids = np.logical_or(
             arr <= 0, 
@@ -313,7 +327,8 @@ def vlachos_sergiadis(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet) -> n
             _log(
                 setA.non_membership_values /
                 (0.5 * (setA.non_membership_values + setB.non_membership_values))
-            )
+            ),
+            axis=-1
         )
     with np.errstate(divide='ignore'):
         return iifs(A, B) + iifs(B, A)
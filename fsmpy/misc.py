@@ -12,22 +12,23 @@ def fuzzy_divergence(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     ab_diff = A.membership_values - B.membership_values
     ba_diff = B.membership_values - A.membership_values
 
     return np.sum(
         2.0 -
         (1.0 - A.membership_values + B.non_membership_values) * np.exp(ab_diff) -
-        (1.0 - B.membership_values + A.membership_values) * np.exp(ba_diff)
+        (1.0 - B.membership_values + A.membership_values) * np.exp(ba_diff),
+        axis=-1
     )
 
 
@@ -53,7 +54,8 @@ def fuzzy_index(A: IntuitionisticFuzzySet, coeff: int):
     return multiplier * np.sum(
         np.minimum(
             A.membership_values, 1.0 - A.membership_values
-        ) ** coeff
+        ) ** coeff,
+        axis=-1
     ) ** 1.0 / coeff
 
 
@@ -36,13 +36,13 @@ class FuzzySet:
     def __len__(self):
         """ Returns cardinality of the set.
         
-        Returns the size of the membership_values.
+        Returns the size of the last axis of membership_values.
 
         Returns
         -------
         int
         """
-        return len(self.membership_values)
+        return self.membership_values.shape[-1]
 
     def __str__(self):
         """ String representation of the set.
@@ -76,6 +76,10 @@ class IntuitionisticFuzzySet(FuzzySet):
     :math:`U=\{u_1, u_2, u_3\}`
     
     mathematically, they are represented as follows :math:`(μ, ν, π)`
+
+    The values may also be n-d arrays, in which case the last axis holds the elements
+    of the set and the leading axes are broadcast by the measures. This is how
+    one-to-many and pairwise measures are evaluated in a single call.
     """
     
     def __init__(self, membership_values: Iterable, non_membership_values: Iterable = None, hesitation_degrees: Iterable = None):
@@ -110,13 +114,13 @@ class IntuitionisticFuzzySet(FuzzySet):
     def __len__(self):
         """ Returns cardinality of the set.
         
-        Returns the size of the membership_values.
+        Returns the size of the last axis of membership_values.
 
         Returns
         -------
         int
         """
-        return len(self.membership_values)
+        return self.membership_values.shape[-1]
 
     def __str__(self):
         """ String representation of the set.
@@ -127,5 +131,344 @@ class IntuitionisticFuzzySet(FuzzySet):
         """
         return "{" + ", ".join([
             f"({m}, {v}, {p})"
-            for m, v, p in zip(self.membership_values, self.non_membership_values, self.hesitation_degrees)    
+            for m, v, p in zip(self.membership_values, self.non_membership_values, self.hesitation_degrees)
         ]) + "}"
+
+
+class IFSBatch:
+    """ Object to represent many Intuitionistic Fuzzy Sets of the same cardinality.
+
+    All sets are stored in a single contiguous block of shape `(3, n_sets, n_elements)`,
+    holding the membership values, non-membership values and hesitation degrees of every set.
+    Indexing with an integer returns an IntuitionisticFuzzySet whose values are views
+    of the corresponding row of the block, so no data is copied.
+
+    Attributes
+    ----------
+    values : 3-d np.ndarray
+        Block of shape `(3, n_sets, n_elements)`.
+    membership_values : 2-d np.ndarray
+        Membership values of the sets, a view of `values[0]`.
+    non_membership_values : 2-d np.ndarray
+        Non-membership values of the sets, a view of `values[1]`.
+    hesitation_degrees : 2-d np.ndarray
+        Hesitation degree values of the sets, a view of `values[2]`.
+
+    Examples
+    --------
+    >>> batch = IFSBatch([[0.5, 0.8], [0.1, 0.2]], [[0.4, 0.0], [0.7, 0.6]])
+    >>> len(batch)
+    2
+    >>> batch[0].membership_values
+    array([0.5, 0.8])
+    """
+
+    def __init__(self, membership_values: Iterable, non_membership_values: Iterable = None, hesitation_degrees: Iterable = None,
+                 dtype: type = np.float64):
+        """ Constructor method.
+
+        Parameters
+        ----------
+        membership_values : 2-d Iterable
+            Membership values of the sets, one row per set.
+        non_membership_values : 2-d Iterable, optional
+            Non-membership values of the sets. If not provided, it is set to zeros.
+        hesitation_degrees : 2-d Iterable, optional
+            Hesitation degrees values of the sets. If not provided, it is set to
+
+            >>> hesitation_degrees = 1.0 - membership_values - non_membership_values
+        dtype : data-type, optional
+            Data type of the block, np.float64 by default.
+
+        Raises
+        ------
+        ValueError
+            In case membership_values is not 2-d or the shapes of the provided values differ.
+        """
+        membership_values = np.asarray(membership_values)
+        if membership_values.ndim != 2:
+            raise ValueError(
+                "membership_values must be 2-d (n_sets, n_elements), got {} dimensions.".format(membership_values.ndim))
+
+        self.values = np.empty((3,) + membership_values.shape, dtype=dtype)
+        self.values[0] = membership_values
+        if non_membership_values is None:
+            self.values[1] = 0.0
+        else:
+            self.values[1] = _check_shape(non_membership_values, membership_values.shape)
+
+        if hesitation_degrees is None:
+            np.subtract(1.0, self.values[0], out=self.values[2])
+            self.values[2] -= self.values[1]
+        else:
+            self.values[2] = _check_shape(hesitation_degrees, membership_values.shape)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> IFSBatch:
+        """ Wraps an existing `(3, n_sets, n_elements)` block without copying it.
+
+        Parameters
+        ----------
+        values : 3-d np.ndarray
+            Membership values, non-membership values and hesitation degrees of the sets.
+
+        Returns
+        -------
+        IFSBatch
+        """
+        values = np.asarray(values)
+        if values.ndim != 3 or values.shape[0] != 3:
+            raise ValueError(
+                "values must have a shape of (3, n_sets, n_elements), got {}.".format(values.shape))
+        batch = cls.__new__(cls)
+        batch.values = values
+        return batch
+
+    @classmethod
+    def from_sets(cls, sets: Iterable[IntuitionisticFuzzySet], dtype: type = np.float64) -> IFSBatch:
+        """ Stacks Intuitionistic Fuzzy Sets of the same cardinality into a batch.
+
+        Parameters
+        ----------
+        sets : Iterable[IntuitionisticFuzzySet]
+            The sets to be stacked.
+        dtype : data-type, optional
+            Data type of the block, np.float64 by default.
+
+        Returns
+        -------
+        IFSBatch
+        """
+        if isinstance(sets, IFSBatch):
+            return sets
+        sets = list(sets)
+        if len(sets) == 0:
+            raise ValueError("Cannot create an IFSBatch from an empty Iterable.")
+        cardinality = len(sets[0])
+        values = np.empty((3, len(sets), cardinality), dtype=dtype)
+        for i, s in enumerate(sets):
+            if len(s) != cardinality:
+                raise ValueError(
+                    "All sets must have the same sizes ({} and {}).".format(cardinality, len(s)))
+            values[0, i] = s.membership_values
+            values[1, i] = s.non_membership_values
+            values[2, i] = s.hesitation_degrees
+        return cls.from_array(values)
+
+    @property
+    def membership_values(self) -> np.ndarray:
+        return self.values[0]
+
+    @membership_values.setter
+    def membership_values(self, value: Iterable):
+        self.values[0] = value
+
+    @property
+    def non_membership_values(self) -> np.ndarray:
+        return self.values[1]
+
+    @non_membership_values.setter
+    def non_membership_values(self, value: Iterable):
+        self.values[1] = value
+
+    @property
+    def hesitation_degrees(self) -> np.ndarray:
+        return self.values[2]
+
+    @hesitation_degrees.setter
+    def hesitation_degrees(self, value: Iterable):
+        self.values[2] = value
+
+    @property
+    def cardinality(self) -> int:
+        """ Cardinality of every set of the batch.
+
+        Returns
+        -------
+        int
+        """
+        return self.values.shape[2]
+
+    def __len__(self):
+        """ Returns the number of sets in the batch.
+
+        Returns
+        -------
+        int
+        """
+        return self.values.shape[1]
+
+    def __getitem__(self, index):
+        """ Returns a single set or a sub-batch.
+
+        Parameters
+        ----------
+        index : int, slice or array-like
+            An integer returns an IntuitionisticFuzzySet backed by views of the block,
+            anything else returns an IFSBatch.
+
+        Returns
+        -------
+        IntuitionisticFuzzySet or IFSBatch
+        """
+        if isinstance(index, (int, np.integer)):
+            return IntuitionisticFuzzySet(self.values[0, index], self.values[1, index], self.values[2, index])
+        return IFSBatch.from_array(self.values[:, index])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __str__(self):
+        """ String representation of the batch.
+
+        Returns
+        -------
+        str
+        """
+        return "[" + ", ".join(str(s) for s in self) + "]"
+
+
+class SparseIFSBatch:
+    """ Object to represent many Intuitionistic Fuzzy Sets that mostly share the same values.
+
+    Each set is stored as its deviation from a baseline set, in scipy.sparse CSR matrices 
+    sharing the same sparsity structure. E.g. the sets of documents from token counts, 
+    where the baseline holds the values of a token with a zero count.
+    The sets are densified only when indexed or converted with `to_batch`.
+
+    Attributes
+    ----------
+    baseline : 2-d np.ndarray
+        Block of shape `(3, n_elements)`, holding the membership values, non-membership values
+        and hesitation degrees of the baseline set.
+    deltas : tuple of 3 scipy.sparse.csr_matrix
+        Deviations of the membership values, non-membership values and hesitation degrees
+        of the sets from the baseline, each of shape `(n_sets, n_elements)`.
+
+    See also
+    --------
+    fsmpy.utils.calculate_documents_membership
+    """
+
+    def __init__(self, baseline: Iterable, membership_deltas, non_membership_deltas, hesitation_deltas):
+        """ Constructor method.
+
+        Parameters
+        ----------
+        baseline : 2-d Iterable
+            Membership values, non-membership values and hesitation degrees of the baseline set.
+        membership_deltas : scipy.sparse matrix
+            Deviations of the membership values of the sets from the baseline, one row per set.
+        non_membership_deltas : scipy.sparse matrix
+            Deviations of the non-membership values of the sets from the baseline.
+        hesitation_deltas : scipy.sparse matrix
+            Deviations of the hesitation degrees of the sets from the baseline.
+        """
+        self.baseline = np.asarray(baseline)
+        self.deltas = tuple(deltas.tocsr() for deltas in (membership_deltas, non_membership_deltas, hesitation_deltas))
+        if self.baseline.ndim != 2 or self.baseline.shape[0] != 3:
+            raise ValueError("baseline must have a shape of (3, n_elements), got {}.".format(self.baseline.shape))
+        for deltas in self.deltas:
+            if deltas.shape != self.deltas[0].shape or deltas.shape[1] != self.baseline.shape[1]:
+                raise ValueError("All deltas must have a shape of (n_sets, {}), got {}.".format(
+                    self.baseline.shape[1], deltas.shape))
+
+    @property
+    def cardinality(self) -> int:
+        """ Cardinality of every set of the batch.
+
+        Returns
+        -------
+        int
+        """
+        return self.baseline.shape[1]
+
+    @property
+    def dtype(self) -> np.dtype:
+        """ Data type of the values of the sets, the one of the baseline.
+
+        Returns
+        -------
+        np.dtype
+        """
+        return self.baseline.dtype
+
+    def to_batch(self, dtype: type = None) -> IFSBatch:
+        """ Converts the sets to a dense IFSBatch.
+
+        Parameters
+        ----------
+        dtype : data-type, optional
+            Data type of the block, the dtype of the batch (of its baseline) by default.
+
+        Returns
+        -------
+        IFSBatch
+        """
+        values = np.empty((3, len(self), self.cardinality), dtype=self.dtype if dtype is None else dtype)
+        for i, deltas in enumerate(self.deltas):
+            values[i] = deltas.toarray()
+            values[i] += self.baseline[i]
+        return IFSBatch.from_array(values)
+
+    def __len__(self):
+        """ Returns the number of sets in the batch.
+
+        Returns
+        -------
+        int
+        """
+        return self.deltas[0].shape[0]
+
+    def __getitem__(self, index):
+        """ Returns a single dense set or a sparse sub-batch.
+
+        Parameters
+        ----------
+        index : int, slice or array-like
+            An integer returns an IntuitionisticFuzzySet, anything else returns a SparseIFSBatch.
+
+        Returns
+        -------
+        IntuitionisticFuzzySet or SparseIFSBatch
+        """
+        if isinstance(index, (int, np.integer)):
+            return IntuitionisticFuzzySet(*(
+                baseline + deltas[index].toarray().ravel() for baseline, deltas in zip(self.baseline, self.deltas)
+            ))
+        return SparseIFSBatch(self.baseline, *(deltas[index] for deltas in self.deltas))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def as_batch(X) -> IFSBatch:
+    """ Converts X to an IFSBatch.
+
+    Parameters
+    ----------
+    X : IFSBatch, SparseIFSBatch, 3-d np.ndarray or Iterable[IntuitionisticFuzzySet]
+        An IFSBatch is returned as is, a SparseIFSBatch is densified, a `(3, n_sets, n_elements)` 
+        array is wrapped without copying and any other Iterable of sets is stacked.
+
+    Returns
+    -------
+    IFSBatch
+    """
+    if isinstance(X, IFSBatch):
+        return X
+    if isinstance(X, SparseIFSBatch):
+        return X.to_batch()
+    if isinstance(X, np.ndarray) and X.dtype != object:
+        return IFSBatch.from_array(X)
+    return IFSBatch.from_sets(X)
+
+
+def _check_shape(values: Iterable, shape: tuple) -> np.ndarray:
+    values = np.asarray(values)
+    if values.shape != shape:
+        raise ValueError(
+            "All values must have the same shape ({} and {}).".format(shape, values.shape))
+    return values
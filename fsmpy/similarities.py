@@ -1,9 +1,10 @@
 import numpy as np
-from typing import Iterable
+from typing import Iterable, Union
 import warnings
 
-from .utils._measure_input_validation import check_weights, check_p, check_sets_cardinality
+from .utils._measure_input_validation import check_weights, check_p, check_sets_cardinality, _validation_enabled
 from .sets import IntuitionisticFuzzySet, IntuitionisticFuzzySet
+from ._cache import _set_term
 from . import HUNG_YANG_1_SIMILARITY_1, HUNG_YANG_1_SIMILARITY_2, HUNG_YANG_1_SIMILARITY_3
 from . import HUNG_YANG_2_SIMILARITY_1, HUNG_YANG_2_SIMILARITY_2, HUNG_YANG_2_SIMILARITY_3
 from . import HUNG_YANG_3_SIMILARITY_1, HUNG_YANG_3_SIMILARITY_2, HUNG_YANG_3_SIMILARITY_3, HUNG_YANG_3_SIMILARITY_4, HUNG_YANG_3_SIMILARITY_5, HUNG_YANG_3_SIMILARITY_6, HUNG_YANG_3_SIMILARITY_7
@@ -29,8 +30,8 @@ def dengfeng_chuntian(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: i
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     p : int
         Positive integer >= 1.
     weights : list of floats
@@ -41,17 +42,21 @@ def dengfeng_chuntian(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: i
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     check_weights(weights, len(A), sum_1=True)
 
-    fA = (A.membership_values + 1 - A.non_membership_values) / 2.0
-    fB = (B.membership_values + 1 - B.non_membership_values) / 2.0
+    fA = _set_term(A, _dengfeng_chuntian_f)
+    fB = _set_term(B, _dengfeng_chuntian_f)
     n = len(A)
     if weights is None:
-        return 1 - 1 / (n ** (1 / p)) * (np.sum(np.absolute(fA - fB) ** p) ** (1 / p))
+        return 1 - 1 / (n ** (1 / p)) * (np.sum(np.absolute(fA - fB) ** p, axis=-1) ** (1 / p))
     else:
-        return 1 - np.power(np.sum(weights * np.power(np.absolute(fA - fB), p)), (1.0 / float(p)))
+        return 1 - np.power(np.sum(weights * np.power(np.absolute(fA - fB), p), axis=-1), (1.0 / float(p)))
+
+
+def _dengfeng_chuntian_f(S: IntuitionisticFuzzySet) -> np.ndarray:
+    return (S.membership_values + 1 - S.non_membership_values) / 2.0
 
 
 def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_type: str = LIANG_SHI_SIMILARITY_1, p: int = 1, weights: Iterable = None , omegas: Iterable = [0.5, 0.3, 0.2]):
@@ -62,8 +67,8 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : str, optional 
         Type of computed similarity:
         
@@ -83,7 +88,7 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     check_weights(weights, len(A), actual_measure_type=similarity_type, sum_1=True, measure_types_required=LIANG_SHI_SIMILARITY_3)
 
@@ -91,13 +96,13 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
         if weights is None:
             weights = np.full(len(A), 1 / float(len(A)))
         else:
-            weights = np.array(weights)
+            weights = np.asarray(weights)
 
-        omegas = np.array(omegas)
+        omegas = np.asarray(omegas)
         if len(omegas.shape) == 1:
             omegas = np.expand_dims(omegas, axis=1)
 
-        if not np.isclose(np.sum(omegas), 1.0):
+        if _validation_enabled() and not np.isclose(np.sum(omegas), 1.0):
             raise ValueError(
                 "Sum of omegas parameter must be equal to 1, not {}".format(np.sum(omegas))
             )
@@ -109,7 +114,8 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
 
         return 1.0 - 1.0 / np.power(n, 1.0 / p) * np.power(
                 np.sum(
-                    np.power((delta_memberships + delta_non_memberships) / 2.0, p)
+                    np.power((delta_memberships + delta_non_memberships) / 2.0, p),
+                    axis=-1
                 ),
                 1.0 / p
             )
@@ -125,7 +131,8 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
         fS2 = np.absolute(mA2 - mB2) / 2.0
         return 1.0 - (1.0 / np.power(n, 1.0 / p)) * np.power(
             np.sum(
-                np.power(fS1 + fS2, p)
+                np.power(fS1 + fS2, p),
+                axis=-1
             ),
             1.0 / p
         )
@@ -140,11 +147,10 @@ def liang_shi(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet,  similarity_
         iA = mA - A.membership_values
         iB = mB - B.membership_values
         f3 = np.maximum(iA, iB) - np.minimum(iA, iB)
-        fs = np.array([f1, f2, f3])
+        fs = np.stack([f1, f2, f3])
+        omegas = omegas.reshape((3,) + (1,) * (fs.ndim - 2) + omegas.shape[1:])
         return 1.0 - np.power(
-            np.sum(
-                weights * np.power(np.sum(omegas * fs), p)
-            ),
+            np.sum(weights) * np.power(np.sum(omegas * fs, axis=(0, -1)), p),
             1.0 / p
         )
     else:
@@ -160,8 +166,8 @@ def park_kwun_lim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int =
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     p : int
         Positive integer >= 1.
     weights : list of floats
@@ -174,7 +180,7 @@ def park_kwun_lim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int =
     The similarity between the two sets provided.
 
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
 
     n = len(A)
@@ -184,7 +190,8 @@ def park_kwun_lim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int =
     if weights is None:
         return 1.0 - (1.0 / np.power(n, 1.0 / p)) * np.power(
             np.sum(
-                np.power(delta_memberships + delta_non_memberships + delta_hesitations, p)
+                np.power(delta_memberships + delta_non_memberships + delta_hesitations, p),
+                axis=-1
             ) / 2.0,
             1.0 / p
         )
@@ -192,7 +199,8 @@ def park_kwun_lim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int =
         check_weights(weights, len(A))
         return 1.0 - np.power(
             np.sum(
-                weights * np.power(delta_memberships + delta_non_memberships + delta_hesitations, p)
+                weights * np.power(delta_memberships + delta_non_memberships + delta_hesitations, p),
+                axis=-1
             ) / 2.0,
             1.0 / p
         )
@@ -206,8 +214,8 @@ def mitchell(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int = 1):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     p : int
         Positive integer >= 1.
     weights : list of floats
@@ -218,7 +226,7 @@ def mitchell(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int = 1):
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     
     n = len(A)
@@ -227,7 +235,7 @@ def mitchell(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int = 1):
         return (
             1 -
             (1 / (n ** (1/p))) * (
-                np.sum(np.abs(a - b) ** p) ** (1/p)
+                np.sum(np.abs(a - b) ** p, axis=-1) ** (1/p)
             )
         )
     
@@ -247,8 +255,8 @@ def julian_hung_lin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     p : int
         Positive integer >= 1.
     weights : list of floats
@@ -259,7 +267,7 @@ def julian_hung_lin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     check_weights(weights, len(A), sum_1=True)
 
@@ -271,8 +279,8 @@ def julian_hung_lin(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int
     
     return (
         1 - 
-        np.sum(weights * (delta_memberships ** p)) ** (1/p) - 
-        np.sum(weights * (delta_non_memberships ** p)) ** (1/p)
+        np.sum(weights * (delta_memberships ** p), axis=-1) ** (1/p) - 
+        np.sum(weights * (delta_non_memberships ** p), axis=-1) ** (1/p)
     )
 
 
@@ -284,8 +292,8 @@ def hung_yang_1(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type: str, optional
         Type of computed similarity:
         
@@ -300,18 +308,18 @@ def hung_yang_1(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
 
     if weights is not None:
-        weights = np.array(weights)
+        weights = np.asarray(weights)
 
     if weights is None:
         D = np.sum(np.maximum(np.absolute(A.membership_values - B.membership_values),
-                   np.absolute(A.non_membership_values - B.non_membership_values))) / float(len(A))
+                   np.absolute(A.non_membership_values - B.non_membership_values)), axis=-1) / float(len(A))
     else:
         check_weights(weights, len(A))
         D = np.sum(weights * np.maximum(np.absolute(A.membership_values - B.membership_values),
-                   np.absolute(A.non_membership_values - B.non_membership_values)))
+                   np.absolute(A.non_membership_values - B.non_membership_values)), axis=-1)
 
     if similarity_type == HUNG_YANG_1_SIMILARITY_1:
         return 1 - D
@@ -319,7 +327,7 @@ def hung_yang_1(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
         tp = np.exp(-1)
         return (np.exp(-D) - tp) / float(1 - tp)
     elif similarity_type == HUNG_YANG_1_SIMILARITY_3:
-        return (1 - D) / float(1 + D)
+        return (1 - D) / (1 + D)
     else:
         raise ValueError(
             "similarity_type parameter must be HUNG_YANG_1_SIMILARITY_1, HUNG_YANG_1_SIMILARITY_2 or HUNG_YANG_1_SIMILARITY_3.")
@@ -333,8 +341,8 @@ def ye(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterable =
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
         
@@ -343,23 +351,24 @@ def ye(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterable =
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
 
     n = len(A)
     nominator = (
         A.membership_values * B.membership_values + 
         A.non_membership_values * B.non_membership_values
     )
-    denominator = (
-        np.sqrt(A.membership_values ** 2.0 + A.non_membership_values ** 2.0) *
-        np.sqrt(B.membership_values ** 2.0 + B.non_membership_values ** 2.0)
-    )
+    denominator = _set_term(A, _ye_norms) * _set_term(B, _ye_norms)
 
     if weights is None:
-        return 1.0 / n * np.sum(nominator / denominator)
+        return 1.0 / n * np.sum(nominator / denominator, axis=-1)
     else:
         check_weights(weights, len(A), sum_1=True)
-        return sum(weights * nominator / denominator)
+        return np.sum(weights * nominator / denominator, axis=-1)
+
+
+def _ye_norms(S: IntuitionisticFuzzySet) -> np.ndarray:
+    return np.sqrt(S.membership_values ** 2.0 + S.non_membership_values ** 2.0)
 
 
 def hwang_yang(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
@@ -370,31 +379,34 @@ def hwang_yang(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
 
     n = len(A)
     
     C1 = ye(A, B)
 
-    fA = 1.0 + A.membership_values - A.non_membership_values
-    fB = 1.0 + B.membership_values - B.non_membership_values
+    fA = _set_term(A, _hwang_yang_f)
+    fB = _set_term(B, _hwang_yang_f)
     
     nominator = fA * fB + (4.0 * A.non_membership_values * B.non_membership_values)
     
-    denominator = (
-        np.sqrt(fA ** 2.0 + (2.0 * A.non_membership_values) ** 2.0) *
-        np.sqrt(fB ** 2.0 + (2.0 * B.non_membership_values) ** 2.0)
-    )
-    C2 = 1.0 / n * np.sum(nominator / denominator)
+    denominator = _set_term(A, _hwang_yang_norms) * _set_term(B, _hwang_yang_norms)
+    C2 = 1.0 / n * np.sum(nominator / denominator, axis=-1)
+
+    C3 = _hwang_yang_c3(A, B)
+
+    return (C1 + C2 + C3) / 3.0
+
 
+def _hwang_yang_c3(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet) -> np.ndarray:
     nominator = (
         ((1.0 - A.membership_values) * (1.0 - B.membership_values)) + 
         ((1.0 - A.non_membership_values) * (1.0 - B.non_membership_values))
@@ -403,9 +415,15 @@ def hwang_yang(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
         np.sqrt((1.0 - A.membership_values) ** 2.0 + (1.0 - B.membership_values) ** 2.0) *
         np.sqrt((1.0 - A.non_membership_values) ** 2.0 + (1.0 - B.non_membership_values) ** 2.0)
     )
-    C3 = 1.0 / n * np.sum(nominator / denominator)
+    return 1.0 / len(A) * np.sum(nominator / denominator, axis=-1)
+
+
+def _hwang_yang_f(S: IntuitionisticFuzzySet) -> np.ndarray:
+    return 1.0 + S.membership_values - S.non_membership_values
 
-    return (C1 + C2 + C3) / 3.0
+
+def _hwang_yang_norms(S: IntuitionisticFuzzySet) -> np.ndarray:
+    return np.sqrt(_hwang_yang_f(S) ** 2.0 + (2.0 * S.non_membership_values) ** 2.0)
 
 
 def hung_yang_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_type: str = HUNG_YANG_2_SIMILARITY_1, a: int = 1):
@@ -416,8 +434,8 @@ def hung_yang_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : str, optional
         Type of computed similarity:
 
@@ -439,7 +457,7 @@ def hung_yang_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
         result = np.log(arr)
         return np.nan_to_num(result, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
     
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     
     n = len(A)
     if a < 1 and not isinstance(a, int):
@@ -499,7 +517,7 @@ def hung_yang_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
         )
         ja = -1 / (a - 1) * (TmAB + TvAB + TpAB)
 
-    J_a = np.sum(ja) / n
+    J_a = np.sum(ja, axis=-1) / n
 
     if (similarity_type == HUNG_YANG_2_SIMILARITY_1):
         return (U_a - J_a) / U_a
@@ -520,15 +538,15 @@ def zhang_fu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     
     n = len(A)
     dA = A.membership_values + (1.0 - A.membership_values - A.non_membership_values) * A.membership_values
@@ -537,7 +555,7 @@ def zhang_fu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     dB = B.membership_values + (1.0 - B.membership_values - B.non_membership_values) * B.membership_values
     aB = B.non_membership_values + (1.0 - B.membership_values - B.non_membership_values) * B.non_membership_values
     
-    return 1.0 - (1.0 / (2.0 * n)) * np.sum(np.abs(dA - dB) + np.abs(aA - aB))
+    return 1.0 - (1.0 / (2.0 * n)) * np.sum(np.abs(dA - dB) + np.abs(aA - aB), axis=-1)
 
 
 def hung_yang_3(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_type: str = HUNG_YANG_3_SIMILARITY_1):
@@ -548,8 +566,8 @@ def hung_yang_3(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : str, optional
         Type of computed similarity:
 
@@ -565,7 +583,7 @@ def hung_yang_3(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     -------
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
 
     n = float(len(A))
 
@@ -574,44 +592,44 @@ def hung_yang_3(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
             np.minimum(A.non_membership_values, B.non_membership_values)
         denom = np.maximum(A.membership_values, B.membership_values) + \
             np.maximum(A.non_membership_values, B.non_membership_values)
-        D = np.sum(np.divide(num, denom.astype(float)))
+        D = np.sum(np.divide(num, denom.astype(float)), axis=-1)
         return D / n
     elif similarity_type == HUNG_YANG_3_SIMILARITY_2:
         ptr2 = 0.5 * np.absolute(A.membership_values - B.membership_values) + \
             np.absolute(A.non_membership_values - B.non_membership_values)
-        D = np.sum(np.subtract(1, ptr2))
+        D = np.sum(np.subtract(1, ptr2), axis=-1)
         return D / n
     elif similarity_type == HUNG_YANG_3_SIMILARITY_3:
         num = np.minimum(A.membership_values, B.membership_values) + \
             np.minimum(A.non_membership_values, B.non_membership_values)
         denom = np.maximum(A.membership_values, B.membership_values) + \
             np.maximum(A.non_membership_values, B.non_membership_values)
-        D1 = np.sum(num)
-        D2 = np.sum(denom)
-        return D1 / float(D2)
+        D1 = np.sum(num, axis=-1)
+        D2 = np.sum(denom, axis=-1)
+        return D1 / D2
     elif similarity_type == HUNG_YANG_3_SIMILARITY_4:
         delta_memberships = np.absolute(A.membership_values - B.membership_values)
         delta_non_memberships = np.absolute(A.non_membership_values - B.non_membership_values)
         return 1 - 0.5 * (
-            delta_memberships.max() + 
-            delta_non_memberships.max()
+            delta_memberships.max(axis=-1) + 
+            delta_non_memberships.max(axis=-1)
         )
     elif similarity_type == HUNG_YANG_3_SIMILARITY_5:
         num = np.absolute(A.membership_values - B.membership_values) + \
             np.absolute(A.non_membership_values - B.non_membership_values)
         denom = np.absolute(A.membership_values + B.membership_values) + \
             np.absolute(A.non_membership_values + B.non_membership_values)
-        D1 = np.sum(num)
-        D2 = np.sum(denom)
-        return 1 - (D1 / float(D2))
+        D1 = np.sum(num, axis=-1)
+        D2 = np.sum(denom, axis=-1)
+        return 1 - (D1 / D2)
     elif similarity_type == HUNG_YANG_3_SIMILARITY_6:
-        num = 1 - np.exp(-0.5 * sum(np.absolute(A.membership_values - B.membership_values) +
-                         np.absolute(A.non_membership_values - B.non_membership_values)))
+        num = 1 - np.exp(-0.5 * np.sum(np.absolute(A.membership_values - B.membership_values) +
+                         np.absolute(A.non_membership_values - B.non_membership_values), axis=-1))
         denum = 1 - np.exp(-n)
         return 1 - num / denum
     elif similarity_type == HUNG_YANG_3_SIMILARITY_7:
         num = 1 - np.exp(
-            -0.5 * np.sum(np.absolute(np.sqrt(A.membership_values) - np.sqrt(B.membership_values)) + np.absolute(np.sqrt(A.non_membership_values) - np.sqrt(B.non_membership_values))))
+            -0.5 * np.sum(np.absolute(np.sqrt(A.membership_values) - np.sqrt(B.membership_values)) + np.absolute(np.sqrt(A.non_membership_values) - np.sqrt(B.non_membership_values)), axis=-1))
         denum = 1 - np.exp(-n)
         return 1 - num / denum
     else:
@@ -627,8 +645,8 @@ def chen_1(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterab
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
         
@@ -637,22 +655,27 @@ def chen_1(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterab
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_weights(weights, len(A))
 
     if weights is None:
         weights = np.ones(len(A)) / len(A)
 
-    sA = A.membership_values + A.non_membership_values - 1
-    sB = B.membership_values + B.non_membership_values - 1
+    sA = _set_term(A, _chen_1_s)
+    sB = _set_term(B, _chen_1_s)
     
     return np.sum(
         weights * (
             1.0 - np.absolute((sA - sB) / 2.0)
-        )
+        ),
+        axis=-1
     ) / np.sum(weights)
 
 
+def _chen_1_s(S: IntuitionisticFuzzySet) -> np.ndarray:
+    return S.membership_values + S.non_membership_values - 1
+
+
 def hung_yang_4(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_type: str = HUNG_YANG_4_SIMILARITY_1, p: int = 1):
     """ Similarity proposed by W.L. Hung and M.S. Yang, from the related article: 
     "Similarity measures of intuitionistic fuzzy sets based on Lp metric"
@@ -661,8 +684,8 @@ def hung_yang_4(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : str, optional
         Type of computed similarity:
 
@@ -678,11 +701,11 @@ def hung_yang_4(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     
     D = np.sum(np.power((np.absolute(np.power(A.membership_values - B.membership_values, p)) +
-               np.power(np.absolute(A.non_membership_values - B.non_membership_values), p)), (1.0 / p)))
+               np.power(np.absolute(A.non_membership_values - B.non_membership_values), p)), (1.0 / p)), axis=-1)
 
     D = D / float(len(A))
     f1 = 2 ** (1.0 / float(p))
@@ -692,7 +715,7 @@ def hung_yang_4(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity
     elif similarity_type == HUNG_YANG_4_SIMILARITY_2:
         return (np.exp(-D) - np.exp(-f1)) / float(1 - np.exp(-f1))
     elif similarity_type == HUNG_YANG_4_SIMILARITY_3:
-        return (f1 - D) / float(f1 * (1.0 + D))
+        return (f1 - D) / (f1 * (1.0 + D))
     else:
         raise ValueError(
             "similarity_type parameter must be HUNG_YANG_4_SIMILARITY_1, HUNG_YANG_4_SIMILARITY_2 or HUNG_YANG_4_SIMILARITY_3.")
@@ -706,8 +729,8 @@ def hong_kim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iter
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
     a, b, c: int
@@ -718,7 +741,7 @@ def hong_kim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iter
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_weights(weights, len(A))
     n = len(A)
     
@@ -731,7 +754,8 @@ def hong_kim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iter
             1 - (
                 np.abs(A.membership_values - B.membership_values) +
                 np.abs(A.non_membership_values - B.non_membership_values)
-            ) / 2.0
+            ) / 2.0,
+            axis=-1
         )
         return D / float(n)
     else:
@@ -746,7 +770,7 @@ def hong_kim(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iter
                              A.non_membership_values))
         )
 
-        D = np.sum(weights * (1 - num / denom))
+        D = np.sum(weights * (1 - num / denom), axis=-1)
 
         return D
 
@@ -759,8 +783,8 @@ def chen_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterab
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
     a, b, c: int
@@ -771,7 +795,7 @@ def chen_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterab
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_weights(weights, len(A))
 
     if not (a >= c >= 0 >= b):
@@ -784,7 +808,7 @@ def chen_2(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterab
     denom = a - b
     num = (a * (A.membership_values - B.membership_values)) + (b * (A.non_membership_values - B.non_membership_values)
                                                                ) - (c * (A.membership_values - B.membership_values + A.non_membership_values - B.non_membership_values))
-    D = np.sum(weights * (1 - np.absolute(num) / float(denom)))
+    D = np.sum(weights * (1 - np.absolute(num) / float(denom)), axis=-1)
     D = np.array(D)
 
     return D / float(np.sum(weights))
@@ -798,8 +822,8 @@ def liu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int = 1, weight
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     p : int
         Positive integer >= 1.
     weights : list of floats
@@ -812,19 +836,19 @@ def liu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, p: int = 1, weight
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_p(p)
     check_weights(weights, len(A), sum_1=True)
     n = len(A)
 
     if weights is None:
         D = np.sum((np.power(np.absolute(A.membership_values - B.membership_values), p)) + (np.power(np.absolute(A.non_membership_values - B.non_membership_values), p)) + (
-            np.power(np.absolute(A.hesitation_degrees - B.hesitation_degrees), p)))
+            np.power(np.absolute(A.hesitation_degrees - B.hesitation_degrees), p)), axis=-1)
         return 1 - (D / float(2.0 * n)) ** (1.0 / p)
     else:
         prts = (a * np.power(np.absolute(A.membership_values - B.membership_values), p)) + (b * np.power(np.absolute(A.non_membership_values - B.non_membership_values), p)) + (
             c * np.power(np.absolute(A.hesitation_degrees - B.hesitation_degrees), p))
-        D = np.sum(weights * prts)
+        D = np.sum(weights * prts, axis=-1)
         return 1 - D ** (1.0 / p)
 
 
@@ -836,8 +860,8 @@ def iancu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_type:
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : int, optional
         Type of computed similarity:
 
@@ -854,203 +878,151 @@ def iancu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_type:
     -------
     numpy.float64
         The similarity between the two sets provided.
+
+    See also
+    --------
+    fsmpy.similarities.iancu_all
     """
-    check_sets_cardinality(A, B)
-    def tOperator(a: Iterable, b: Iterable, lamda: float):
-        if lamda == np.inf:
-            return np.maximum(0, a + b - 1)
-        elif lamda == 0:
-            return np.minimum(a, b)
-        elif lamda == 1:
-            return a * b
-        else:
-            return np.log(1.0 + (
-                (
-                    (np.power(lamda, 1 - a) - 1.0) * (np.power(lamda, 1.0 - b) - 1.0)
-                ) / (lamda - 1.0)
-            ))
+    return iancu_all(A, B, similarity_types=[similarity_type], lamda=lamda)[similarity_type]
+
+
+def iancu_all(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_types: Iterable[int] = None, lamda: int = 0) -> dict:
+    """ Calculates several of the similarities proposed by I. Iancu in a single pass.
+
+    All similarities are expressed through the sums of the membership and non-membership values
+    and the sums of the Frank t-norms between them, so these are calculated once and shared 
+    by every requested similarity type.
+
+    Parameters
+    ----------
+    A : IntuitionisticFuzzySet
+        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
+    similarity_types : Iterable[int], optional
+        Types of computed similarities. If None, all 20 types are calculated.
+
+        >>> IANCU_SIMILARITY_1 IANCU_SIMILARITY_2 ..., IANCU_SIMILARITY_20
     
-    delta_A = A.membership_values - A.non_membership_values
-    delta_B = B.membership_values - B.non_membership_values
+    lambda: float
+        Frank family of t-operator parameter. Different cases of input:
+        0, 1, Inf and other.
+        
+    Returns
+    -------
+    dict
+        The similarity between the two sets provided for each similarity type.
+
+    Examples
+    --------
+    >>> iancu_all(A, B, [IANCU_SIMILARITY_5, IANCU_SIMILARITY_7], lamda=1)
+    {5: 0.933..., 7: 0.875...}
+    """
+    A, B = check_sets_cardinality(A, B)
+    if similarity_types is None:
+        similarity_types = _IANCU_SIMILARITIES
+    for similarity_type in similarity_types:
+        if similarity_type not in _IANCU_SIMILARITIES:
+            raise ValueError(
+                "similarity_type parameter must be IANCU_SIMILARITY_1, IANCU_SIMILARITY_2, IANCU_SIMILARITY_3, ..., or IANCU_SIMILARITY_20.")
+
     n = len(A)
-    if similarity_type == IANCU_SIMILARITY_1:  # S11
-        return (
-            (n + np.minimum(np.sum(delta_A), np.sum(delta_B))) /
-            (n + np.maximum(np.sum(delta_A), np.sum(delta_B)))
-        )
-    elif similarity_type == IANCU_SIMILARITY_2:  # S11c
-        nominator = n - np.maximum(np.sum(delta_A), np.sum(delta_B))
-        denom = n - np.minimum(np.sum(delta_A), np.sum(delta_B))
-        return nominator / np.array(denom).astype("float")
-    elif similarity_type == IANCU_SIMILARITY_3:  # S19
-        nominator = n + np.minimum(np.sum(delta_A),
-                                   np.sum(delta_B))
-        return nominator / (2.0 * n)
-    elif similarity_type == IANCU_SIMILARITY_4:  # S19c
-        nominator = n - np.maximum(np.sum(delta_A),
-                                   np.sum(delta_B))
-        return nominator / (2.0 * n)
-    elif similarity_type == IANCU_SIMILARITY_5:  # S1
-        return (
-            (
-                n + np.sum(
-                        tOperator(A.membership_values, B.membership_values, lamda) +
-                        tOperator(A.non_membership_values, B.non_membership_values, lamda) -
-                        A.non_membership_values - B.non_membership_values
-                    )
-             ) / 
-             (
-                 n + np.maximum(np.sum(delta_A), np.sum(delta_B))
-             )
+    sum_mA = np.sum(A.membership_values, axis=-1)
+    sum_mB = np.sum(B.membership_values, axis=-1)
+    sum_vA = np.sum(A.non_membership_values, axis=-1)
+    sum_vB = np.sum(B.non_membership_values, axis=-1)
+    sum_all = sum_mA + sum_mB + sum_vA + sum_vB
+
+    # sums of membership minus non-membership values
+    min_delta = np.minimum(sum_mA - sum_vA, sum_mB - sum_vB)
+    max_delta = np.maximum(sum_mA - sum_vA, sum_mB - sum_vB)
+
+    min_cross = np.minimum(sum_mA + sum_vB, sum_mB + sum_vA)
+    max_cross = np.maximum(sum_mA + sum_vB, sum_mB + sum_vA)
+
+    # sums of t-norms between the memberships and between the non-memberships of A and B
+    if any(IANCU_SIMILARITY_5 <= similarity_type <= IANCU_SIMILARITY_16 for similarity_type in similarity_types):
+        t = np.sum(
+            _frank_t_norm(A.membership_values, B.membership_values, lamda) +
+            _frank_t_norm(A.non_membership_values, B.non_membership_values, lamda),
+            axis=-1
         )
-    elif similarity_type == IANCU_SIMILARITY_6:  # S1c
-        nom = n + np.sum(tOperator(A.membership_values, B.membership_values, lamda) + tOperator(
-            A.non_membership_values, B.non_membership_values, lamda) - A.membership_values - B.membership_values)
-        denom = n - np.minimum(np.sum(delta_A),
-                               np.sum(delta_B))
-        return nom / np.array(denom).astype("float")
-    elif similarity_type == IANCU_SIMILARITY_7:  # S5
-        nom = n + np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda) - 
-            A.non_membership_values - B.non_membership_values
+    # sums of t-norms between the memberships and the non-memberships of the other set
+    if any(similarity_type >= IANCU_SIMILARITY_17 for similarity_type in similarity_types):
+        t_cross = np.sum(
+            _frank_t_norm(A.membership_values, B.non_membership_values, lamda) +
+            _frank_t_norm(B.membership_values, A.non_membership_values, lamda),
+            axis=-1
         )
-        denom = n + np.sum(
-            A.membership_values + 
-            B.membership_values - 
-            tOperator(A.membership_values, B.membership_values, lamda) - 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda)
-        )
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_8:  # S5c
-        nom = n + np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda) - 
-            A.membership_values - 
-            B.membership_values
-        )
-        denom = n + np.sum(
-            A.non_membership_values + 
-            B.non_membership_values - 
-            tOperator(A.membership_values, B.membership_values, lamda) - 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda)
-        )
-        return nom / np.sum(denom)
-    elif similarity_type == IANCU_SIMILARITY_9:  # S14
-        nom = n + np.minimum(
-            np.sum(delta_A),
-            np.sum(delta_B)
-        )
-        denom = n + np.sum(
-            A.membership_values + 
-            B.membership_values - 
-            tOperator(A.membership_values, B.membership_values, lamda) - 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda)
-        )
-        return nom / float(denom)
-    elif similarity_type == IANCU_SIMILARITY_10:  # S14c
-        nom = n - np.maximum(
-            np.sum(delta_A),
-            np.sum(delta_B)
-        )
-        denom = n + np.sum(
-            A.non_membership_values + 
-            B.non_membership_values - 
-            tOperator(A.membership_values, B.membership_values, lamda) - 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda)
-        )
-        return nom / float(denom)
-    elif similarity_type == IANCU_SIMILARITY_11:  # S18
-        nom = n + np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda) - 
-            A.non_membership_values - 
-            B.non_membership_values
-        )
-        return nom / (2.0 * n)
-    elif similarity_type == IANCU_SIMILARITY_12:  # S18c
-        nom = n - np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda) - 
-            A.membership_values - 
-            B.membership_values
-        )
-        return nom / (2.0 * n)
-    elif similarity_type == IANCU_SIMILARITY_13:  # S2
-        nom = 2.0 * n + np.sum(
-            2.0 * 
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            2.0 * 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda) - 
-            A.membership_values - 
-            B.membership_values - 
-            A.non_membership_values - 
-            B.non_membership_values
-        )
-        denom = (
-            2.0 * n + 
-            np.sum(
-                tOperator(A.membership_values, B.membership_values, lamda) + 
-                tOperator(A.non_membership_values, B.non_membership_values, lamda)
-            ) - 
-            np.minimum(
-                np.sum(
-                    A.membership_values + 
-                    B.non_membership_values
-                ), 
-                np.sum(
-                    B.membership_values + 
-                    A.non_membership_values
-                )
-            )
-        )
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_14:  # S6
-        nom = 2.0 * n + np.sum(
-            2.0 * tOperator(A.membership_values, B.membership_values, lamda) + 2.0 * tOperator(A.non_membership_values, B.non_membership_values, lamda) - A.membership_values - B.membership_values - A.non_membership_values - B.non_membership_values)
-        denom = 2.0 * n
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_15:  # S13
-        nom = np.minimum(np.sum(A.membership_values + B.non_membership_values), np.sum(B.membership_values + A.non_membership_values)) - np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + tOperator(A.non_membership_values, B.non_membership_values, lamda))
-        denom = np.sum(A.membership_values + B.membership_values + A.non_membership_values + B.non_membership_values - 2.0 * tOperator(
-            A.membership_values, B.membership_values, lamda) - 2 * tOperator(A.non_membership_values, B.non_membership_values, lamda))
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_16:  # S15
-        nom = 2.0 * n + np.sum(
-            tOperator(A.membership_values, B.membership_values, lamda) + 
-            tOperator(A.non_membership_values, B.non_membership_values, lamda)
-        ) - np.maximum(
-                np.sum(A.membership_values + B.non_membership_values),
-                np.sum(B.membership_values + A.non_membership_values)
-            )
-        denom = 2.0 * n
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_17:  # S2"
-        nom = np.sum(A.membership_values + B.membership_values + A.non_membership_values + B.non_membership_values - 2.0 * tOperator(
-            A.membership_values, B.non_membership_values, lamda) - 2.0 * tOperator(B.membership_values, A.non_membership_values, lamda))
-        denom = n - np.sum(tOperator(A.membership_values, B.non_membership_values, lamda) + tOperator(B.membership_values, A.non_membership_values, lamda)) + np.maximum(np.sum(A.membership_values + B.non_membership_values),
-                                                                                                                                                                         np.sum(B.membership_values + A.non_membership_values))
-        return nom / denom.astype(float)
-    elif similarity_type == IANCU_SIMILARITY_18:  # S6"
-        nom = np.sum(A.membership_values + B.membership_values + A.non_membership_values + B.non_membership_values - 2.0 * tOperator(
-            A.membership_values, B.non_membership_values, lamda) - 2.0 * tOperator(B.membership_values, A.non_membership_values, lamda))
-        denom = 2.0 * n
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_19:  # S13"
-        nom = n + np.sum(tOperator(A.membership_values, B.non_membership_values, lamda) + tOperator(B.membership_values, A.non_membership_values, lamda)) - np.maximum(np.sum(A.membership_values + B.non_membership_values),
-                                                                                                                                                                       np.sum(B.membership_values + A.non_membership_values))
-        denom = 2.0 * n + np.sum(
-            2.0 * tOperator(A.membership_values, B.non_membership_values, lamda) + 2.0 * tOperator(B.membership_values, A.non_membership_values, lamda) - A.membership_values - B.membership_values - A.non_membership_values - B.non_membership_values)
-        return nom / denom
-    elif similarity_type == IANCU_SIMILARITY_20:  # S15"
-        nom = n + np.minimum(np.sum(A.membership_values + B.non_membership_values), np.sum(B.membership_values + A.non_membership_values)) - np.sum(
-            tOperator(A.membership_values, B.non_membership_values, lamda) + tOperator(B.membership_values, A.non_membership_values, lamda))
-        denom = 2.0 * n
-        return nom / denom
+
+    similarities = {}
+    for similarity_type in similarity_types:
+        if similarity_type == IANCU_SIMILARITY_1:  # S11
+            similarity = (n + min_delta) / (n + max_delta)
+        elif similarity_type == IANCU_SIMILARITY_2:  # S11c
+            similarity = (n - max_delta) / np.array(n - min_delta).astype("float")
+        elif similarity_type == IANCU_SIMILARITY_3:  # S19
+            similarity = (n + min_delta) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_4:  # S19c
+            similarity = (n - max_delta) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_5:  # S1
+            similarity = (n + t - sum_vA - sum_vB) / (n + max_delta)
+        elif similarity_type == IANCU_SIMILARITY_6:  # S1c
+            similarity = (n + t - sum_mA - sum_mB) / np.array(n - min_delta).astype("float")
+        elif similarity_type == IANCU_SIMILARITY_7:  # S5
+            similarity = (n + t - sum_vA - sum_vB) / (n + sum_mA + sum_mB - t)
+        elif similarity_type == IANCU_SIMILARITY_8:  # S5c
+            similarity = (n + t - sum_mA - sum_mB) / (n + sum_vA + sum_vB - t)
+        elif similarity_type == IANCU_SIMILARITY_9:  # S14
+            similarity = (n + min_delta) / (n + sum_mA + sum_mB - t)
+        elif similarity_type == IANCU_SIMILARITY_10:  # S14c
+            similarity = (n - max_delta) / (n + sum_vA + sum_vB - t)
+        elif similarity_type == IANCU_SIMILARITY_11:  # S18
+            similarity = (n + t - sum_vA - sum_vB) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_12:  # S18c
+            similarity = (n - (t - sum_mA - sum_mB)) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_13:  # S2
+            similarity = (2.0 * n + 2.0 * t - sum_all) / (2.0 * n + t - min_cross)
+        elif similarity_type == IANCU_SIMILARITY_14:  # S6
+            similarity = (2.0 * n + 2.0 * t - sum_all) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_15:  # S13
+            similarity = (min_cross - t) / (sum_all - 2.0 * t)
+        elif similarity_type == IANCU_SIMILARITY_16:  # S15
+            similarity = (2.0 * n + t - max_cross) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_17:  # S2"
+            similarity = (sum_all - 2.0 * t_cross) / np.array(n - t_cross + max_cross).astype(float)
+        elif similarity_type == IANCU_SIMILARITY_18:  # S6"
+            similarity = (sum_all - 2.0 * t_cross) / (2.0 * n)
+        elif similarity_type == IANCU_SIMILARITY_19:  # S13"
+            similarity = (n + t_cross - max_cross) / (2.0 * n + 2.0 * t_cross - sum_all)
+        elif similarity_type == IANCU_SIMILARITY_20:  # S15"
+            similarity = (n + min_cross - t_cross) / (2.0 * n)
+        similarities[similarity_type] = similarity
+    return similarities
+
+
+_IANCU_SIMILARITIES = (
+    IANCU_SIMILARITY_1, IANCU_SIMILARITY_2, IANCU_SIMILARITY_3, IANCU_SIMILARITY_4, IANCU_SIMILARITY_5,
+    IANCU_SIMILARITY_6, IANCU_SIMILARITY_7, IANCU_SIMILARITY_8, IANCU_SIMILARITY_9, IANCU_SIMILARITY_10,
+    IANCU_SIMILARITY_11, IANCU_SIMILARITY_12, IANCU_SIMILARITY_13, IANCU_SIMILARITY_14, IANCU_SIMILARITY_15,
+    IANCU_SIMILARITY_16, IANCU_SIMILARITY_17, IANCU_SIMILARITY_18, IANCU_SIMILARITY_19, IANCU_SIMILARITY_20
+)
+
+
+def _frank_t_norm(a: Iterable, b: Iterable, lamda: float):
+    """ Frank family of t-operators, used in iancu. """
+    if lamda == np.inf:
+        return np.maximum(0, a + b - 1)
+    elif lamda == 0:
+        return np.minimum(a, b)
+    elif lamda == 1:
+        return a * b
     else:
-        raise ValueError(
-            "similarity_type parameter must be IANCU_SIMILARITY_1, IANCU_SIMILARITY_2, IANCU_SIMILARITY_3, ..., or IANCU_SIMILARITY_20.")
+        return np.log(1.0 + (
+            (
+                (np.power(lamda, 1 - a) - 1.0) * (np.power(lamda, 1.0 - b) - 1.0)
+            ) / (lamda - 1.0)
+        ))
 
 
 def song_wang_lei_xue(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights: Iterable = None):
@@ -1061,8 +1033,8 @@ def song_wang_lei_xue(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weig
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
         
@@ -1071,17 +1043,17 @@ def song_wang_lei_xue(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weig
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     n = len(A)
 
     if weights is None:
         ff = (1.0 / (2.0 * n)) * np.sum(
-            np.sqrt(A.membership_values * B.membership_values) + (2 * np.sqrt(A.non_membership_values * B.non_membership_values)) + np.sqrt(A.hesitation_degrees * B.hesitation_degrees) + np.sqrt((1 - A.non_membership_values) * (1 - B.non_membership_values)))
+            np.sqrt(A.membership_values * B.membership_values) + (2 * np.sqrt(A.non_membership_values * B.non_membership_values)) + np.sqrt(A.hesitation_degrees * B.hesitation_degrees) + np.sqrt((1 - A.non_membership_values) * (1 - B.non_membership_values)), axis=-1)
         return ff
     else:
         check_weights(weights, len(A))
         return 1.0 / 2.0 * np.sum(
-            weights * (np.sqrt(A.membership_values * B.membership_values) + 2.0 * np.sqrt(A.non_membership_values * B.non_membership_values) + np.sqrt(A.hesitation_degrees * B.hesitation_degrees) + np.sqrt((1 - A.non_membership_values) * (1 - B.non_membership_values))))
+            weights * (np.sqrt(A.membership_values * B.membership_values) + 2.0 * np.sqrt(A.non_membership_values * B.non_membership_values) + np.sqrt(A.hesitation_degrees * B.hesitation_degrees) + np.sqrt((1 - A.non_membership_values) * (1 - B.non_membership_values))), axis=-1)
 
 
 def intarapaiboon(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
@@ -1092,15 +1064,15 @@ def intarapaiboon(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     C = IntuitionisticFuzzySet(
         np.maximum(A.membership_values, B.membership_values),
         np.maximum(A.non_membership_values, B.non_membership_values),
@@ -1123,8 +1095,8 @@ def deng_jiang_fu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similari
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     similarity_type : int, optional
         Type of computed similarity:
 
@@ -1157,159 +1129,169 @@ def deng_jiang_fu(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similari
     -------
     numpy.float64
         The similarity between the two sets provided.
+
+    See also
+    --------
+    fsmpy.similarities.deng_jiang_fu_all
     """
-    check_sets_cardinality(A, B)
-    check_p(p, similarity_type, measure_types_required=[DENG_JIANG_FU_MONOTONIC_TYPE_1_3, DENG_JIANG_FU_MONOTONIC_TYPE_2_3, DENG_JIANG_FU_MONOTONIC_TYPE_3_1, DENG_JIANG_FU_MONOTONIC_TYPE_3_2, DENG_JIANG_FU_MONOTONIC_TYPE_3_3])
+    return deng_jiang_fu_all(A, B, similarity_types=[similarity_type], p=p, u=u, v=v)[similarity_type]
+
+
+def deng_jiang_fu_all(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, similarity_types: Iterable[int] = None,
+                      p: Union[int, Iterable[int]] = None, u: float = None, v: float = None) -> dict:
+    """ Calculates several of the similarities proposed by G. Deng, Y. Jiang, J. Fu in a single pass.
+
+    The absolute differences of the membership and non-membership values, their powers and 
+    the element-wise minimums and maximums are calculated once and shared by every requested 
+    similarity type.
+
+    Parameters
+    ----------
+    A : IntuitionisticFuzzySet
+        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
+    similarity_types : Iterable[int], optional
+        Types of computed similarities. If None, all 11 types are calculated, except the
+        types that require p if p is not provided, and DENG_JIANG_FU_MONOTONIC_TYPE_3_2
+        if u and v are not provided.
+
+        >>> DENG_JIANG_FU_MONOTONIC_TYPE_1_1 ..., DENG_JIANG_FU_MONOTONIC_TYPE_3_3
+    p: int or Iterable[int]
+        must be >= 1. Used only in 
+        
+        >>> DENG_JIANG_FU_MONOTONIC_TYPE_1_3 DENG_JIANG_FU_MONOTONIC_TYPE_2_3 DENG_JIANG_FU_MONOTONIC_TYPE_3_1 DENG_JIANG_FU_MONOTONIC_TYPE_3_2 DENG_JIANG_FU_MONOTONIC_TYPE_3_3
 
-    if p is not None and similarity_type not in [DENG_JIANG_FU_MONOTONIC_TYPE_1_3, DENG_JIANG_FU_MONOTONIC_TYPE_2_3, DENG_JIANG_FU_MONOTONIC_TYPE_3_1, DENG_JIANG_FU_MONOTONIC_TYPE_3_2, DENG_JIANG_FU_MONOTONIC_TYPE_3_3]:
+        If an Iterable is provided, the similarities of these types have an additional leading
+        axis, holding the similarity for each value of p.
+    u: float
+        Must be positive. Used only in 
+        
+        >>> DENG_JIANG_FU_MONOTONIC_TYPE_3_2
+    v: float
+        Must be positive. Used only in
+        
+        >>> DENG_JIANG_FU_MONOTONIC_TYPE_3_2
+        
+    Returns
+    -------
+    dict
+        The similarity between the two sets provided for each similarity type.
+
+    Examples
+    --------
+    >>> deng_jiang_fu_all(A, B, p=[1, 2, 3])[DENG_JIANG_FU_MONOTONIC_TYPE_2_3]
+    array([0.789..., 0.752..., 0.726...])
+    """
+    A, B = check_sets_cardinality(A, B)
+    if similarity_types is None:
+        similarity_types = _DENG_JIANG_FU_SIMILARITIES
+        if p is None:
+            similarity_types = [similarity_type for similarity_type in similarity_types
+                                if similarity_type not in _DENG_JIANG_FU_P_SIMILARITIES]
+        if u is None or v is None:
+            similarity_types = [similarity_type for similarity_type in similarity_types
+                                if similarity_type != DENG_JIANG_FU_MONOTONIC_TYPE_3_2]
+    for similarity_type in similarity_types:
+        if similarity_type not in _DENG_JIANG_FU_SIMILARITIES:
+            raise ValueError("similarity_type parameter must be DENG_JIANG_FU_MONOTONIC_TYPE_1_1...4, DENG_JIANG_FU_MONOTONIC_TYPE_2_1...4 or DENG_JIANG_FU_MONOTONIC_TYPE_3_1...3.")
+    if DENG_JIANG_FU_MONOTONIC_TYPE_3_2 in similarity_types and (u is None or v is None):
+        raise ValueError("Parameters u and v are required for DENG_JIANG_FU_MONOTONIC_TYPE_3_2.")
+
+    uses_p = any(similarity_type in _DENG_JIANG_FU_P_SIMILARITIES for similarity_type in similarity_types)
+    if uses_p:
+        for p_value in (p if isinstance(p, Iterable) else [p]):
+            check_p(p_value, DENG_JIANG_FU_MONOTONIC_TYPE_1_3, measure_types_required=_DENG_JIANG_FU_P_SIMILARITIES)
+    elif p is not None:
         warnings.warn("Ignoring parameter p (not used in provided similarity_type).")
-    if u is not None and similarity_type != DENG_JIANG_FU_MONOTONIC_TYPE_3_2:
-        warnings.warn("Ignoring parameter u (not used in provided similarity_type).")
-    if v is not None and similarity_type != DENG_JIANG_FU_MONOTONIC_TYPE_3_2:
-        warnings.warn("Ignoring parameter v (not used in provided similarity_type).")
-    
-    if similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_1:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        min_memberships = np.minimum(A.membership_values, B.membership_values)
-        min_non_memberships = np.minimum(A.non_membership_values, B.non_membership_values)
-        max_memberships = np.maximum(A.membership_values, B.membership_values)
-        max_non_memberships = np.maximum(A.non_membership_values, B.non_membership_values)
-        return 1.0 / n * np.sum(
-            (min_memberships + min_non_memberships) / 
-            (max_memberships + max_non_memberships + 
-            delta_memberships + delta_non_memberships)
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_2:
-        n = len(A)
-        min_memberships = np.minimum(A.membership_values, B.membership_values)
-        min_non_memberships = np.minimum(A.non_membership_values, B.non_membership_values)
-        max_memberships = np.maximum(A.membership_values, B.membership_values)
-        max_non_memberships = np.maximum(A.non_membership_values, B.non_membership_values)
-        return (
-            np.sum(
-                (min_memberships + min_non_memberships) /
-                (2.0 * (max_memberships + max_non_memberships))
-            ) /
-            (
-                n - np.sum(
-                    (min_memberships + min_non_memberships) / 
-                    (2.0 * (max_memberships + max_non_memberships)))
-            )
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_3:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        max_memberships = np.maximum(A.membership_values, B.membership_values)
-        max_non_memberships = np.maximum(A.non_membership_values, B.non_membership_values)
-        return 1 - np.power(
-            np.sum(
-                np.power(
-                    (delta_memberships + delta_non_memberships) /
-                    (max_memberships + max_non_memberships), p
-                )
-            ) / n, 1.0 / p
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_4:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        max_memberships = np.maximum(A.membership_values, B.membership_values)
-        max_non_memberships = np.maximum(A.non_membership_values, B.non_membership_values)
-        return (
-            (n - np.sum(
-                (delta_memberships + delta_non_memberships) /
-                (max_memberships + max_non_memberships)
-            )) / 
-            (n + np.sum(
-                (delta_memberships + delta_non_memberships) /
-                (max_memberships + max_non_memberships)
-            ))
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_1:
-        n = len(A)
-        return (1.0 / n) * np.sum(
-            (1.0 - np.abs(A.non_membership_values - B.non_membership_values)) /
-            (1.0 + np.abs(A.membership_values - B.membership_values))
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_2:
-        return (
-            np.sum(1.0 - np.abs(A.non_membership_values - B.non_membership_values)) /
-            np.sum(1.0 + np.abs(A.membership_values - B.membership_values))
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_3:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        return 1.0 - np.power(
-            np.sum(np.power(
-                (delta_memberships + delta_non_memberships) / 2.0, p
-            )) / n, 1.0 / p
+    if DENG_JIANG_FU_MONOTONIC_TYPE_3_2 not in similarity_types:
+        if u is not None:
+            warnings.warn("Ignoring parameter u (not used in provided similarity_type).")
+        if v is not None:
+            warnings.warn("Ignoring parameter v (not used in provided similarity_type).")
+
+    n = len(A)
+    delta_memberships = np.abs(A.membership_values - B.membership_values)
+    delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
+    delta = delta_memberships + delta_non_memberships
+    if any(similarity_type <= DENG_JIANG_FU_MONOTONIC_TYPE_1_4 for similarity_type in similarity_types):
+        min_values = (
+            np.minimum(A.membership_values, B.membership_values) + 
+            np.minimum(A.non_membership_values, B.non_membership_values)
         )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_4:
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        return (
-            np.sum(2.0 - delta_memberships - delta_non_memberships) / 
-            np.sum(2.0 + delta_memberships + delta_non_memberships)
+        max_values = (
+            np.maximum(A.membership_values, B.membership_values) + 
+            np.maximum(A.non_membership_values, B.non_membership_values)
         )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_1:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        return (
-            (
+        delta_ratio = delta / max_values
+
+    if uses_p:
+        if isinstance(p, Iterable):
+            # leading axis of p values, broadcast against the element axis of the deltas
+            p = np.asarray(p).reshape((-1,) + (1,) * delta.ndim)
+            p_sum = p[..., 0]
+        else:
+            p_sum = p
+        if any(similarity_type >= DENG_JIANG_FU_MONOTONIC_TYPE_3_1 for similarity_type in similarity_types):
+            memberships_p_mean = np.sum(np.power(delta_memberships, p), axis=-1) / n
+            non_memberships_p_mean = np.sum(np.power(delta_non_memberships, p), axis=-1) / n
+
+    similarities = {}
+    for similarity_type in similarity_types:
+        if similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_1:
+            similarity = 1.0 / n * np.sum(min_values / (max_values + delta), axis=-1)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_2:
+            ratio_sum = np.sum(min_values / (2.0 * max_values), axis=-1)
+            similarity = ratio_sum / (n - ratio_sum)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_3:
+            similarity = 1 - np.power(np.sum(np.power(delta_ratio, p), axis=-1) / n, 1.0 / p_sum)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_1_4:
+            ratio_sum = np.sum(delta_ratio, axis=-1)
+            similarity = (n - ratio_sum) / (n + ratio_sum)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_1:
+            similarity = (1.0 / n) * np.sum((1.0 - delta_non_memberships) / (1.0 + delta_memberships), axis=-1)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_2:
+            similarity = (
+                np.sum(1.0 - delta_non_memberships, axis=-1) /
+                np.sum(1.0 + delta_memberships, axis=-1)
+            )
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_3:
+            similarity = 1.0 - np.power(np.sum(np.power(delta / 2.0, p), axis=-1) / n, 1.0 / p_sum)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_2_4:
+            similarity = np.sum(2.0 - delta, axis=-1) / np.sum(2.0 + delta, axis=-1)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_1:
+            similarity = (
                 np.e ** 2.0 - 
-                np.power(
-                    np.sum(
-                        np.power(delta_memberships, p)
-                    ) / n, 
-                    1.0 / p
-                ) -
-                np.power(
-                    np.sum(
-                        np.power(delta_non_memberships, p)
-                    ) / n, 
-                    1.0 / p
-                ) -
+                np.power(memberships_p_mean, 1.0 / p_sum) -
+                np.power(non_memberships_p_mean, 1.0 / p_sum) -
                 1.0
-            ) /
-            (np.e ** 2.0 - 1.0)
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_2:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        return 1.0 - (
-            (
-                np.power(
-                    np.power(
-                        np.sum(np.power(delta_memberships, p)) / n, p
-                    ), u
-                ) + 
-                np.power(
-                    np.power(
-                        np.sum(np.power(delta_non_memberships, p)) / n, p
-                    ), v
-                )
+            ) / (np.e ** 2.0 - 1.0)
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_2:
+            similarity = 1.0 - (
+                np.power(np.power(memberships_p_mean, p_sum), u) + 
+                np.power(np.power(non_memberships_p_mean, p_sum), v)
             ) / 2.0
-        )
-    elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_3:
-        n = len(A)
-        delta_memberships = np.abs(A.membership_values - B.membership_values)
-        delta_non_memberships = np.abs(A.non_membership_values - B.non_membership_values)
-        return 1.0 - (
-            np.sin(np.pi / 2.0 * np.power(
-                np.sum(np.power(delta_memberships, p)) / n, 1.0 / p
-            )) + 
-            np.sin(np.pi / 2.0 * np.power(
-                np.sum(np.power(delta_non_memberships, p)) / n, 1.0 / p
-            )) 
-        ) / 2.0
-    else:
-        raise ValueError("similarity_type parameter must be DENG_JIANG_FU_MONOTONIC_TYPE_1_1...4, DENG_JIANG_FU_MONOTONIC_TYPE_2_1...4 or DENG_JIANG_FU_MONOTONIC_TYPE_3_1...3.")
+        elif similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_3:
+            similarity = 1.0 - (
+                np.sin(np.pi / 2.0 * np.power(memberships_p_mean, 1.0 / p_sum)) + 
+                np.sin(np.pi / 2.0 * np.power(non_memberships_p_mean, 1.0 / p_sum)) 
+            ) / 2.0
+        similarities[similarity_type] = similarity
+    return similarities
+
+
+_DENG_JIANG_FU_SIMILARITIES = (
+    DENG_JIANG_FU_MONOTONIC_TYPE_1_1, DENG_JIANG_FU_MONOTONIC_TYPE_1_2, DENG_JIANG_FU_MONOTONIC_TYPE_1_3,
+    DENG_JIANG_FU_MONOTONIC_TYPE_1_4, DENG_JIANG_FU_MONOTONIC_TYPE_2_1, DENG_JIANG_FU_MONOTONIC_TYPE_2_2,
+    DENG_JIANG_FU_MONOTONIC_TYPE_2_3, DENG_JIANG_FU_MONOTONIC_TYPE_2_4, DENG_JIANG_FU_MONOTONIC_TYPE_3_1,
+    DENG_JIANG_FU_MONOTONIC_TYPE_3_2, DENG_JIANG_FU_MONOTONIC_TYPE_3_3
+)
+
+# types that require the parameter p
+_DENG_JIANG_FU_P_SIMILARITIES = (
+    DENG_JIANG_FU_MONOTONIC_TYPE_1_3, DENG_JIANG_FU_MONOTONIC_TYPE_2_3, DENG_JIANG_FU_MONOTONIC_TYPE_3_1,
+    DENG_JIANG_FU_MONOTONIC_TYPE_3_2, DENG_JIANG_FU_MONOTONIC_TYPE_3_3
+)
 
 
 def nguyen(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
@@ -1320,39 +1302,41 @@ def nguyen(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet):
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
         
     Returns
     -------
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
+
+    kFA = _set_term(A, _nguyen_membership_knowledge)
+    kFB = _set_term(B, _nguyen_membership_knowledge)
+    _kFA = _set_term(A, _nguyen_negative_membership_knowledge)
+    _kFB = _set_term(B, _nguyen_negative_membership_knowledge)
+    return np.where(_kFA * _kFB >= 0, 1.0 - np.abs(kFA - kFB), np.abs(kFA - kFB) - 1.0)[()]
 
-    def membership_knowledge(f_set: IntuitionisticFuzzySet):
-        K = np.sqrt(
-            f_set.membership_values ** 2.0 + 
-            f_set.non_membership_values ** 2.0 + 
-            (1.0 - f_set.hesitation_degrees) ** 2.0
-        )
-        return 1.0 / (len(f_set) * np.sqrt(2.0)) * np.sum(K)
 
-    def negative_membership_knowledge(f_set: IntuitionisticFuzzySet):
-        mask = (f_set.membership_values >= f_set.non_membership_values) * 1.0
-        mask[mask == 0] = -1
-        K = 1.0 / (len(f_set) * np.sqrt(2.0)) * np.sqrt(
-            f_set.membership_values ** 2.0 + 
-            f_set.non_membership_values ** 2.0 + 
-            (1.0 - f_set.hesitation_degrees) ** 2.0
-        ) * mask
-        return np.sum(K) / len(f_set)
+def _nguyen_membership_knowledge(f_set: IntuitionisticFuzzySet) -> np.ndarray:
+    K = np.sqrt(
+        f_set.membership_values ** 2.0 + 
+        f_set.non_membership_values ** 2.0 + 
+        (1.0 - f_set.hesitation_degrees) ** 2.0
+    )
+    return 1.0 / (len(f_set) * np.sqrt(2.0)) * np.sum(K, axis=-1)
 
-    kFA = membership_knowledge(A)
-    kFB = membership_knowledge(B)
-    _kFA = negative_membership_knowledge(A)
-    _kFB = negative_membership_knowledge(B)
-    return 1.0 - np.abs(kFA - kFB) if _kFA * _kFB >= 0 else np.abs(kFA - kFB) - 1.0
+
+def _nguyen_negative_membership_knowledge(f_set: IntuitionisticFuzzySet) -> np.ndarray:
+    mask = (f_set.membership_values >= f_set.non_membership_values) * 1.0
+    mask[mask == 0] = -1
+    K = 1.0 / (len(f_set) * np.sqrt(2.0)) * np.sqrt(
+        f_set.membership_values ** 2.0 + 
+        f_set.non_membership_values ** 2.0 + 
+        (1.0 - f_set.hesitation_degrees) ** 2.0
+    ) * mask
+    return np.sum(K, axis=-1) / len(f_set)
 
 
 def chen_cheng_lan(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights=None):
@@ -1363,8 +1347,8 @@ def chen_cheng_lan(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
         
@@ -1373,7 +1357,7 @@ def chen_cheng_lan(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
     check_weights(weights, len(A))
 
     if weights is None:
@@ -1389,7 +1373,8 @@ def chen_cheng_lan(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, weights
             (1.0 - add_hesitations / 2.0) -
             np.abs(2.0 * delta_non_memberships - delta_memberships) / 3.0 * 
             (add_hesitations / 2.0)
-        )
+        ),
+        axis=-1
     )
 
 
@@ -1401,8 +1386,8 @@ def muthukumar_krishnanb(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, w
     ----------
     A : IntuitionisticFuzzySet
         A fuzzy set.
-    B : IntuitionisticFuzzySet
-        A fuzzy set.
+    B : IntuitionisticFuzzySet or IFSBatch
+        A fuzzy set, or a batch of sets in which case one value is returned for each set of the batch.
     weights : list of floats
         List of weights for each membership/non-membership value.
         
@@ -1411,24 +1396,16 @@ def muthukumar_krishnanb(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, w
     numpy.float64
         The similarity between the two sets provided.
     """
-    check_sets_cardinality(A, B)
+    A, B = check_sets_cardinality(A, B)
 
     if weights is None:
         return (
             np.sum(
                 A.membership_values * B.membership_values + 
-                A.non_membership_values * B.non_membership_values
+                A.non_membership_values * B.non_membership_values,
+                axis=-1
             ) / 
-            np.sum(
-                np.maximum(
-                    np.power(A.membership_values, 2.0), 
-                    np.power(B.membership_values, 2.0)
-                ) + 
-                np.maximum(
-                    np.power(A.non_membership_values, 2.0), 
-                    np.power(B.non_membership_values, 2.0)
-                )
-            )
+            _muthukumar_krishnanb_denominator(A, B)
         )
     else:
         check_weights(weights, len(A))
@@ -1436,10 +1413,16 @@ def muthukumar_krishnanb(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet, w
             np.sum(
                 weights * 
                 (A.membership_values * B.membership_values + 
-                A.non_membership_values * B.non_membership_values)
+                A.non_membership_values * B.non_membership_values),
+                axis=-1
             ) / 
-            np.sum(
-                np.maximum(np.power(A.membership_values, 2.0), np.power(B.membership_values, 2.0)) + 
-                np.maximum(np.power(A.non_membership_values, 2.0), np.power(B.non_membership_values, 2.0))
-            )
+            _muthukumar_krishnanb_denominator(A, B)
         ) / np.sum(weights)
+
+
+def _muthukumar_krishnanb_denominator(A: IntuitionisticFuzzySet, B: IntuitionisticFuzzySet) -> np.ndarray:
+    return np.sum(
+        np.maximum(np.power(A.membership_values, 2.0), np.power(B.membership_values, 2.0)) + 
+        np.maximum(np.power(A.non_membership_values, 2.0), np.power(B.non_membership_values, 2.0)),
+        axis=-1
+    )
@@ -1,8 +1,10 @@
-from numpy.testing import assert_almost_equal
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_equal
+import pytest
 
 from fsmpy.sets import IntuitionisticFuzzySet
 from fsmpy.datasets import load_patients_diagnoses
-from fsmpy.similarities import deng_jiang_fu
+from fsmpy.similarities import deng_jiang_fu, deng_jiang_fu_all
 from fsmpy import DENG_JIANG_FU_MONOTONIC_TYPE_1_1, DENG_JIANG_FU_MONOTONIC_TYPE_1_2, \
     DENG_JIANG_FU_MONOTONIC_TYPE_1_3, DENG_JIANG_FU_MONOTONIC_TYPE_1_4, DENG_JIANG_FU_MONOTONIC_TYPE_2_1, \
     DENG_JIANG_FU_MONOTONIC_TYPE_2_2, DENG_JIANG_FU_MONOTONIC_TYPE_2_3, DENG_JIANG_FU_MONOTONIC_TYPE_2_4, \
@@ -565,3 +567,32 @@ def test_deng_jiang_fu_3_3():
                         0.451, decimal=3)
     assert_almost_equal(deng_jiang_fu(ted, chest_problem, similarity_type=DENG_JIANG_FU_MONOTONIC_TYPE_3_3, p=1), 0.351,
                         decimal=3)
+
+
+def test_deng_jiang_fu_all():
+    A = IntuitionisticFuzzySet([1.0, 0.8, 0.7], [0.0, 0.0, 0.1])
+    B = IntuitionisticFuzzySet([0.5, 0.6, 0.8], [0.3, 0.2, 0.1])
+
+    similarities = deng_jiang_fu_all(A, B, p=[1, 2, 3], u=0.5, v=0.5)
+    assert_equal(len(similarities), 11)
+    for similarity_type, similarity in similarities.items():
+        if np.ndim(similarity) == 1:
+            for i, p in enumerate([1, 2, 3]):
+                params = {"u": 0.5, "v": 0.5} if similarity_type == DENG_JIANG_FU_MONOTONIC_TYPE_3_2 else {}
+                assert_almost_equal(similarity[i], deng_jiang_fu(A, B, similarity_type, p=p, **params))
+        else:
+            assert_almost_equal(similarity, deng_jiang_fu(A, B, similarity_type))
+
+    # types requiring p are skipped if p is not provided
+    assert DENG_JIANG_FU_MONOTONIC_TYPE_1_3 not in deng_jiang_fu_all(A, B)
+    # and DENG_JIANG_FU_MONOTONIC_TYPE_3_2 if u and v are not provided
+    similarities = deng_jiang_fu_all(A, B, p=2)
+    assert_equal(len(similarities), 10)
+    assert DENG_JIANG_FU_MONOTONIC_TYPE_3_2 not in similarities
+    assert_almost_equal(similarities[DENG_JIANG_FU_MONOTONIC_TYPE_3_3], deng_jiang_fu(A, B, DENG_JIANG_FU_MONOTONIC_TYPE_3_3, p=2))
+    with pytest.raises(ValueError):
+        deng_jiang_fu_all(A, B, [DENG_JIANG_FU_MONOTONIC_TYPE_3_2], p=2)
+    with pytest.raises(ValueError):
+        deng_jiang_fu_all(A, B, [DENG_JIANG_FU_MONOTONIC_TYPE_2_3], p=[1, 0])
+    with pytest.raises(ValueError):
+        deng_jiang_fu_all(A, B, [12])
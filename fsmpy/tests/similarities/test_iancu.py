@@ -1,7 +1,9 @@
+import numpy as np
 from numpy.testing import assert_almost_equal
+import pytest
 
 from fsmpy.sets import IntuitionisticFuzzySet
-from fsmpy.similarities import iancu
+from fsmpy.similarities import iancu, iancu_all
 from fsmpy import IANCU_SIMILARITY_1, IANCU_SIMILARITY_2, IANCU_SIMILARITY_3, IANCU_SIMILARITY_4, \
     IANCU_SIMILARITY_5, IANCU_SIMILARITY_6, IANCU_SIMILARITY_7, IANCU_SIMILARITY_8, IANCU_SIMILARITY_9, \
     IANCU_SIMILARITY_10, IANCU_SIMILARITY_11, IANCU_SIMILARITY_12, IANCU_SIMILARITY_13, IANCU_SIMILARITY_14,\
@@ -206,3 +208,18 @@ def test_iancu_16():
     assert_almost_equal(iancu(A1, B, similarity_type=IANCU_SIMILARITY_16), 0.933, decimal=3)
     assert_almost_equal(iancu(A2, B, similarity_type=IANCU_SIMILARITY_16), 0.917, decimal=3)
     
+
+
+def test_iancu_all():
+    A = IntuitionisticFuzzySet([0.3, 0.2, 0.1], [0.3, 0.2, 0.1])
+    B = IntuitionisticFuzzySet([0.3, 0.3, 0.1], [0.3, 0.3, 0.3])
+    for lamda in [0, 1, np.inf, 2]:
+        similarities = iancu_all(A, B, lamda=lamda)
+        assert sorted(similarities) == list(range(IANCU_SIMILARITY_1, IANCU_SIMILARITY_20 + 1))
+        for similarity_type, similarity in similarities.items():
+            assert_almost_equal(similarity, iancu(A, B, similarity_type=similarity_type, lamda=lamda))
+
+    similarities = iancu_all(A, B, [IANCU_SIMILARITY_7, IANCU_SIMILARITY_17], lamda=1)
+    assert sorted(similarities) == [IANCU_SIMILARITY_7, IANCU_SIMILARITY_17]
+    with pytest.raises(ValueError):
+        iancu_all(A, B, [IANCU_SIMILARITY_1, 21])
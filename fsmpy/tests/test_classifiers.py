@@ -53,3 +53,171 @@ def test_fuzzy_classifier():
         IntuitionisticFuzzySet([0.58, 0.39, 0.39], [0.32, 0.51, 0.51])
     ])
     assert_almost_equal(y_proba, [[0.96, 0.91]], decimal=2) # fails
+
+
+def test_classify():
+    from fsmpy.utils import classify
+    from fsmpy.distances import wang_xin
+    from fsmpy.datasets import load_patients_diagnoses
+
+    diagnoses, patients = load_patients_diagnoses()
+    for patient in patients:
+        expected = np.argmin([wang_xin(patient, diagnosis) for diagnosis in diagnoses])
+        assert_equal(classify(diagnoses, patient, wang_xin), expected)
+
+    # callables outside fsmpy are called for each class pattern
+    prediction, confidence = classify(diagnoses, patients[0], lambda A, B: wang_xin(A, B), return_confidence=True)
+    measures = np.array([wang_xin(patients[0], diagnosis) for diagnosis in diagnoses])
+    assert_equal(prediction, np.argmin(measures))
+    assert_almost_equal(confidence, np.sum(np.abs(measures.min() - measures)))
+
+
+def test_fuzzy_classifier_chunks(monkeypatch):
+    from fsmpy.utils import classifiers
+    from fsmpy.sets import IFSBatch
+    from fsmpy.distances import wang_xin
+
+    rng = np.random.default_rng(0)
+    m = rng.uniform(0.05, 0.9, (50, 8))
+    X = IFSBatch(m, rng.uniform(0.05, 1.0, (50, 8)) * (0.95 - m))
+    y = rng.choice(["a", "b", "c"], 50)
+
+    cls = FuzzyTextClassifier(wang_xin).fit(X, y)
+    assert_equal(cls.prototypes_.values.shape, (3, 3, 8))
+    expected = np.array([[wang_xin(x, cls.class_patterns[c]) for c in cls.classes_] for x in X])
+
+    # several chunks of samples
+    monkeypatch.setattr(classifiers, "_CHUNK_MEASURES", 20)
+    assert_almost_equal(cls.predict_proba(X), expected)
+    assert_equal(cls.predict(X), cls.classes_[np.argmin(expected, axis=1)])
+    assert_equal(cls.predict(list(X)), cls.predict(X))
+
+    cls = FuzzyTextClassifier(lambda A, B: -wang_xin(A, B), is_distance=False).fit(X, y)
+    assert_equal(cls.predict(X), cls.classes_[np.argmin(expected, axis=1)])
+
+
+def test_fuzzy_classifier_fit():
+    rng = np.random.default_rng(1)
+    values = rng.uniform(0.0, 0.5, (3, 30, 4))
+    y = rng.choice([3, 1, 2], 30)
+
+    cls = FuzzyTextClassifier(intarapaiboon, is_distance=False).fit(values, y)
+    for _class in [1, 2, 3]:
+        assert_almost_equal(cls.class_patterns[_class].membership_values, values[0, y == _class].mean(axis=0))
+        assert_almost_equal(cls.class_patterns[_class].hesitation_degrees, values[2, y == _class].mean(axis=0))
+    assert_equal(cls.predict(values), FuzzyTextClassifier(intarapaiboon, is_distance=False).fit(
+        [IntuitionisticFuzzySet(*values[:, i]) for i in range(30)], y).predict(values))
+
+
+def test_fuzzy_classifier_partial_fit():
+    import pytest
+
+    rng = np.random.default_rng(2)
+    values = rng.uniform(0.0, 0.5, (3, 40, 4))
+    y = rng.choice(["a", "b", "c"], 40)
+    y[:10] = "a"
+
+    expected = FuzzyTextClassifier(intarapaiboon, is_distance=False).fit(values, y)
+    cls = FuzzyTextClassifier(intarapaiboon, is_distance=False)
+    for i in range(0, 40, 10):
+        cls.partial_fit(values[:, i:i + 10], y[i:i + 10])
+        assert_equal(cls.classes_, np.unique(y[:i + 10]))
+    assert_equal(cls.classes_, expected.classes_)
+    assert_equal(cls.class_count_, [np.sum(y == c) for c in ["a", "b", "c"]])
+    assert_almost_equal(cls.prototypes_.values, expected.prototypes_.values)
+    assert_equal(cls.predict(values), expected.predict(values))
+
+    cls = FuzzyTextClassifier(intarapaiboon, is_distance=False).partial_fit(values[:, :10], y[:10], classes=["a", "b"])
+    with pytest.raises(ValueError):
+        cls.partial_fit(values[:, 10:], y[10:])
+    with pytest.raises(ValueError):
+        cls.partial_fit(values[:, :10, :3], y[:10])
+
+
+def test_n_jobs():
+    from fsmpy.utils import classify
+    from fsmpy.distances import wang_xin
+    from fsmpy.datasets import load_patients_diagnoses
+
+    rng = np.random.default_rng(3)
+    values = rng.uniform(0.0, 0.5, (3, 30, 4))
+    y = rng.choice([1, 2, 3], 30)
+
+    cls = FuzzyTextClassifier(wang_xin).fit(values, y)
+    expected_proba = cls.predict_proba(values)
+    expected = cls.predict(values)
+    cls.set_params(n_jobs=2)
+    assert_equal(cls.get_params()["n_jobs"], 2)
+    assert_almost_equal(cls.predict_proba(values), expected_proba)
+    assert_equal(cls.predict(values), expected)
+
+    diagnoses, patients = load_patients_diagnoses()
+    for patient in patients:
+        assert_equal(classify(diagnoses, patient, wang_xin, n_jobs=2), classify(diagnoses, patient, wang_xin))
+
+
+def test_n_jobs_memmap(monkeypatch):
+    from joblib import parallel_config
+    from fsmpy.distances import wang_xin
+    from fsmpy.utils import classifiers
+
+    rng = np.random.default_rng(5)
+    values = rng.uniform(0.0, 0.5, (3, 30, 4))
+    cls = FuzzyTextClassifier(wang_xin, n_jobs=2).fit(values, rng.choice([1, 2, 3], 30))
+    expected = cls.set_params(n_jobs=None).predict_proba(values)
+
+    # every chunk receives the class patterns mapped from a single file
+    received = []
+    measure_chunk = classifiers._measure_chunk
+
+    def recording_measure_chunk(chunk, prototypes, *args):
+        received.append(prototypes)
+        return measure_chunk(chunk, prototypes, *args)
+
+    monkeypatch.setattr(classifiers, "_CHUNK_MEASURES", 12)
+    monkeypatch.setattr(classifiers, "_measure_chunk", recording_measure_chunk)
+    with parallel_config(backend="threading"):
+        assert_almost_equal(cls.set_params(n_jobs=2).predict_proba(values), expected)
+    assert len(received) > 2
+    assert all(isinstance(prototypes, np.memmap) and prototypes.filename == received[0].filename for prototypes in received)
+    assert_almost_equal(received[0], cls.prototypes_.values)
+
+
+def test_predict_iter():
+    from fsmpy.distances import wang_xin
+
+    rng = np.random.default_rng(4)
+    values = rng.uniform(0.0, 0.5, (3, 25, 4))
+    y = rng.choice(["a", "b"], 25)
+    cls = FuzzyTextClassifier(wang_xin).fit(values, y)
+    expected = cls.predict(values)
+
+    sets = [IntuitionisticFuzzySet(*values[:, i]) for i in range(25)]
+    predictions = cls.predict_iter((s for s in sets), batch_size=4)
+    assert not isinstance(predictions, (list, np.ndarray))
+    assert_equal(list(predictions), expected)
+    assert_equal(list(cls.predict_iter(values, batch_size=7)), expected)
+    assert_equal(cls.predict(s for s in sets), expected)
+    assert_almost_equal(cls.predict_proba(s for s in sets), cls.predict_proba(values))
+    assert_equal(cls.predict(iter([])).shape, (0,))
+
+
+def test_fuzzy_classifier_sparse(monkeypatch):
+    from scipy.sparse import csr_matrix
+    from fsmpy.utils import classifiers
+    from fsmpy.distances import wang_xin
+
+    rng = np.random.default_rng(5)
+    X = rng.poisson(0.5, (30, 10))
+    y = rng.choice([1, 2, 3], 30)
+    sets, _, _ = calculate_documents_membership(X, 0.9, 0.9)
+    sparse_sets, _, _ = calculate_documents_membership(csr_matrix(X), 0.9, 0.9)
+
+    expected = FuzzyTextClassifier(wang_xin).fit(sets, y)
+    cls = FuzzyTextClassifier(wang_xin).fit(sparse_sets, y)
+    assert_almost_equal(cls.prototypes_.values, expected.prototypes_.values)
+
+    monkeypatch.setattr(classifiers, "_CHUNK_VALUES", 25)
+    assert_almost_equal(cls.predict_proba(sparse_sets), expected.predict_proba(sets))
+    assert_equal(cls.predict(sparse_sets), expected.predict(sets))
+    assert_equal(list(cls.predict_iter(sparse_sets, batch_size=7)), expected.predict(sets))
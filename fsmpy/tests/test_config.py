@@ -0,0 +1,100 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+import fsmpy
+from fsmpy._config import _validation_enabled
+from fsmpy.sets import IntuitionisticFuzzySet
+from fsmpy.similarities import ye, liang_shi
+
+
+def test_config():
+    A = IntuitionisticFuzzySet([0.5, 0.8, 0.7], [0.4, 0.0, 0.1])
+    B = IntuitionisticFuzzySet([0.2, 0.3, 0.6], [0.6, 0.5, 0.1])
+    assert fsmpy.get_config()["validate"]
+
+    with pytest.raises(ValueError):
+        liang_shi(A, B, fsmpy.LIANG_SHI_SIMILARITY_3, omegas=[0.5, 0.5, 0.5])
+    with fsmpy.config(validate=False):
+        assert not fsmpy.get_config()["validate"]
+        liang_shi(A, B, fsmpy.LIANG_SHI_SIMILARITY_3, omegas=[0.5, 0.5, 0.5])
+        assert_allclose(ye(A, B), ye(A, B, weights=[1 / 3.] * 3))
+    assert fsmpy.get_config()["validate"]
+
+    fsmpy.set_config(validate=False)
+    try:
+        assert not _validation_enabled()
+        with fsmpy.config(validate=True):
+            assert _validation_enabled()
+            with pytest.raises(ValueError):
+                ye(A, IntuitionisticFuzzySet([0.2], [0.6]))
+        assert not fsmpy.get_config()["validate"]
+        assert not _validation_enabled()
+    finally:
+        fsmpy.set_config(validate=True)
+    assert _validation_enabled()
+
+
+def test_feature_cache():
+    rng = np.random.default_rng(0)
+    m = rng.uniform(0.05, 0.9, (6, 5))
+    X = fsmpy.sets.IFSBatch(m, rng.uniform(0.05, 1.0, (6, 5)) * (0.95 - m))
+    measures = [fsmpy.similarities.ye, fsmpy.similarities.hwang_yang, fsmpy.similarities.nguyen,
+                fsmpy.similarities.dengfeng_chuntian, fsmpy.similarities.chen_1]
+    expected = [[measure(X[0], B) for B in X] for measure in measures]
+
+    cache = fsmpy.FeatureCache(maxsize=8)
+    with fsmpy.config(feature_cache=cache):
+        for measure, values in zip(measures, expected):
+            assert_allclose([measure(X[0], B) for B in X], values)
+            assert_allclose(measure(X[0], X), values)
+    assert cache.hits > 0
+    assert cache.currsize <= 8
+    assert fsmpy.get_config()["feature_cache"] is False
+
+    # the terms of freed sets are not reused
+    cache.clear()
+    with fsmpy.config(feature_cache=cache):
+        for values in [[0.5, 0.2], [0.1, 0.3]]:
+            A = IntuitionisticFuzzySet(np.array(values), np.array([0.1, 0.1]))
+            assert_allclose(ye(A, A), 1.0)
+            assert_allclose(fsmpy.similarities.chen_1(A, IntuitionisticFuzzySet([0.5, 0.2], [0.1, 0.1])),
+                            1.0 if values[0] == 0.5 else 0.875)
+            del A
+
+    # sets sharing their membership and non-membership values but not their hesitation degrees
+    m, v = np.array([0.5, 0.2, 0.4]), np.array([0.1, 0.3, 0.2])
+    B = IntuitionisticFuzzySet([0.3, 0.3, 0.3], [0.2, 0.2, 0.2])
+    sets = [IntuitionisticFuzzySet(m, v), IntuitionisticFuzzySet(m, v, np.zeros(3))]
+    expected = [fsmpy.similarities.nguyen(A, B) for A in sets]
+    assert not np.isclose(expected[0], expected[1])
+    with fsmpy.config(feature_cache=fsmpy.FeatureCache()):
+        assert_allclose([fsmpy.similarities.nguyen(A, B) for A in sets], expected)
+
+    with pytest.raises(ValueError):
+        fsmpy.FeatureCache(maxsize=0)
+
+
+def test_validation_disabled(monkeypatch):
+    from fsmpy.utils._measure_input_validation import check_weights
+
+    A = IntuitionisticFuzzySet([0.5, 0.2, 0.4], [0.1, 0.3, 0.2])
+    B = IntuitionisticFuzzySet([0.3, 0.3, 0.3], [0.2, 0.2, 0.2])
+    weights = [0.2, 0.3, 0.5]
+    for validate in (True, False):
+        with fsmpy.config(validate=validate):
+            assert isinstance(check_weights(weights, 3), np.ndarray)
+
+    # the checks of p, the weights and the omegas are skipped
+    def fail(*args, **kwargs):
+        raise RuntimeError("validated")
+
+    monkeypatch.setattr(np, "isclose", fail)
+    monkeypatch.setattr(np, "issubdtype", fail)
+    with fsmpy.config(validate=False):
+        liang_shi(A, B, fsmpy.LIANG_SHI_SIMILARITY_3, p=2, weights=weights)
+        fsmpy.distances.wang_xin(A, B, fsmpy.WANGXIN_DISTANCE_2, p=2)
+    with pytest.raises(RuntimeError):
+        liang_shi(A, B, fsmpy.LIANG_SHI_SIMILARITY_3, p=2, weights=weights)
+    with pytest.raises(RuntimeError):
+        fsmpy.distances.wang_xin(A, B, fsmpy.WANGXIN_DISTANCE_2, p=2)
@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_equal, assert_almost_equal
+
+from fsmpy import make_measure, WANGXIN_DISTANCE_2
+from fsmpy.utils import threshold
+from fsmpy.distances import wang_xin, atanassov
+from fsmpy.similarities import ye, chen_1, hung_yang_1, chen_cheng_lan, hong_kim
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return np.clip(rng.normal(120, 40, (40, 30)), 0, 255).astype(np.uint8)
+
+
+@pytest.mark.parametrize("measure,is_distance", [
+    (ye, False), (chen_1, False), (hung_yang_1, False), (chen_cheng_lan, False), (wang_xin, True)
+])
+def test_threshold_histogram(image, measure, is_distance):
+    # callables outside fsmpy are calculated over every pixel
+    expected, expected_t = threshold(image, lambda A, B: measure(A, B), is_distance=is_distance)
+    thresholded, t = threshold(image, measure, is_distance=is_distance)
+    assert_equal(t, expected_t)
+    assert_equal(thresholded, expected)
+    assert_equal(np.unique(thresholded), [0, 255])
+    assert_equal(threshold(image, make_measure(measure), is_distance=is_distance)[1], expected_t)
+
+
+def test_threshold_non_decomposable(image):
+    expected_t = threshold(image, lambda A, B: wang_xin(A, B, WANGXIN_DISTANCE_2, p=2))[1]
+    assert_equal(threshold(image, wang_xin, distance_type=WANGXIN_DISTANCE_2, p=2)[1], expected_t)
+
+
+@pytest.mark.parametrize("measure,is_distance", [(hong_kim, False), (atanassov, True)])
+def test_threshold_batched(image, measure, is_distance, monkeypatch):
+    from fsmpy.utils import image_processing
+
+    expected, expected_t = threshold(image, lambda A, B: measure(A, B), is_distance=is_distance)
+    # several chunks of thresholds
+    monkeypatch.setattr(image_processing, "_CHUNK_VALUES", 10 * image.size)
+    thresholded, t = threshold(image, measure, is_distance=is_distance)
+    assert_equal(t, expected_t)
+    assert_equal(thresholded, expected)
+
+
+@pytest.mark.parametrize("measure,is_distance", [(ye, False), (hong_kim, False)])
+def test_threshold_gray_levels(image, measure, is_distance):
+    # the sets of other than 8-bit images are calculated from their distinct values
+    expected, expected_t = threshold(image, measure, is_distance=is_distance)
+    thresholded, t = threshold(image.astype(np.float64), measure, is_distance=is_distance)
+    assert_equal(t, expected_t)
+    assert_equal(thresholded, expected)
+
+
+def test_threshold_tiles(image, tmp_path, monkeypatch):
+    from fsmpy.utils import image_processing
+
+    expected, expected_t = threshold(image, ye, is_distance=False)
+    per_pixel_t = threshold(image, hong_kim, is_distance=False)[1]
+    monkeypatch.setattr(image_processing, "_TILE_PIXELS", 100)
+
+    memmap = np.memmap(tmp_path / "image.raw", dtype=np.uint8, mode="w+", shape=image.shape)
+    memmap[:] = image
+    out = np.memmap(tmp_path / "mask.raw", dtype=np.uint8, mode="w+", shape=image.shape)
+    thresholded, t = threshold(memmap, ye, is_distance=False, out=out)
+    assert thresholded is out
+    assert_equal(t, expected_t)
+    assert_equal(out, expected)
+    assert_equal(threshold(memmap, hong_kim, is_distance=False)[1], per_pixel_t)
+    assert_equal(threshold(image.astype(np.float64), hong_kim, is_distance=False)[1], per_pixel_t)
+    assert_equal(threshold(image.tolist(), ye, is_distance=False)[1], expected_t)
+
+    with pytest.raises(ValueError):
+        threshold(image, ye, out=np.empty((3, 3)))
+
+
+def test_threshold_batch(monkeypatch):
+    from fsmpy.utils import threshold_batch, image_processing
+
+    rng = np.random.default_rng(1)
+    images = np.clip(rng.normal(rng.uniform(60, 180, (7, 1, 1)), 40, (7, 20, 15)), 0, 255).astype(np.uint8)
+    expected = [threshold(image, hong_kim, is_distance=False) for image in images]
+
+    monkeypatch.setattr(image_processing, "_BATCH_IMAGES", 3)
+    for n_jobs in (None, 2):
+        thresholded, t = threshold_batch(images, hong_kim, n_jobs=n_jobs, is_distance=False)
+        assert_equal(t, [expected_t for _, expected_t in expected])
+        assert_equal(thresholded, [mask for mask, _ in expected])
+    assert_equal(threshold_batch((image for image in images), ye, is_distance=False)[1],
+                 [threshold(image, ye, is_distance=False)[1] for image in images])
+    with pytest.raises(ValueError):
+        threshold_batch(iter([]), ye)
+
+
+@pytest.mark.parametrize("measure,is_distance", [(ye, False), (wang_xin, True)])
+def test_multilevel_threshold(measure, is_distance):
+    from itertools import combinations
+    from fsmpy.sets import IFSBatch, IntuitionisticFuzzySet
+    from fsmpy.utils import multilevel_threshold
+
+    rng = np.random.default_rng(2)
+    image = np.concatenate([rng.normal(mean, 15, 300) for mean in (40, 110, 200)]).clip(0, 255).astype(np.uint8).reshape(30, 30) // 8 * 8
+    levels = np.unique(image)
+
+    def objective(thresholds):
+        # mean measure of the pixels, represented by the gray level nearest to the mean of their class
+        pixels = image.ravel().astype(np.float64)
+        classes = np.searchsorted(thresholds, pixels, side="right")
+        references = np.empty_like(pixels)
+        for i in range(len(thresholds) + 1):
+            references[classes == i] = levels[np.argmin(np.abs(levels - pixels[classes == i].mean()))]
+        mx = np.exp(-np.abs(pixels - references) / (levels[-1] - levels[0]))[:, None]
+        measures = measure(IFSBatch(mx, (1.0 - mx) - ((1.0 - mx) / (1.0 + 0.2 * mx))), IntuitionisticFuzzySet(np.ones(1)))
+        return np.mean(measures) * (1 if is_distance else -1)
+
+    classes, thresholds = multilevel_threshold(image, 2, measure, is_distance=is_distance)
+    # the optimum of the exhaustive search, up to ties
+    assert_almost_equal(objective(thresholds), min(objective(t) for t in combinations(levels[1:], 2)))
+    assert_equal(classes, np.searchsorted(thresholds, image, side="right"))
+    assert_equal(multilevel_threshold(image.astype(np.float64), 2, measure, is_distance=is_distance)[1], thresholds)
+    assert_equal(len(multilevel_threshold(image, 4, measure, is_distance=is_distance)[1]), 4)
+
+    # 16-bit images are segmented from their distinct levels, up to _MAX_LEVELS of them
+    wide = image.astype(np.uint16) * 256
+    assert_equal(multilevel_threshold(wide, 2, measure, is_distance=is_distance)[1], thresholds.astype(np.uint16) * 256)
+    wide = rng.integers(0, 2**16, (60, 60), dtype=np.uint16)
+    with pytest.raises(ValueError):
+        multilevel_threshold(wide, 2, measure)
+    assert_equal(len(multilevel_threshold(wide // 64, 2, measure, is_distance=is_distance)[1]), 2)
+
+    with pytest.raises(ValueError):
+        multilevel_threshold(image, 0, measure)
+    with pytest.raises(ValueError):
+        multilevel_threshold(np.array([[1, 2], [2, 1]], dtype=np.uint8), 2, measure)
+
+
+@pytest.mark.parametrize("measure", [ye, hong_kim])
+def test_adaptive_threshold(measure, monkeypatch):
+    from fsmpy.utils import adaptive_threshold, image_processing
+
+    rng = np.random.default_rng(3)
+    lighting = np.linspace(60, 230, 70)[None, :] * np.ones((50, 1))
+    image = (lighting + rng.normal(0, 5, (50, 70)) - 50 * (rng.random((50, 70)) < 0.1)).clip(0, 255).astype(np.uint8)
+    image[:20, :20] = 100
+
+    thresholded, thresholds = adaptive_threshold(image, measure, 20, 1, is_distance=False)
+    assert_equal(thresholds.shape, (3, 4))
+    # the window of a block is the image of the blocks around it
+    assert_equal(thresholds[1, 2], threshold(image[:, 20:], measure, is_distance=False)[1])
+    assert_equal(thresholds[2, 3], threshold(image[20:, 40:], measure, is_distance=False)[1])
+    assert_equal(thresholded[30:, 60:], np.where(image[30:, 60:] >= thresholds[2, 3], 255, 0))
+    # a single block of a single gray level takes the threshold of the whole image
+    assert_equal(adaptive_threshold(image, measure, 20, 0, is_distance=False)[1][0, 0],
+                 threshold(image, measure, is_distance=False)[1])
+
+    monkeypatch.setattr(image_processing, "_TILE_PIXELS", 100)
+    out = np.empty_like(image)
+    assert adaptive_threshold(image, measure, 20, 1, is_distance=False, out=out)[0] is out
+    assert_equal(out, thresholded)
+
+    with pytest.raises(ValueError):
+        adaptive_threshold(image.astype(np.float64), measure)
+    with pytest.raises(ValueError):
+        adaptive_threshold(image, measure, 0)
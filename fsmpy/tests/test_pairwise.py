@@ -0,0 +1,196 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+import pytest
+
+import fsmpy
+from fsmpy import pairwise
+from fsmpy.sets import IFSBatch
+from fsmpy import distances, similarities, misc
+
+
+def _random_batch(rng, n_sets, n_elements):
+    m = rng.uniform(0.05, 0.9, (n_sets, n_elements))
+    v = rng.uniform(0.05, 1.0, (n_sets, n_elements)) * (0.95 - m)
+    return IFSBatch(m, v)
+
+
+def _measure_configurations():
+    weights = np.full(6, 1 / 6.)
+    configurations = [
+        (distances.vlachos_sergiadis, {}),
+        (distances.wang_xin, {"distance_type": fsmpy.WANGXIN_DISTANCE_1}),
+        (distances.wang_xin, {"distance_type": fsmpy.WANGXIN_DISTANCE_1, "weights": weights}),
+        (distances.wang_xin, {"distance_type": fsmpy.WANGXIN_DISTANCE_2, "p": 2}),
+        (similarities.dengfeng_chuntian, {"p": 2}),
+        (similarities.dengfeng_chuntian, {"p": 2, "weights": weights}),
+        (similarities.park_kwun_lim, {"p": 2}),
+        (similarities.park_kwun_lim, {"p": 2, "weights": weights}),
+        (similarities.mitchell, {"p": 2}),
+        (similarities.julian_hung_lin, {"p": 2}),
+        (similarities.ye, {}),
+        (similarities.ye, {"weights": weights}),
+        (similarities.hwang_yang, {}),
+        (similarities.zhang_fu, {}),
+        (similarities.chen_1, {}),
+        (similarities.hong_kim, {}),
+        (similarities.hong_kim, {"weights": weights, "a": 2, "b": -1, "c": 1}),
+        (similarities.chen_2, {"a": 2, "b": -1, "c": 1}),
+        (similarities.liu, {"p": 2}),
+        (similarities.liu, {"p": 2, "weights": weights}),
+        (similarities.song_wang_lei_xue, {}),
+        (similarities.song_wang_lei_xue, {"weights": weights}),
+        (similarities.intarapaiboon, {}),
+        (similarities.nguyen, {}),
+        (similarities.chen_cheng_lan, {}),
+        (similarities.muthukumar_krishnanb, {}),
+        (similarities.muthukumar_krishnanb, {"weights": weights}),
+        (misc.fuzzy_divergence, {}),
+    ]
+    for distance_type in [fsmpy.DISTANCE_HAMMING, fsmpy.DISTANCE_EUCLIDEAN,
+                          fsmpy.DISTANCE_NORMALIZED_HAMMING, fsmpy.DISTANCE_NORMALIZED_EUCLIDEAN]:
+        for measure in [distances.atanassov, distances.szmidt_kacprzyk, distances.yang_chiclana, distances.grzegorzewski]:
+            configurations.append((measure, {"distance_type": distance_type}))
+    for similarity_type in [fsmpy.LIANG_SHI_SIMILARITY_1, fsmpy.LIANG_SHI_SIMILARITY_2, fsmpy.LIANG_SHI_SIMILARITY_3]:
+        configurations.append((similarities.liang_shi, {"similarity_type": similarity_type, "p": 2}))
+    for similarity_type in [fsmpy.HUNG_YANG_1_SIMILARITY_1, fsmpy.HUNG_YANG_1_SIMILARITY_2, fsmpy.HUNG_YANG_1_SIMILARITY_3]:
+        configurations.append((similarities.hung_yang_1, {"similarity_type": similarity_type}))
+        configurations.append((similarities.hung_yang_1, {"similarity_type": similarity_type, "weights": weights}))
+    for similarity_type in [fsmpy.HUNG_YANG_2_SIMILARITY_1, fsmpy.HUNG_YANG_2_SIMILARITY_2, fsmpy.HUNG_YANG_2_SIMILARITY_3]:
+        for a in [1, 2]:
+            configurations.append((similarities.hung_yang_2, {"similarity_type": similarity_type, "a": a}))
+    for similarity_type in [fsmpy.HUNG_YANG_3_SIMILARITY_1, fsmpy.HUNG_YANG_3_SIMILARITY_2, fsmpy.HUNG_YANG_3_SIMILARITY_3,
+                            fsmpy.HUNG_YANG_3_SIMILARITY_4, fsmpy.HUNG_YANG_3_SIMILARITY_5, fsmpy.HUNG_YANG_3_SIMILARITY_6,
+                            fsmpy.HUNG_YANG_3_SIMILARITY_7]:
+        configurations.append((similarities.hung_yang_3, {"similarity_type": similarity_type}))
+    for similarity_type in [fsmpy.HUNG_YANG_4_SIMILARITY_1, fsmpy.HUNG_YANG_4_SIMILARITY_2, fsmpy.HUNG_YANG_4_SIMILARITY_3]:
+        configurations.append((similarities.hung_yang_4, {"similarity_type": similarity_type, "p": 2}))
+    for similarity_type in range(fsmpy.IANCU_SIMILARITY_1, fsmpy.IANCU_SIMILARITY_20 + 1):
+        for lamda in [0, 1, np.inf, 2]:
+            configurations.append((similarities.iancu, {"similarity_type": similarity_type, "lamda": lamda}))
+    for similarity_type in range(fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_1_1, fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_3 + 1):
+        params = {"similarity_type": similarity_type}
+        if similarity_type in [fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_1_3, fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_2_3,
+                               fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_1, fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_2,
+                               fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_3]:
+            params["p"] = 2
+        if similarity_type == fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_2:
+            params.update(u=0.5, v=0.5)
+        configurations.append((similarities.deng_jiang_fu, params))
+    return configurations
+
+
+@pytest.mark.parametrize("measure, params", _measure_configurations())
+def test_pairwise_matches_measure(measure, params):
+    rng = np.random.default_rng(0)
+    X = _random_batch(rng, 5, 6)
+    Y = _random_batch(rng, 4, 6)
+
+    expected = np.array([[measure(A, B, **params) for B in Y] for A in X])
+    assert_allclose(pairwise(X, Y, measure, **params), expected, rtol=1e-10)
+    # tiny tiles
+    assert_allclose(pairwise(X, Y, measure, working_memory=0, **params), expected, rtol=1e-10)
+
+
+def test_pairwise():
+    rng = np.random.default_rng(0)
+    X = _random_batch(rng, 3, 4)
+    Y = list(_random_batch(rng, 2, 4))
+
+    D = pairwise(X, Y, "szmidt_kacprzyk", distance_type=fsmpy.DISTANCE_NORMALIZED_HAMMING)
+    assert_equal(D.shape, (3, 2))
+    assert_allclose(D[1, 0], distances.szmidt_kacprzyk(X[1], Y[0], fsmpy.DISTANCE_NORMALIZED_HAMMING))
+    assert_allclose(pairwise(X, None, "atanassov").diagonal(), 0.0)
+    assert_allclose(pairwise(X, None, "ye"), pairwise(X, X, "ye"))
+
+    # callables outside fsmpy are called once for each pair
+    D = pairwise(X, Y, lambda A, B: np.sum(A.membership_values * B.membership_values))
+    assert_allclose(D, X.membership_values @ IFSBatch.from_sets(Y).membership_values.T)
+
+    with pytest.raises(ValueError):
+        pairwise(X, _random_batch(rng, 2, 3), "atanassov")
+    with pytest.raises(ValueError):
+        pairwise(X, Y, "unknown")
+
+
+def test_pairwise_validation():
+    rng = np.random.default_rng(4)
+    X = _random_batch(rng, 3, 4)
+    # every set is checked before measuring, not only the first pair
+    Y = list(_random_batch(rng, 2, 4)) + [_random_batch(rng, 1, 3)[0]]
+    for measure in ("ye", lambda A, B: similarities.ye(A, B)):
+        with pytest.raises(ValueError):
+            pairwise(X, Y, measure)
+    with pytest.raises(ValueError):
+        pairwise(X, X, lambda A, B: distances.wang_xin(A, B, fsmpy.WANGXIN_DISTANCE_2, p=0))
+
+
+@pytest.mark.parametrize("measure, params", _measure_configurations())
+def test_one_to_many(measure, params):
+    rng = np.random.default_rng(1)
+    A = _random_batch(rng, 1, 6)[0]
+    B = _random_batch(rng, 4, 6)
+
+    expected = [measure(A, b, **params) for b in B]
+    assert_allclose(measure(A, B, **params), expected, rtol=1e-10)
+    assert_allclose(measure(A, list(B), **params), expected, rtol=1e-10)
+
+
+def test_make_measure():
+    rng = np.random.default_rng(2)
+    X = _random_batch(rng, 3, 4)
+    weights = [0.1, 0.2, 0.3, 0.4]
+
+    measure = fsmpy.make_measure("liang_shi", similarity_type=fsmpy.LIANG_SHI_SIMILARITY_3, p=2, weights=weights)
+    expected = similarities.liang_shi(X[0], X[1], fsmpy.LIANG_SHI_SIMILARITY_3, p=2, weights=weights)
+    assert_allclose(measure(X[0], X[1]), expected)
+    assert_allclose(measure(X[0], X[1]), expected)
+    assert_allclose(measure(X[0], X)[1], expected)
+    assert_allclose(pairwise(X, X, measure)[0, 1], expected)
+
+    measure = fsmpy.make_measure(similarities.iancu, similarity_type=fsmpy.IANCU_SIMILARITY_7, lamda=2)
+    assert_allclose(measure(X[2], X[0]), similarities.iancu(X[2], X[0], fsmpy.IANCU_SIMILARITY_7, lamda=2))
+
+    # the parameters are validated when the measure is made
+    with pytest.raises(ValueError):
+        fsmpy.make_measure("wang_xin", distance_type=fsmpy.WANGXIN_DISTANCE_2, p=0)
+    with pytest.raises(ValueError):
+        fsmpy.make_measure("liang_shi", similarity_type=fsmpy.LIANG_SHI_SIMILARITY_3, weights=[0.5, 0.6])
+    with pytest.raises(ValueError):
+        fsmpy.make_measure("deng_jiang_fu", similarity_type=fsmpy.DENG_JIANG_FU_MONOTONIC_TYPE_3_2, p=2)
+    # the cardinality of the sets is checked on every call
+    measure = fsmpy.make_measure("iancu", similarity_type=fsmpy.IANCU_SIMILARITY_7, lamda=2)
+    measure(X[0], X[1])
+    with pytest.raises(ValueError):
+        measure(X[0], _random_batch(rng, 1, 3)[0])
+    with pytest.raises(ValueError):
+        measure(X[0], _random_batch(rng, 2, 5))
+    with pytest.raises(ValueError):
+        fsmpy.make_measure("unknown")
+
+
+def test_make_measure_module_globals(monkeypatch):
+    rng = np.random.default_rng(5)
+    X = _random_batch(rng, 3, 4)
+    measure = fsmpy.make_measure("ye")
+
+    # the plan calls the measure of the module, with its current globals and configuration
+    monkeypatch.setattr(similarities, "_ye_norms", lambda S: np.ones_like(S.membership_values))
+    assert_allclose(measure(X[0], X[1]), similarities.ye(X[0], X[1]))
+    cache = fsmpy.FeatureCache()
+    with fsmpy.config(feature_cache=cache):
+        measure(X[0], X)
+    assert cache.misses > 0
+
+
+@pytest.mark.parametrize("measure", [similarities.ye, similarities.hwang_yang, similarities.muthukumar_krishnanb])
+def test_pairwise_matmul(measure):
+    rng = np.random.default_rng(3)
+    X = _random_batch(rng, 40, 7)
+    Y = _random_batch(rng, 30, 7)
+    expected = np.array([measure(A, Y) for A in X])
+    assert_allclose(pairwise(X, Y, measure), expected, rtol=1e-10)
+    assert_allclose(pairwise(X, Y, fsmpy.make_measure(measure)), expected, rtol=1e-10)
+
+    if measure is not similarities.hwang_yang:
+        with pytest.raises(ValueError):
+            pairwise(X, Y, measure, weights=[0.5] * 6)
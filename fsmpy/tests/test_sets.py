@@ -0,0 +1,43 @@
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_equal
+import pytest
+
+from fsmpy.sets import IntuitionisticFuzzySet, IFSBatch
+
+
+def test_ifs_batch():
+    batch = IFSBatch([[0.5, 0.8, 0.7], [0.1, 0.2, 0.3]], [[0.4, 0.0, 0.1], [0.7, 0.6, 0.5]])
+    assert_equal(len(batch), 2)
+    assert_equal(batch.cardinality, 3)
+    assert_equal(batch.values.shape, (3, 2, 3))
+    assert_almost_equal(batch.hesitation_degrees, [[0.1, 0.2, 0.2], [0.2, 0.2, 0.2]])
+
+    A = batch[1]
+    assert isinstance(A, IntuitionisticFuzzySet)
+    assert_equal(len(A), 3)
+    assert_almost_equal(A.membership_values, [0.1, 0.2, 0.3])
+    # rows are views of the block
+    assert np.shares_memory(A.membership_values, batch.values)
+
+    sub = batch[:1]
+    assert isinstance(sub, IFSBatch)
+    assert np.shares_memory(sub.values, batch.values)
+    assert_equal([len(s) for s in batch], [3, 3])
+
+
+def test_ifs_batch_from_sets():
+    sets = [
+        IntuitionisticFuzzySet([0.5, 0.8], [0.4, 0.0]),
+        IntuitionisticFuzzySet([0.2, 0.3], [0.6, 0.5], [0.1, 0.1])
+    ]
+    batch = IFSBatch.from_sets(sets)
+    assert_almost_equal(batch.non_membership_values, [[0.4, 0.0], [0.6, 0.5]])
+    assert_almost_equal(batch.hesitation_degrees, [[0.1, 0.2], [0.1, 0.1]])
+    assert IFSBatch.from_sets(batch) is batch
+
+    with pytest.raises(ValueError):
+        IFSBatch.from_sets([IntuitionisticFuzzySet([0.5, 0.8]), IntuitionisticFuzzySet([0.5])])
+    with pytest.raises(ValueError):
+        IFSBatch([0.5, 0.8])
+    with pytest.raises(ValueError):
+        IFSBatch.from_array(np.zeros((2, 2, 2)))
@@ -1,7 +1,15 @@
+import numpy as np
 from numpy.testing import assert_almost_equal
+import pytest
+from scipy.sparse import csr_matrix
+from sklearn.pipeline import make_pipeline
 
-from fsmpy.sets import IntuitionisticFuzzySet
-from fsmpy.utils import calculate_documents_membership
+import fsmpy
+from fsmpy.distances import wang_xin
+from fsmpy.sets import IntuitionisticFuzzySet, IFSBatch, SparseIFSBatch, as_batch
+from fsmpy.similarities import ye
+from fsmpy.utils import calculate_documents_membership, documents_statistics, iter_documents_membership
+from fsmpy.utils import IFSTransformer, FuzzyTextClassifier
 
 def test_calculate_documents_membership():
     X = [
@@ -93,4 +101,103 @@ def test_confidence_degree():
     [0.003, 0.012, 0.132, 0.213, 0.876, 0.756, 0.721, 0.732, 0.368, 0.000, 0.423, 0.897])
 
 
-    
\ No newline at end of file
+    
+
+def test_calculate_documents_membership_sparse():
+    rng = np.random.default_rng(0)
+    X = rng.poisson(0.3, (40, 12))
+    X[:, 3] = 0
+    X[:, 4] = 2
+    sets, means, stds = calculate_documents_membership(X, 0.9, 0.8)
+    sparse_sets, sparse_means, sparse_stds = calculate_documents_membership(csr_matrix(X), 0.9, 0.8)
+
+    assert isinstance(sparse_sets, SparseIFSBatch)
+    assert sparse_sets.deltas[0].nnz == np.count_nonzero(X)
+    assert_almost_equal(sparse_means, means)
+    assert_almost_equal(sparse_stds, stds)
+    assert_almost_equal(sparse_sets.to_batch().values, sets.values)
+    assert_almost_equal(sparse_sets[5].non_membership_values, sets[5].non_membership_values)
+    assert_almost_equal(sparse_sets[5:9].to_batch().values, sets.values[:, 5:9])
+
+    # statistics of the training documents
+    sparse_sets, _, _ = calculate_documents_membership(csr_matrix(X[:4]), 0.9, 0.8, means, stds)
+    assert_almost_equal(sparse_sets.to_batch().values, calculate_documents_membership(X[:4], 0.9, 0.8, means, stds)[0].values)
+
+
+def test_iter_documents_membership():
+    rng = np.random.default_rng(1)
+    X = rng.poisson(1.5, (50, 6)) + [0, 0, 0, 0, 0, 1000]
+    sets, means, stds = calculate_documents_membership(X, 0.9, 0.8)
+    chunks = [X[i:i + 7] for i in range(0, 50, 7)]
+
+    for parts in (chunks, [csr_matrix(chunk) for chunk in chunks]):
+        chunk_means, chunk_stds = documents_statistics(iter(parts))
+        assert_almost_equal(chunk_means, means)
+        assert_almost_equal(chunk_stds, stds)
+        batches = [as_batch(chunk_sets) for chunk_sets in iter_documents_membership(parts, 0.9, 0.8)]
+        values = np.concatenate([batch.values for batch in batches], axis=1)
+        assert_almost_equal(values, sets.values)
+
+    assert len(list(iter_documents_membership(iter(chunks), 0.9, 0.8, means, stds))) == len(chunks)
+    with pytest.raises(ValueError):
+        next(iter_documents_membership(iter(chunks), 0.9, 0.8))
+
+
+def test_ifs_transformer():
+    rng = np.random.default_rng(2)
+    X = rng.poisson(1.0, (30, 8))
+    y = rng.choice([1, 2], 30)
+    sets, means, stds = calculate_documents_membership(X, 0.9, 0.8)
+
+    transformer = IFSTransformer(0.9, 0.8).fit(X)
+    assert_almost_equal(transformer.means_, means)
+    assert_almost_equal(transformer.stds_, stds)
+    assert isinstance(transformer.transform(X), IFSBatch)
+    assert_almost_equal(transformer.transform(X).values, sets.values)
+
+    transformer = IFSTransformer(0.9, 0.8, dtype=np.float32)
+    for i in range(0, 30, 8):
+        transformer.partial_fit(csr_matrix(X[i:i + 8]))
+    assert transformer.n_samples_seen_ == 30
+    assert_almost_equal(transformer.stds_, stds)
+    sparse_sets = transformer.transform(csr_matrix(X))
+    assert isinstance(sparse_sets, SparseIFSBatch)
+    assert sparse_sets.baseline.dtype == np.float32
+    assert_almost_equal(sparse_sets.to_batch().values, sets.values, decimal=6)
+    assert sparse_sets.to_batch().values.dtype == np.float32
+    assert sparse_sets.to_batch(np.float64).values.dtype == np.float64
+    assert transformer.transform(X).values.dtype == np.float32
+
+    model = make_pipeline(IFSTransformer(0.9, 0.8), FuzzyTextClassifier(wang_xin)).fit(X, y)
+    assert_almost_equal(model.predict(X), FuzzyTextClassifier(wang_xin).fit(sets, y).predict(sets))
+
+
+def test_calculate_documents_membership_out():
+    rng = np.random.default_rng(3)
+    X = rng.poisson(2.0, (20, 5))
+    X[:, 2] = 3
+    X[0, 4] = 10 ** 6
+    means, stds = X.mean(axis=0), X.std(axis=0, ddof=1)
+    z = np.nan_to_num((X - means) / np.where(stds > 0, stds, np.nan), nan=0)
+    m, v = 0.9 / (1 + np.exp(-z)), 0.8 / (1 + np.exp(z))
+
+    out = np.full((3, 20, 5), np.nan, dtype=np.float32)
+    sets, _, _ = calculate_documents_membership(X, 0.9, 0.8, out=out)
+    assert sets.values is out
+    assert_almost_equal(out, [m, v, 1 - m - v], decimal=6)
+    with pytest.raises(ValueError):
+        calculate_documents_membership(X[:3], 0.9, 0.8, means, stds, out=out)
+
+
+def test_calculate_documents_membership_out_cache():
+    rng = np.random.default_rng(4)
+    chunks = [rng.poisson(2.0, (4, 6)), rng.poisson(2.0, (4, 6))]
+    means, stds = np.mean(np.concatenate(chunks), axis=0), np.std(np.concatenate(chunks), axis=0, ddof=1)
+    expected = [ye(sets[0], sets) for sets in (calculate_documents_membership(chunk, 0.9, 0.8, means, stds)[0] for chunk in chunks)]
+
+    # the terms of the sets of the previous chunk are discarded when out is refilled
+    out = np.empty((3, 4, 6))
+    with fsmpy.config(feature_cache=fsmpy.FeatureCache()):
+        for chunk, values in zip(chunks, expected):
+            sets = calculate_documents_membership(chunk, 0.9, 0.8, means, stds, out=out)[0]
+            assert_almost_equal(ye(sets[0], sets), values)
@@ -1,33 +1,48 @@
 import numpy as np
-from typing import Iterable, Tuple
-from collections.abc import Callable
+from typing import Iterable, Tuple, Union
+from collections.abc import Callable, Iterator
 from tqdm import tqdm
 
-from ..sets import FuzzySet, IntuitionisticFuzzySet
+from ..sets import FuzzySet, IntuitionisticFuzzySet, IFSBatch, SparseIFSBatch
+from .._cache import _discard_array
 from .classifiers import classify, FuzzyTextClassifier
-from .image_processing import threshold
+from .transformers import IFSTransformer
+from .image_processing import threshold, threshold_batch, multilevel_threshold, adaptive_threshold
 
 
 def calculate_documents_membership(data: Iterable, membership_weight: float, non_membership_weight: float, 
-                                   means: Iterable[float] = None, stds: Iterable[float] = None) -> Tuple[list, np.ndarray, np.ndarray]:
+                                   means: Iterable[float] = None, stds: Iterable[float] = None,
+                                   dtype: type = np.float64, out: np.ndarray = None) -> Tuple[Union[IFSBatch, SparseIFSBatch], np.ndarray, np.ndarray]:
     """ Calculates the Fuzzy Set of each class from token counts.
     Proposed by P. Intarapaiboon from the related article: 
     "Text classification using similarity measures on intuitionistic fuzzy sets".
 
     Parameters
     ----------
-    data : Iterable
-        Token counts of a document dataset.
+    data : Iterable or scipy.sparse matrix
+        Token counts of a document dataset. Sparse counts, e.g. from CountVectorizer, are 
+        never densified.
     membership_weight : float
         Weight used to calculate the membership values of each token's membership value.
     non_membership_weight : float
         Weight used to calculate the non-membership values of each token's membership value.
-    
+    means : Iterable[float], optional
+        Mean values for each token, e.g. of the training documents. Calculated from data if not provided.
+    stds : Iterable[float], optional
+        Standard deviation values for each token. Calculated from data if not provided.
+    dtype : data-type, optional
+        Data type of the values of the sets, float32 halves the memory of the sets. Default is float64.
+    out : 3-d np.ndarray, optional
+        Buffer of shape `(3, n_documents, n_tokens)` where the values of the sets are calculated,
+        e.g. reused between chunks of documents. Its data type overrides dtype. Only for dense data.
+        The terms of the previous sets of out are removed from the feature cache of the current
+        configuration, so out must not be reused while another configuration caches its sets.
         
     Returns
     -------
-    list[IntuitionisticFuzzySet]
-        List of IntuitionisticFuzzySets for each class.
+    IFSBatch or SparseIFSBatch
+        Batch of IntuitionisticFuzzySets, one for each document. For sparse data, a SparseIFSBatch
+        whose baseline holds the values of zero counts.
     np.ndarray : means
         Mean values for each token in data.
     np.ndarray : stds
@@ -37,6 +52,11 @@ def calculate_documents_membership(data: Iterable, membership_weight: float, non
     --------
     sklearn.feature_extraction.text.CountVectorizer
     """
+    if _is_sparse(data):
+        if out is not None:
+            raise ValueError("Parameter out is not supported for sparse data.")
+        return _calculate_sparse_documents_membership(data, membership_weight, non_membership_weight, means, stds, dtype)
+
     if means is None and stds is None:
         means = np.mean(data, axis=0, dtype=np.float64)  # mean of each sample
         stds = np.std(data, axis=0, dtype=np.float64, ddof=1)  # std of each sample
@@ -44,20 +64,180 @@ def calculate_documents_membership(data: Iterable, membership_weight: float, non
         if len(means) != len(data[0]) or len(stds) != len(data[0]):
             raise ValueError(f"Parameters means and stds must have the same size as the number of samples in data ({len(means)} and {len(stds)} != {len(data[0])}).")
 
-    # calculate membership values of each word for each document
-    z = (data - means) / stds
-    np.nan_to_num(z, copy=False, nan=0)
+    # calculate membership values of each word for each document, in place in the values of the sets
+    data = np.asarray(data)
+    if out is None:
+        out = np.empty((3,) + data.shape, dtype=dtype)
+    elif out.shape != (3,) + data.shape:
+        raise ValueError("Parameter out must have a shape of {}, got {}.".format((3,) + data.shape, out.shape))
+    else:
+        _discard_array(out)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.subtract(data, means, out=out[0])
+        out[0] /= stds
+    _memberships(out, membership_weight, non_membership_weight)
 
-    m = membership_weight / (1. + np.exp(-z))
-    v = non_membership_weight / (1. + np.exp(z))
-    p = 1 - m - v
-    
-    sets = [
-        IntuitionisticFuzzySet(*args)
-        for args in zip(m, v, p)
-    ]
+    return IFSBatch.from_array(out), means, stds
+
+
+def _calculate_sparse_documents_membership(data, membership_weight: float, non_membership_weight: float,
+                                           means: Iterable[float] = None, stds: Iterable[float] = None,
+                                           dtype: type = np.float64) -> Tuple[SparseIFSBatch, np.ndarray, np.ndarray]:
+    """ calculate_documents_membership for scipy.sparse token counts.
+
+    Only the values of the stored counts are calculated, the values of the zero counts
+    of each token are calculated once, as the baseline of the SparseIFSBatch.
+    """
+    data = data.tocsr()
+    n_documents, n_tokens = data.shape
+    counts = data.data.astype(np.float64)
+    if means is None and stds is None:
+        _, means, deviations = _chunk_statistics(data)
+        stds = np.sqrt(deviations / (n_documents - 1))
+    else:
+        means = np.asarray(means, dtype=np.float64)
+        stds = np.asarray(stds, dtype=np.float64)
+        if len(means) != n_tokens or len(stds) != n_tokens:
+            raise ValueError(f"Parameters means and stds must have the same size as the number of samples in data ({len(means)} and {len(stds)} != {n_tokens}).")
+
+    baseline = np.empty((3, n_tokens))
+    values = np.empty((3, len(counts)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(-means, stds, out=baseline[0])
+        np.divide(counts - means[data.indices], stds[data.indices], out=values[0])
+    _memberships(baseline, membership_weight, non_membership_weight)
+    _memberships(values, membership_weight, non_membership_weight)
+    values -= baseline[:, data.indices]
+
+    from scipy.sparse import csr_matrix
+    deltas = [csr_matrix((delta.astype(dtype, copy=False), data.indices, data.indptr), shape=data.shape) for delta in values]
+    return SparseIFSBatch(baseline.astype(dtype, copy=False), *deltas), means, stds
+
+
+def _memberships(values: np.ndarray, membership_weight: float, non_membership_weight: float) -> None:
+    """ Calculates in place the membership values, non-membership values and hesitation degrees
+    of the standardized counts z held by values[0], with a single exponential:
+    m = w_m / (1 + e), v = w_v / (1 + 1 / e), where e = exp(-z).
+    """
+    m, v, p = values
+    np.nan_to_num(m, copy=False, nan=0)
+    with np.errstate(divide="ignore", over="ignore"):
+        np.negative(m, out=v)
+        np.exp(v, out=v)
+        np.add(v, 1, out=m)
+        np.divide(membership_weight, m, out=m)
+        np.reciprocal(v, out=v)
+        v += 1
+        np.divide(non_membership_weight, v, out=v)
+    np.subtract(1, m, out=p)
+    p -= v
+
+
+def documents_statistics(chunks: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """ Calculates the mean and standard deviation of each token from chunks of token counts, in a single pass.
+
+    The statistics of each chunk are merged with the ones of the previous chunks (Chan et al. parallel
+    variance algorithm), so only one chunk is kept in memory at a time. The results are the same as 
+    the statistics calculated by calculate_documents_membership on all the documents.
+
+    Parameters
+    ----------
+    chunks : Iterable
+        Token counts, dense arrays or scipy.sparse matrices, of consecutive parts of a document dataset.
+
+    Returns
+    -------
+    np.ndarray : means
+        Mean values for each token.
+    np.ndarray : stds
+        Standard deviation values for each token.
+
+    See also
+    --------
+    fsmpy.utils.iter_documents_membership
+    """
+    statistics = None
+    for chunk in chunks:
+        statistics = _merge_statistics(statistics, _chunk_statistics(chunk))
+    if statistics is None:
+        raise ValueError("Cannot calculate the statistics of an empty Iterable.")
+    n_documents, means, deviations = statistics
+    return means, np.sqrt(deviations / (n_documents - 1))
+
+
+def iter_documents_membership(chunks: Iterable, membership_weight: float, non_membership_weight: float,
+                              means: Iterable[float] = None, stds: Iterable[float] = None,
+                              dtype: type = np.float64) -> Iterator[Union[IFSBatch, SparseIFSBatch]]:
+    """ Lazily calculates the sets of chunks of token counts, see calculate_documents_membership.
+
+    Parameters
+    ----------
+    chunks : Iterable
+        Token counts, dense arrays or scipy.sparse matrices, of consecutive parts of a document dataset.
+        If means and stds are not provided, they are calculated with documents_statistics first,
+        so chunks must be iterable twice, e.g. a list or a reader object, not a generator.
+    membership_weight : float
+        Weight used to calculate the membership values of each token's membership value.
+    non_membership_weight : float
+        Weight used to calculate the non-membership values of each token's membership value.
+    means : Iterable[float], optional
+        Mean values for each token.
+    stds : Iterable[float], optional
+        Standard deviation values for each token.
+    dtype : data-type, optional
+        Data type of the values of the sets. Default is float64.
+
+    Yields
+    ------
+    IFSBatch or SparseIFSBatch
+        Batch of IntuitionisticFuzzySets of each chunk, one for each document.
 
-    return sets, means, stds
+    Examples
+    --------
+    >>> means, stds = documents_statistics(read_counts("train"))
+    >>> for sets in iter_documents_membership(read_counts("test"), 0.9, 0.9, means, stds):
+    ...     predictions.extend(classifier.predict(sets))
+    """
+    if means is None and stds is None:
+        if isinstance(chunks, Iterator):
+            raise ValueError("chunks must be iterable twice to calculate the means and stds, or means and stds must be provided.")
+        means, stds = documents_statistics(chunks)
+    for chunk in chunks:
+        yield calculate_documents_membership(chunk, membership_weight, non_membership_weight, means, stds, dtype)[0]
+
+
+def _chunk_statistics(data) -> Tuple[int, np.ndarray, np.ndarray]:
+    """ Number of documents, mean and sum of squared deviations from the mean of each token. """
+    if _is_sparse(data):
+        data = data.tocsr()
+        n_documents, n_tokens = data.shape
+        means = np.asarray(data.sum(axis=0), dtype=np.float64).ravel() / n_documents
+        # squared deviations of the stored counts plus the ones of the zero counts
+        deviations = np.bincount(data.indices, weights=(data.data - means[data.indices]) ** 2, minlength=n_tokens)
+        deviations += (n_documents - np.bincount(data.indices, minlength=n_tokens)) * means ** 2
+        return n_documents, means, deviations
+    data = np.asarray(data)
+    means = np.mean(data, axis=0, dtype=np.float64)
+    return len(data), means, np.sum((data - means) ** 2, axis=0)
+
+
+def _merge_statistics(a: Tuple[int, np.ndarray, np.ndarray], b: Tuple[int, np.ndarray, np.ndarray]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """ Merges the statistics of _chunk_statistics of two parts of a dataset. """
+    if a is None:
+        return b
+    n_a, means_a, deviations_a = a
+    n_b, means_b, deviations_b = b
+    n = n_a + n_b
+    delta = means_b - means_a
+    return n, means_a + delta * (n_b / n), deviations_a + deviations_b + delta ** 2 * (n_a * n_b / n)
+
+
+def _is_sparse(data) -> bool:
+    try:
+        from scipy.sparse import issparse
+    except ImportError:
+        return False
+    return issparse(data)
 
 
 def confidence_degree(predicted_class_distance: float, other_classes_distance: Iterable[float]) -> np.float64:
@@ -184,8 +364,14 @@ def check_similarity_conditions(measure_caller: Callable, **measure_kwargs):
 __all__ = (
     "classify",
     "FuzzyTextClassifier",
+    "IFSTransformer",
     "threshold",
+    "threshold_batch",
+    "multilevel_threshold",
+    "adaptive_threshold",
     "calculate_documents_membership",
+    "documents_statistics",
+    "iter_documents_membership",
     "confidence_degree",
     "compactness",
     "check_similarity_conditions"
@@ -1,7 +1,8 @@
 import numpy as np
-from typing import Union, Iterable
+from typing import Union, Iterable, Tuple
 
-from ..sets import FuzzySet, IntuitionisticFuzzySet
+from .._config import _validation_enabled
+from ..sets import FuzzySet, IntuitionisticFuzzySet, IFSBatch, SparseIFSBatch, as_batch
 
 
 def check_weights(weights: Iterable, set_cardinality: int, actual_measure_type: Union[Iterable, str, int]=None, sum_1=False, measure_types_required=None) -> np.ndarray:
@@ -17,14 +18,16 @@ def check_weights(weights: Iterable, set_cardinality: int, actual_measure_type:
             actual_value: The type of measure that was provided.
             measure_types_required: In case the weights are used for a specific measure type (and all).
         Returns:
-            The converted weights.
+            The weights converted to an np.ndarray, also when the validation is disabled.
         Raises:
             ValueError if weights size != set_cardinality or if weights values are not [0, 1].
     """
     if weights is None:
         return weights
-    
-    weights = np.array(weights)
+    weights = np.asarray(weights)
+    if not _validation_enabled():
+        return weights
+
     if measure_types_required is not None and actual_measure_type in measure_types_required:
         if weights.size != set_cardinality:
             raise ValueError(
@@ -50,6 +53,8 @@ def check_p(p: Union[int, float], actual_measure_type: Union[Iterable, str, int]
         Raises:
             ValueError if p is not an integer or if it is < 1.
     """
+    if not _validation_enabled():
+        return
     if measure_types_required is not None and actual_measure_type in measure_types_required:
         if not np.issubdtype(type(p), int):
             raise ValueError(
@@ -59,15 +64,30 @@ def check_p(p: Union[int, float], actual_measure_type: Union[Iterable, str, int]
                 "p parameter must be >= 1, not {}".format(p))
 
 
-def check_sets_cardinality(A: FuzzySet, B: FuzzySet) -> None:
+def check_sets_cardinality(A: FuzzySet, B: FuzzySet) -> Tuple[FuzzySet, FuzzySet]:
     """ Checks if sets have the same cardinality
 
-        Args:
-            A: FuzzySet.
-            B: FuzzySet.
+    Batches of sets (an IFSBatch or an Iterable of IntuitionisticFuzzySets) are converted to 
+    an IntuitionisticFuzzySet with 2-d values, one row per set, so that the measures are 
+    calculated against every set of the batch in a single pass.
 
+        Args:
+            A: FuzzySet, IFSBatch or Iterable of IntuitionisticFuzzySets.
+            B: FuzzySet, IFSBatch or Iterable of IntuitionisticFuzzySets.
+        Returns:
+            The converted sets.
         Raises:
             ValueError if the two sets have different cardinalities
     """
-    if len(A) != len(B):
+    A = _as_set(A)
+    B = _as_set(B)
+    if _validation_enabled() and len(A) != len(B):
         raise ValueError("A and B sets must be have the same sizes.({} and {})".format(len(A), len(B)))
+    return A, B
+
+
+def _as_set(S) -> FuzzySet:
+    if isinstance(S, (IFSBatch, SparseIFSBatch, list, tuple, np.ndarray)):
+        S = as_batch(S)
+        return IntuitionisticFuzzySet(S.membership_values, S.non_membership_values, S.hesitation_degrees)
+    return S
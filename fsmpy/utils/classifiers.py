@@ -1,24 +1,37 @@
-from collections.abc import Callable
-from typing import Iterable, List
+from collections.abc import Callable, Iterator
+from itertools import islice
+import os
+import tempfile
+from typing import Iterable, List, Union
 import warnings
+import joblib
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator, ClassifierMixin
 from sklearn.utils.multiclass import unique_labels
 import numpy as np
 
-from ..sets import IntuitionisticFuzzySet
+from ..sets import IntuitionisticFuzzySet, IFSBatch, SparseIFSBatch
+
+# number of sample-class measures calculated at once by the classifier
+_CHUNK_MEASURES = 2 ** 20
+# number of samples read at once from iterators
+_BATCH_SIZE = 4096
+# number of values of each densified chunk of a SparseIFSBatch
+_CHUNK_VALUES = 2 ** 22
 
 
 def classify(class_patterns: Iterable[IntuitionisticFuzzySet], sample_pattern: IntuitionisticFuzzySet, 
-            measure_caller: Callable, *, is_distance=True, return_confidence=False, **kwargs) -> np.intp:
+            measure_caller: Callable, *, is_distance=True, return_confidence=False, n_jobs: int = None, **kwargs) -> np.intp:
     """ Simple classification method to classify a sample pattern given class patterns, using the measure provided.
 
     For each class pattern c, calculates the measure from measure_caller between c and sample_pattern.
+    The measures of fsmpy are calculated against all class patterns in a single call.
     The class is chosen by the min/max measure between the sample and class patterns, depending on is_distance.
     If return_confidence is true, returns the degree of confidence for the chosen class.
 
     Parameters
     ----------
-    class_patterns : list[IntuitionisticFuzzySet]
+    class_patterns : list[IntuitionisticFuzzySet] or IFSBatch
         Class patterns to which the sample_pattern is classified.
     sample_pattern : IntuitionisticFuzzySet
         The sample to be classified.
@@ -28,6 +41,11 @@ def classify(class_patterns: Iterable[IntuitionisticFuzzySet], sample_pattern: I
         If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
     return_confidence : bool
         Whether the confidence degree is returned. Can only be calculated if is_distance is True.
+    n_jobs : int, optional
+        Number of joblib workers, each measuring the sample against a shard of the class patterns.
+        None means 1 unless in a `joblib.parallel_config` context, -1 means all the processors.
+        The `fsmpy.config` overrides, e.g. validate or feature_cache, are thread-local and do not reach
+        the worker processes, use `fsmpy.set_config` in them instead.
     **kwargs : additional arguments
         Passed to the measure_caller.
     
@@ -43,14 +61,25 @@ def classify(class_patterns: Iterable[IntuitionisticFuzzySet], sample_pattern: I
     if not is_distance and return_confidence:
         warnings.warn("Degree of Confidence can only be calculated for distances. Returning only prediction.")
         return_confidence = False
-    measures = [
-        measure_caller(sample_pattern, class_pattern, **kwargs) * (1 if is_distance else -1)
-        for class_pattern in class_patterns
-    ]
+    from .._pairwise import _one_to_many
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs > 1:
+        if not isinstance(class_patterns, IFSBatch):
+            class_patterns = list(class_patterns)
+        shards = [
+            class_patterns[indices] if isinstance(class_patterns, IFSBatch) else [class_patterns[i] for i in indices]
+            for indices in np.array_split(np.arange(len(class_patterns)), n_jobs) if len(indices) > 0
+        ]
+        measures = np.concatenate(Parallel(n_jobs=n_jobs)(
+            delayed(_one_to_many)(sample_pattern, shard, measure_caller, **kwargs) for shard in shards
+        ))
+    else:
+        measures = _one_to_many(sample_pattern, class_patterns, measure_caller, **kwargs)
+    measures = measures * (1 if is_distance else -1)
     prediction = np.argmin(measures)
     if return_confidence:
         from . import confidence_degree
-        return prediction, confidence_degree(np.min(measures), measures[:prediction] + measures[prediction:])
+        return prediction, confidence_degree(np.min(measures), np.delete(measures, prediction))
     else:
         return prediction
 
@@ -72,11 +101,20 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
         Passed to the measure_caller.
     is_distance : bool
         If measure_caller is a distance or not.
+    prototypes_ : IFSBatch
+        The class patterns, in the order of classes_. Samples are measured against all of them
+        with `fsmpy.pairwise`, in chunks of samples.
+    class_sums_ : 3-d np.ndarray
+        Sums of the values of the samples of each class, updated by partial_fit.
+    class_count_ : 1-d np.ndarray
+        Number of samples of each class.
 
     Methods
     -------
     fit : FuzzyTextClassifier
         "Trains" the classifier.
+    partial_fit : FuzzyTextClassifier
+        Updates the classifier with more samples.
     predict : list[np.intp]
         List of predicted class for each sample
     predict_proba : list[list[np.float64]]
@@ -91,7 +129,7 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
     sklearn.base.BaseEstimator
     
     """
-    def __init__(self, measure_caller: Callable, *, is_distance: bool = True, **measure_kwargs):
+    def __init__(self, measure_caller: Callable, *, is_distance: bool = True, n_jobs: int = None, **measure_kwargs):
         """ Constructor method.
         
         Parameters
@@ -100,10 +138,17 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
             The measure to be tested.
         is_distance : bool
             If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
+        n_jobs : int, optional
+            Number of joblib workers used by predict and predict_proba, each measuring a chunk of samples.
+            None means 1 unless in a `joblib.parallel_config` context, -1 means all the processors.
+            The class patterns are written once to a memory mapped file, read by every worker instead of
+            being pickled for each chunk. The `fsmpy.config` overrides, e.g. validate or feature_cache,
+            are thread-local and do not reach the worker processes.
         **measure_kwargs : measure arguments
             Passed to the measure_caller.
         """
         self.measure_caller = measure_caller
+        self.n_jobs = n_jobs
 
         self._param_names = ["measure_caller"] + list(measure_kwargs.keys())
         self._measure_kwargs = measure_kwargs
@@ -117,7 +162,7 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
 
         Parameters
         ----------
-        X : Iterable[IntuitionisticFuzzySet]
+        X : Iterable[IntuitionisticFuzzySet], IFSBatch, SparseIFSBatch or 3-d np.ndarray
             Data to train upon.
         y : Iterabale
             Target vector relative to X.
@@ -131,30 +176,74 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
         --------
         fsmpy.utils.calculate_documents_membership
         """
-        if not all(isinstance(x, IntuitionisticFuzzySet) for x in X):
-            raise TypeError(
-                "Expected X to be an Iterable of types IntuitionisticFuzzySet or IntuitionisticFuzzySet, got {}".format(type(X)))
+        self.class_sums_ = None
+        return self.partial_fit(X, y)
 
-        y = np.array(y)
-        X = np.array(X)
-        
-        self.classes_ = unique_labels(y)
+    def partial_fit(self, X: Iterable[IntuitionisticFuzzySet], y: Iterable, classes: Iterable = None) -> object:
+        """ Updates the class patterns with the samples X.
 
-        self.class_patterns = {_class: None for _class in self.classes_}
-        for _class in self.classes_:
-            same_class_docs = y == _class
+        Keeps the sums of the membership values, non-membership values and hesitation degrees
+        and the number of samples of each class, so the class patterns are the averages of 
+        all the samples seen, without keeping the samples in memory.
+
+        Parameters
+        ----------
+        X : Iterable[IntuitionisticFuzzySet], IFSBatch, SparseIFSBatch or 3-d np.ndarray
+            Data to train upon.
+        y : Iterabale
+            Target vector relative to X.
+        classes : Iterable, optional
+            All the classes that can appear in y. Considered only in the first call, if
+            not provided, new classes are added as they appear in y.
             
-            mean_m = np.average(
-                [x.membership_values for x in X[same_class_docs]], axis=0)
-            mean_v = np.average(
-                [x.non_membership_values for x in X[same_class_docs]], axis=0)
-            if hasattr(X[0], "hesitation_degrees"):
-                mean_h = np.average(
-                    [x.hesitation_degrees for x in X[same_class_docs]], axis=0)
-                self.class_patterns[_class] = IntuitionisticFuzzySet(
-                    mean_m, mean_v, mean_h)
-            else:
-                self.class_patterns[_class] = IntuitionisticFuzzySet(mean_m, mean_v)
+        Returns
+        -------
+        self: Object
+            An instance of the estimator.
+        """
+        X = self._check_X(X)
+        y = np.array(y)
+        labels = unique_labels(y)
+
+        if getattr(self, "class_sums_", None) is None:
+            self._all_classes = unique_labels(classes) if classes is not None else labels[:0]
+            self._fixed_classes = classes is not None
+            self.class_sums_ = np.zeros((3, len(self._all_classes), X.cardinality))
+            self.class_count_ = np.zeros(len(self._all_classes), dtype=np.int64)
+        elif X.cardinality != self.class_sums_.shape[2]:
+            raise ValueError("X sets must have the same cardinality as the ones seen ({} and {}).".format(
+                X.cardinality, self.class_sums_.shape[2]))
+
+        unknown_labels = np.setdiff1d(labels, self._all_classes)
+        if len(unknown_labels) > 0:
+            if self._fixed_classes:
+                raise ValueError("Labels {} are not in classes {}.".format(unknown_labels, self._all_classes))
+            all_classes = np.union1d(self._all_classes, labels)
+            indices = np.searchsorted(all_classes, self._all_classes)
+            class_sums = np.zeros((3, len(all_classes), X.cardinality))
+            class_sums[:, indices] = self.class_sums_
+            class_count = np.zeros(len(all_classes), dtype=np.int64)
+            class_count[indices] = self.class_count_
+            self._all_classes, self.class_sums_, self.class_count_ = all_classes, class_sums, class_count
+
+        # all class patterns are summed in a single grouped reduction
+        class_indices = np.searchsorted(self._all_classes, y)
+        if isinstance(X, SparseIFSBatch):
+            # sums of the baselines plus the sums of the sparse deltas, through a sparse class indicator matrix
+            from scipy.sparse import csr_matrix
+            indicator = csr_matrix(
+                (np.ones(len(y)), (class_indices, np.arange(len(y)))), shape=(len(self._all_classes), len(y)))
+            counts = np.bincount(class_indices, minlength=len(self._all_classes))
+            for i, deltas in enumerate(X.deltas):
+                self.class_sums_[i] += (indicator @ deltas).toarray() + counts[:, None] * X.baseline[i]
+        else:
+            np.add.at(self.class_sums_, (slice(None), class_indices), X.values)
+        self.class_count_ += np.bincount(class_indices, minlength=len(self._all_classes))
+
+        seen = self.class_count_ > 0
+        self.classes_ = self._all_classes[seen]
+        self.prototypes_ = IFSBatch.from_array(self.class_sums_[:, seen] / self.class_count_[seen, None])
+        self.class_patterns = {_class: self.prototypes_[i] for i, _class in enumerate(self.classes_)}
         return self
 
     def predict(self, X: Iterable[IntuitionisticFuzzySet]) -> np.ndarray:
@@ -164,29 +253,45 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
 
         Parameters
         ----------
-        X : Iterable[IntuitionisticFuzzySet]
-            Samples.
+        X : Iterable[IntuitionisticFuzzySet], IFSBatch, SparseIFSBatch or 3-d np.ndarray
+            Samples. Iterators, such as generators, are consumed in batches, see predict_iter.
             
         Returns
         -------
         list[np.intp]
             Predicted class label per sample.
         """
-        if not all(isinstance(x, IntuitionisticFuzzySet) for x in X):
-            raise TypeError(
-                "Expected X to be an Iterable of types IntuitionisticFuzzySet or IntuitionisticFuzzySet, got {}".format(type(X)))
-
-        predictions = []
-        for x in X:
-            predictions.append(
-                np.argmin(
-                    [
-                        self.measure_caller(x, self.class_patterns[_class], **self._measure_kwargs) * (1 if self.is_distance else -1)
-                        for _class in self.classes_
-                    ]
-                )
-            )
-        return np.array([self.classes_[pred] for pred in predictions])
+        if isinstance(X, Iterator):
+            return np.concatenate([self.classes_[:0]] + [self.predict(batch) for batch in _iter_batches(X, _BATCH_SIZE)])
+        X = self._check_X(X)
+        return self.classes_[np.concatenate(self._map_chunks(X, predict=True))]
+
+    def predict_iter(self, X: Iterable[IntuitionisticFuzzySet], batch_size: int = 1024) -> Iterator:
+        """ Lazily predicts the class labels of a stream of samples.
+
+        The samples are consumed and classified in batches of batch_size, so only a batch
+        of samples is kept in memory at a time.
+
+        Parameters
+        ----------
+        X : Iterable[IntuitionisticFuzzySet], IFSBatch, SparseIFSBatch or 3-d np.ndarray
+            Samples, e.g. a generator of sets.
+        batch_size : int, optional
+            Number of samples classified at once.
+
+        Yields
+        ------
+        Predicted class label per sample.
+
+        Examples
+        --------
+        >>> for label in classifier.predict_iter(sets_from_disk(), batch_size=4096):
+        ...     write(label)
+        """
+        if isinstance(X, (IFSBatch, SparseIFSBatch, np.ndarray)):
+            X = self._check_X(X)
+        for batch in _iter_batches(X, batch_size):
+            yield from self.predict(batch)
 
     def predict_proba(self, X: Iterable[IntuitionisticFuzzySet]) -> np.ndarray:
         """ Measures of each sample.
@@ -196,36 +301,100 @@ class FuzzyTextClassifier(BaseEstimator, ClassifierMixin):
 
         Parameters
         ----------
-        X : Iterable[IntuitionisticFuzzySet]
-            Samples.
+        X : Iterable[IntuitionisticFuzzySet], IFSBatch, SparseIFSBatch or 3-d np.ndarray
+            Samples. Iterators, such as generators, are consumed in batches.
             
         Returns
         -------
         list[list[float]]
             Returns the measures of the sample for each class, where classes are in self.classes_
         """
-        if not all(isinstance(x, IntuitionisticFuzzySet) for x in X):
-            raise TypeError(
-                "Expected X to be an Iterable of types IntuitionisticFuzzySet or IntuitionisticFuzzySet, got {}".format(type(X)))
+        if isinstance(X, Iterator):
+            return np.concatenate(
+                [np.empty((0, len(self.classes_)))] + [self.predict_proba(batch) for batch in _iter_batches(X, _BATCH_SIZE)])
+        X = self._check_X(X)
+        return np.concatenate(self._map_chunks(X, predict=False))
+
+    def _map_chunks(self, X: IFSBatch, predict: bool) -> List[np.ndarray]:
+        """ Measures the samples against every class pattern, in chunks of samples processed by n_jobs workers.
 
-        probas = []
-        for x in X:
-            probas.append(
-                [self.measure_caller(x, self.class_patterns[_class], **self._measure_kwargs)
-                 for _class in self.classes_]
+        Returns
+        -------
+        list[np.ndarray]
+            For each chunk, the indices of the predicted classes if predict is True, 
+            otherwise the measures of shape `(chunk_size, n_classes)`.
+        """
+        n_jobs = effective_n_jobs(self.n_jobs)
+        chunk_size = max(1, _CHUNK_MEASURES // len(self.classes_))
+        if n_jobs > 1:
+            chunk_size = min(chunk_size, -(-len(X) // n_jobs))
+        if isinstance(X, SparseIFSBatch):
+            # only a chunk of samples is densified at a time
+            chunk_size = min(chunk_size, max(1, _CHUNK_VALUES // X.cardinality))
+            chunks = (X[i:i + chunk_size].to_batch().values for i in range(0, len(X), chunk_size))
+        else:
+            chunks = (X.values[:, i:i + chunk_size] for i in range(0, len(X), chunk_size))
+        sign = (1 if self.is_distance else -1) if predict else None
+        if n_jobs == 1:
+            return [_measure_chunk(chunk, self.prototypes_.values, self.measure_caller, self._measure_kwargs, sign)
+                    for chunk in chunks]
+        with tempfile.TemporaryDirectory(prefix="fsmpy_") as folder:
+            # the workers map the class patterns from the file instead of receiving them with each chunk
+            filename = os.path.join(folder, "prototypes.mmap")
+            joblib.dump(self.prototypes_.values, filename)
+            prototypes = joblib.load(filename, mmap_mode="r")
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(_measure_chunk)(chunk, prototypes, self.measure_caller, self._measure_kwargs, sign)
+                for chunk in chunks
             )
-        return np.vstack(probas)
+            del prototypes
+        return results
+
+    @staticmethod
+    def _check_X(X) -> Union[IFSBatch, SparseIFSBatch]:
+        if isinstance(X, (IFSBatch, SparseIFSBatch)):
+            return X
+        if isinstance(X, np.ndarray) and X.dtype != object:
+            return IFSBatch.from_array(X)
+        if not all(isinstance(x, IntuitionisticFuzzySet) for x in X):
+            raise TypeError(
+                "Expected X to be an Iterable of types IntuitionisticFuzzySet or IFSBatch, got {}".format(type(X)))
+        return IFSBatch.from_sets(X)
 
     def get_params(self, deep=True) -> dict:
         params = {k: v for k, v in self._measure_kwargs.items()}
         params["measure_caller"] = self.measure_caller
         params["is_distance"] = self.is_distance
+        params["n_jobs"] = self.n_jobs
         return params
 
     def set_params(self, **parameters) -> object:
         for parameter, value in parameters.items():
-            if parameter in ["is_distance", "measure_caller"]:
+            if parameter in ["is_distance", "measure_caller", "n_jobs"]:
                 setattr(self, parameter, value)
             else:
                 self._measure_kwargs[parameter] = value
         return self
+
+
+def _iter_batches(X: Iterable, batch_size: int) -> Iterator:
+    """ Splits an IFSBatch in sub-batches, or any other Iterable in lists, of batch_size samples. """
+    if isinstance(X, (IFSBatch, SparseIFSBatch)):
+        for i in range(0, len(X), batch_size):
+            yield X[i:i + batch_size]
+        return
+    X = iter(X)
+    batch = list(islice(X, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(X, batch_size))
+
+
+def _measure_chunk(values: np.ndarray, prototypes: np.ndarray, measure_caller: Callable, measure_kwargs: dict,
+                   sign: int = None) -> np.ndarray:
+    """ Measures a chunk of samples against the class patterns, returning the indices of the best classes if sign is provided. """
+    from .._pairwise import pairwise
+    measures = pairwise(values, prototypes, measure_caller, **measure_kwargs)
+    if sign is None:
+        return measures
+    return np.argmin(measures * sign, axis=1)
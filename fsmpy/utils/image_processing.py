@@ -1,10 +1,23 @@
-from typing import Callable, Tuple
+from collections.abc import Iterator
+from typing import Callable, Iterable, List, Tuple
+from joblib import Parallel, delayed, effective_n_jobs
 import numpy as np
 
-from ..sets import IntuitionisticFuzzySet
+from ..sets import IntuitionisticFuzzySet, IFSBatch
+from .classifiers import _iter_batches
 
+# maximum number of values of the sets of the thresholds measured at once
+_CHUNK_VALUES = 2**20
+# number of pixels of the tiles of rows the image is read in
+_TILE_PIXELS = 2**22
+# number of images thresholded by each job of threshold_batch
+_BATCH_IMAGES = 16
+# maximum number of distinct gray levels of the images of multilevel_threshold
+_MAX_LEVELS = 1024
 
-def threshold(image: np.ndarray, measure_caller: Callable, *, is_distance: bool = True, l: float = 0.2, **kwargs) -> Tuple[np.ndarray, bool]:
+
+def threshold(image: np.ndarray, measure_caller: Callable, *, is_distance: bool = True, l: float = 0.2,
+              out: np.ndarray = None, **kwargs) -> Tuple[np.ndarray, bool]:
     """ Thresholds the input image following the proposed method by T. Chaira and A.K. Ray, from the related article:
     "Threshold selection using fuzzy set theory".
 
@@ -13,58 +26,419 @@ def threshold(image: np.ndarray, measure_caller: Callable, *, is_distance: bool
     The selected threshold value is the one with the min/max (Depending on is_distance) measure
     between the sets for each threshold value t.
 
+    The measures that are a weighted mean over the elements of the sets (e.g. `ye`, `chen_1`,
+    `hung_yang_1` or `wang_xin` with `WANGXIN_DISTANCE_1`), called without weights, are calculated
+    over the gray levels of the image weighted by their number of pixels, instead of over every pixel.
+    The image is read in tiles of rows and never copied, so with these measures, images larger
+    than the memory can be thresholded from an `np.memmap` into an `np.memmap` out.
+
     Parameters
     ----------
     image : np.ndarray
-        Single channel input image.
+        Single channel input image, an `np.memmap` or an array-like supporting slicing of rows.
     measure_caller : Callable
         The measure function to use when measuring the sets of the ideally thresholded image and the current image set.
     is_distance : bool
         If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
     l : float
         Used to calculate the membership values of the thresholded image with value t.
+    out : np.ndarray, optional
+        Array of the shape of the image, e.g. an `np.memmap`, where the thresholded image is written
+        tile by tile. If not provided, an array of the data type of the image is allocated.
     **kwargs : additional arguments
         Passed to the measure_caller.
         
     Returns
     -------
     thresholded_image : np.ndarray
-        Thresholded image.
+        Thresholded image, out if provided.
     threshold_value : np.float64
         Threshold value.
+
+    Examples
+    --------
+    >>> image = np.memmap("scan.raw", dtype=np.uint8, mode="r", shape=(40000, 40000))
+    >>> out = np.memmap("mask.raw", dtype=np.uint8, mode="w+", shape=image.shape)
+    >>> threshold(image, ye, is_distance=False, out=out)
+    """
+    return _threshold(image, measure_caller, _histogram_measure(measure_caller, kwargs), is_distance, l, out, kwargs)
+
+
+def threshold_batch(images: Iterable[np.ndarray], measure_caller: Callable, n_jobs: int = None, *,
+                    is_distance: bool = True, l: float = 0.2, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    """ Thresholds many images, e.g. the frames of a video, see threshold.
+
+    The images are thresholded in batches of frames by n_jobs joblib workers, and the
+    resolution of the measure is done once for all the images.
+
+    Parameters
+    ----------
+    images : Iterable[np.ndarray]
+        Single channel input images of the same shape, a 3-d array or an Iterable, e.g. a generator of frames.
+    measure_caller : Callable
+        The measure function to use when measuring the sets of the ideally thresholded image and the current image set.
+    n_jobs : int, optional
+        Number of joblib workers, each thresholding a batch of images. None means 1 unless in a
+        `joblib.parallel_config` context, -1 means all the processors.
+    is_distance : bool
+        If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
+    l : float
+        Used to calculate the membership values of the thresholded image with value t.
+    **kwargs : additional arguments
+        Passed to the measure_caller.
+
+    Returns
+    -------
+    thresholded_images : np.ndarray
+        Thresholded images, in the order of images, of shape `(n_images, height, width)`.
+    threshold_values : np.ndarray
+        Threshold value of each image.
+    """
+    histogram = _histogram_measure(measure_caller, kwargs)
+    batches = _iter_batches(images, _BATCH_IMAGES)
+    n_jobs = effective_n_jobs(n_jobs)
+    if n_jobs > 1:
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_threshold_images)(batch, measure_caller, histogram, is_distance, l, kwargs) for batch in batches
+        )
+    else:
+        results = [_threshold_images(batch, measure_caller, histogram, is_distance, l, kwargs) for batch in batches]
+    if len(results) == 0:
+        raise ValueError("images must hold at least one image.")
+    return np.concatenate([masks for masks, _ in results]), np.concatenate([values for _, values in results])
+
+
+def multilevel_threshold(image: np.ndarray, k: int, measure_caller: Callable, *, is_distance: bool = True,
+                         l: float = 0.2, out: np.ndarray = None, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    """ Segments the input image in k + 1 classes of gray levels with k thresholds, generalizing the 
+    method proposed by T. Chaira and A.K. Ray, from the related article: "Threshold selection using fuzzy set theory".
+
+    The membership value of a pixel is calculated from its distance to the gray level nearest to the mean
+    gray level of its class. The selected thresholds are the ones with the min/max (Depending on is_distance)
+    mean over the pixels of the measure between the set of the pixel and the set of the ideally thresholded
+    pixel. For the measures that are a mean over the elements of the sets (e.g. `ye`, `chen_1` or 
+    `wang_xin` with `WANGXIN_DISTANCE_1`), this is the measure between the sets of the images, as in threshold.
+
+    The measure is calculated once for each distance between two gray levels, and the thresholds are searched
+    with dynamic programming over the gray level histogram, in O(k * n_levels^2) steps and memory. Images with
+    more than 1024 distinct gray levels, e.g. most 16-bit images, must be quantized first (`image // 64`).
+
+    Parameters
+    ----------
+    image : np.ndarray
+        Single channel input image, an `np.memmap` or an array-like supporting slicing of rows.
+    k : int
+        Number of thresholds, at least 1.
+    measure_caller : Callable
+        The measure function to use when measuring the sets of the ideally thresholded pixels and the pixels,
+        called with sets of a single element.
+    is_distance : bool
+        If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
+    l : float
+        Used to calculate the membership values of the thresholded image.
+    out : np.ndarray, optional
+        Array of the shape of the image where the class of each pixel is written tile by tile.
+    **kwargs : additional arguments
+        Passed to the measure_caller.
+
+    Returns
+    -------
+    segmented_image : np.ndarray
+        Class of each pixel, from 0 for the darkest to k, out if provided.
+    threshold_values : np.ndarray
+        The k increasing threshold values, the lowest gray level of the classes 1 to k.
+
+    Examples
+    --------
+    >>> classes, thresholds = multilevel_threshold(image, 3, ye, is_distance=False)
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1, not {}.".format(k))
+    if not hasattr(image, "shape"):
+        image = np.asarray(image)
+    if out is not None and out.shape != image.shape:
+        raise ValueError("out must have the shape of the image {}, got {}.".format(image.shape, out.shape))
+
+    levels, counts = _gray_levels(image)
+    present = counts > 0
+    levels, counts = levels[present], counts[present].astype(np.float64)
+    n = len(levels)
+    if n < k + 1:
+        raise ValueError("The image has {} gray levels, at least k + 1 = {} are required.".format(n, k + 1))
+    if n > _MAX_LEVELS:
+        raise ValueError("The image has {} gray levels, at most {} are supported, quantize it first.".format(n, _MAX_LEVELS))
+    c = 1 / (levels[-1] - levels[0])
+
+    # measure of each gray level when its class is represented by another gray level, depending only on their distance
+    distances, index = np.unique(np.abs(levels[:, None] - levels[None, :].astype(np.float64)), return_inverse=True)
+    mx = np.exp(-c * distances)[:, None]
+    sets = IFSBatch(mx, (1.0 - mx) - ((1.0 - mx) / (1.0 + l * mx)))
+    measures = _measure_sets(measure_caller, sets, IntuitionisticFuzzySet(np.ones(1)), kwargs)
+    costs = (measures if is_distance else -measures)[index.reshape(n, n)] * counts[:, None]
+
+    # cost of the class of the levels [a, b) is cumulative_costs[b, r] - cumulative_costs[a, r], r nearest to its mean
+    cumulative_costs = np.concatenate([np.zeros((1, n)), np.cumsum(costs, axis=0)])
+    cumulative_counts = np.concatenate([[0], np.cumsum(counts)])
+    cumulative_sums = np.concatenate([[0], np.cumsum(counts * levels)])
+    a, b = np.triu_indices(n + 1, 1)
+    means = (cumulative_sums[b] - cumulative_sums[a]) / (cumulative_counts[b] - cumulative_counts[a])
+    r = np.clip(np.searchsorted(levels, means), 1, n - 1)
+    r -= means - levels[r - 1] <= levels[r] - means
+    class_costs = np.full((n + 1, n + 1), np.inf)
+    class_costs[a, b] = cumulative_costs[b, r] - cumulative_costs[a, r]
+
+    # total[b] is the min cost of the levels [0, b) in j + 1 classes, starts[j][b] the start of the last class
+    total = class_costs[0]
+    starts = []
+    for _ in range(k):
+        candidates = total[:, None] + class_costs
+        starts.append(np.argmin(candidates, axis=0))
+        total = candidates[starts[-1], np.arange(n + 1)]
+    bounds = [n]
+    for start in reversed(starts):
+        bounds.append(start[bounds[-1]])
+    thresholds = levels[bounds[:0:-1]]
+
+    if out is None:
+        out = np.zeros(image.shape, dtype=np.min_scalar_type(k))
+    classes = np.searchsorted(thresholds, np.arange(256), side="right").astype(out.dtype)
+    for rows in _tiles(image):
+        tile = np.asarray(image[rows])
+        # 8-bit images index the classes of the 256 gray levels directly
+        out[rows] = classes[tile] if tile.dtype == np.uint8 else np.searchsorted(thresholds, tile, side="right")
+    return out, thresholds
+
+
+def adaptive_threshold(image: np.ndarray, measure_caller: Callable, block_size: int = 64, radius: int = 1, *,
+                       is_distance: bool = True, l: float = 0.2, out: np.ndarray = None, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+    """ Thresholds each block of the input image with its own threshold value, see threshold, e.g. for
+    unevenly lit images.
+
+    The image is divided in a grid of blocks of block_size x block_size pixels, and the threshold value
+    of each block is the one of the window of the blocks at most radius blocks away from it. The histograms
+    of the windows are calculated from the integral histogram of the grid, accumulated in a single pass
+    over the image, so the cost of the histograms is linear in the number of pixels. With the measures
+    calculated over gray levels (see threshold), the cost of a threshold value does not depend on the size
+    of its window. The windows of a single gray level take the threshold value of the whole image.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        Single channel 8-bit input image, an `np.memmap` or an array-like supporting slicing of rows.
+    measure_caller : Callable
+        The measure function to use when measuring the sets of the ideally thresholded image and the current image set.
+    block_size : int, optional
+        Size in pixels of the side of the blocks.
+    radius : int, optional
+        Number of blocks on each side of a block in its window, the windows have up to
+        (2 * radius + 1) x (2 * radius + 1) blocks.
+    is_distance : bool
+        If the measure provided is a distance or a similarity. Used to pick the best measure calculated.
+    l : float
+        Used to calculate the membership values of the thresholded image with value t.
+    out : np.ndarray, optional
+        Array of the shape of the image where the thresholded image is written tile by tile.
+    **kwargs : additional arguments
+        Passed to the measure_caller.
+
+    Returns
+    -------
+    thresholded_image : np.ndarray
+        Thresholded image, out if provided.
+    threshold_values : np.ndarray
+        Threshold value of each block, of shape `(ceil(height / block_size), ceil(width / block_size))`.
+
+    Examples
+    --------
+    >>> thresholded, thresholds = adaptive_threshold(scan, ye, block_size=128, is_distance=False)
     """
+    if block_size < 1 or radius < 0:
+        raise ValueError("block_size must be >= 1 and radius >= 0, got {} and {}.".format(block_size, radius))
+    if not hasattr(image, "shape"):
+        image = np.asarray(image)
+    if image.dtype != np.uint8:
+        raise ValueError("image must be an 8-bit image, got {}.".format(image.dtype))
+    x, y = image.shape
+    if out is not None and out.shape != (x, y):
+        raise ValueError("out must have the shape of the image {}, got {}.".format((x, y), out.shape))
+
+    # integral histogram of the grid of blocks, accumulated over tiles of whole rows of blocks
+    n_rows, n_columns = -(-x // block_size), -(-y // block_size)
+    integral = np.zeros((n_rows + 1, n_columns + 1, 256), dtype=np.int64)
+    tile_rows = block_size * max(1, _TILE_PIXELS // (block_size * y))
+    columns = np.arange(y) // block_size
+    for start in range(0, x, tile_rows):
+        tile = np.asarray(image[start:start + tile_rows])
+        blocks = (np.arange(len(tile)) // block_size)[:, None] * n_columns + columns
+        counts = np.bincount((blocks * 256 + tile).ravel(), minlength=(blocks[-1, -1] + 1) * 256)
+        first = start // block_size
+        integral[first + 1:first + 1 + blocks[-1, -1] // n_columns + 1, 1:] = counts.reshape(-1, n_columns, 256)
+    integral = np.cumsum(np.cumsum(integral, axis=0), axis=1)
+
+    # histograms of the windows of the blocks
+    rows_start = np.clip(np.arange(n_rows) - radius, 0, n_rows)
+    rows_stop = np.clip(np.arange(n_rows) + radius + 1, 0, n_rows)
+    columns_start = np.clip(np.arange(n_columns) - radius, 0, n_columns)
+    columns_stop = np.clip(np.arange(n_columns) + radius + 1, 0, n_columns)
+    windows = (
+        integral[rows_stop][:, columns_stop] - integral[rows_start][:, columns_stop] -
+        integral[rows_stop][:, columns_start] + integral[rows_start][:, columns_start]
+    )
+
+    histogram = _histogram_measure(measure_caller, kwargs)
+    levels = np.arange(256)
+
+    def select(counts):
+        index = np.repeat(levels, counts) if histogram[0] is None else None
+        return _select_threshold(levels, counts, index, measure_caller, histogram, is_distance, l, kwargs)
+
+    global_threshold = select(integral[-1, -1])
+    thresholds = np.array([
+        select(counts) if np.count_nonzero(counts) > 1 else global_threshold
+        for counts in windows.reshape(-1, 256)
+    ]).reshape(n_rows, n_columns)
+
+    if out is None:
+        out = np.zeros((x, y), dtype=image.dtype)
+    for rows in _tiles(image):
+        tile = np.asarray(image[rows])
+        pixel_thresholds = thresholds[np.arange(rows.start, rows.start + len(tile)) // block_size][:, columns]
+        out[rows] = np.where(tile >= pixel_thresholds, 255, 0)
+    return out, thresholds
+
+
+def _threshold_images(images: List[np.ndarray], measure_caller: Callable, histogram: Tuple[Callable, dict],
+                      is_distance: bool, l: float, kwargs: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """ Thresholds a batch of images, returning their stacked thresholded images and threshold values. """
+    results = [_threshold(image, measure_caller, histogram, is_distance, l, None, kwargs) for image in images]
+    return np.stack([mask for mask, _ in results]), np.array([t for _, t in results])
+
+
+def _threshold(image: np.ndarray, measure_caller: Callable, histogram: Tuple[Callable, dict], is_distance: bool,
+               l: float, out: np.ndarray, kwargs: dict) -> Tuple[np.ndarray, bool]:
+    """ threshold, given the measure calculated over gray levels resolved by _histogram_measure. """
+    if not hasattr(image, "shape"):
+        image = np.asarray(image)
     x, y = image.shape
-    img = image.copy().flatten()
-    mx = np.zeros_like(img, dtype=np.float64)
-    fmax = np.max(img)
-    fmin = np.min(img)
+    if out is not None and out.shape != (x, y):
+        raise ValueError("out must have the shape of the image {}, got {}.".format((x, y), out.shape))
+
+    levels, counts = _gray_levels(image)
+    index = _gray_level_index(image, levels) if histogram[0] is None else None
+    t = _select_threshold(levels, counts, index, measure_caller, histogram, is_distance, l, kwargs)
+
+    if out is None:
+        out = np.zeros((x, y), dtype=image.dtype)
+    for rows in _tiles(image):
+        out[rows] = np.where(np.asarray(image[rows]) >= t, 255, 0)
+    return out, t
+
+
+def _select_threshold(levels: np.ndarray, counts: np.ndarray, index: np.ndarray, measure_caller: Callable,
+                      histogram: Tuple[Callable, dict], is_distance: bool, l: float, kwargs: dict) -> int:
+    """ The threshold value of the pixels of the gray levels with their number of pixels counts, index being
+    the index in levels of each pixel, required only if the measure is not calculated over gray levels.
+    """
+    # the membership of a pixel depends only on its gray level, so the values of each set are 
+    # calculated once per gray level, and gathered for the pixels if the measure needs them
+    fmin, fmax = levels[counts > 0][[0, -1]]
     c = 1 / (fmax - fmin)
+    measure, params = histogram
+    if measure is not None:
+        # one element per gray level, weighted by the number of pixels of the level
+        present = counts > 0
+        levels, index = levels[present], None
+        params = {**params, "weights": counts[present] / np.sum(counts)}
+    else:
+        measure, params = measure_caller, kwargs
+    n_elements = len(levels) if index is None else len(index)
 
+    # the sets of many thresholds are measured at once, in chunks of thresholds
+    B = IntuitionisticFuzzySet(np.ones(n_elements))
+    chunk = max(1, _CHUNK_VALUES // n_elements)
     measures = []
-    for t in range(256):
-        low_count = np.sum(img <= t)
-        m0 = (low_count * t) / low_count
-        if np.isnan(m0) or not np.isfinite(m0):
-            m0 = 0
-        high_count = np.sum(img > t)
-        m1 = (high_count * t) / high_count
-        if np.isnan(m1) or not np.isfinite(m1):
-            m1 = 0
-
-        np.putmask(mx, img >= t, np.exp(-c * np.abs(img - m0)))
-        np.putmask(mx, img < t, np.exp(-c * np.abs(img - m1)))
-
-        A = IntuitionisticFuzzySet(
-            mx, 
-            (1.0 - mx) - ((1.0 - mx) / (1.0 + l * mx))
-        )
-        B = IntuitionisticFuzzySet([1.0] * len(A))
-        measures.append(
-            measure_caller(A, B, **kwargs)
-        )
-    
-    t = np.argmin(measures) if is_distance else np.argmax(measures)
-    mask = np.zeros_like(img)
-    mask[img >= t] = 255
-    return mask.reshape((x, y)), t
+    for start in range(0, 256, chunk):
+        sets = _threshold_sets(levels, np.arange(start, min(start + chunk, 256)), fmin, fmax, c, l)
+        if index is not None:
+            sets = IFSBatch.from_array(np.take(sets.values, index, axis=-1))
+        measures.append(_measure_sets(measure, sets, B, params))
+    measures = np.concatenate(measures)
+
+    return np.argmin(measures) if is_distance else np.argmax(measures)
+
+
+def _tiles(image: np.ndarray) -> Iterator[slice]:
+    """ Slices of the rows of the tiles of the image, of about _TILE_PIXELS pixels. """
+    rows = max(1, _TILE_PIXELS // max(image.shape[1], 1))
+    return (slice(start, start + rows) for start in range(0, image.shape[0], rows))
+
+
+def _gray_levels(image: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """ The gray levels of the image and their number of pixels, accumulated tile by tile. """
+    if image.dtype == np.uint8:
+        # the image indexes the 256 gray levels directly
+        counts = np.zeros(256, dtype=np.int64)
+        for rows in _tiles(image):
+            counts += np.bincount(np.asarray(image[rows]).ravel(), minlength=256)
+        return np.arange(256), counts
+    levels, counts = np.array([], dtype=image.dtype), np.array([], dtype=np.int64)
+    for rows in _tiles(image):
+        tile_levels, tile_counts = np.unique(np.asarray(image[rows]), return_counts=True)
+        levels, index = np.unique(np.concatenate([levels, tile_levels]), return_inverse=True)
+        counts = np.bincount(index, weights=np.concatenate([counts, tile_counts]), minlength=len(levels)).astype(np.int64)
+    return levels, counts
+
+
+def _gray_level_index(image: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """ The index in levels of the gray level of each pixel of the flattened image. """
+    if image.dtype == np.uint8 and isinstance(image, np.ndarray):
+        return image.reshape(-1)
+    index = np.empty(image.shape[0] * image.shape[1], dtype=np.min_scalar_type(len(levels) - 1))
+    for rows in _tiles(image):
+        tile = np.asarray(image[rows]).ravel()
+        start = rows.start * image.shape[1]
+        index[start:start + len(tile)] = np.searchsorted(levels, tile)
+    return index
+
+
+def _threshold_sets(values: np.ndarray, thresholds: np.ndarray, fmin, fmax, c: float, l: float) -> IFSBatch:
+    """ The sets of the gray levels values of the image thresholded with each value of thresholds. """
+    t = thresholds[:, None]
+    m0 = np.where(fmin <= t, t, 0)  # mean of the gray levels <= t, t by the definition of the article
+    m1 = np.where(fmax > t, t, 0)  # mean of the gray levels > t
+    mx = np.exp(-c * np.abs(values - np.where(values >= t, m0, m1)))
+    return IFSBatch(
+        mx, 
+        (1.0 - mx) - ((1.0 - mx) / (1.0 + l * mx))
+    )
+
+
+def _measure_sets(measure: Callable, sets: IFSBatch, B: IntuitionisticFuzzySet, params: dict) -> np.ndarray:
+    """ Measures every set of the batch against B, in a single call when the measure broadcasts. """
+    from .._pairwise import _is_broadcast
+
+    if _is_broadcast(measure):
+        return np.broadcast_to(measure(sets, B, **params), (len(sets),))
+    return np.array([measure(S, B, **params) for S in sets])
+
+
+def _histogram_measure(measure_caller: Callable, kwargs: dict) -> Tuple[Callable, dict]:
+    """ The measure function and its arguments if the measure is a weighted mean over the elements
+    of the sets, equal to the measure of the sets of the gray levels weighted by their number of pixels,
+    else None and the arguments.
+    """
+    from .. import WANGXIN_DISTANCE_1
+    from ..distances import wang_xin
+    from ..similarities import (dengfeng_chuntian, park_kwun_lim, julian_hung_lin, hung_yang_1, ye,
+                                chen_1, chen_2, song_wang_lei_xue, chen_cheng_lan)
 
+    # measures bound to their arguments, e.g. by make_measure
+    measure = getattr(measure_caller, "func", measure_caller)
+    params = {**getattr(measure_caller, "keywords", {}), **kwargs}
+    decomposable = (dengfeng_chuntian, park_kwun_lim, julian_hung_lin, hung_yang_1, ye,
+                    chen_1, chen_2, song_wang_lei_xue, chen_cheng_lan)
+    if params.get("weights") is not None:
+        return None, params
+    if measure in decomposable or (measure is wang_xin and params.get("distance_type", WANGXIN_DISTANCE_1) == WANGXIN_DISTANCE_1):
+        return measure, params
+    return None, params
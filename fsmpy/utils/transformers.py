@@ -0,0 +1,128 @@
+from typing import Iterable, Union
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+import numpy as np
+
+from ..sets import IFSBatch, SparseIFSBatch
+
+
+class IFSTransformer(TransformerMixin, BaseEstimator):
+    """ Transforms token counts to Intuitionistic Fuzzy Sets, as proposed by P. Intarapaiboon from
+    the related article: "Text classification using similarity measures on intuitionistic fuzzy sets".
+
+    Estimator version of calculate_documents_membership, that keeps the means and standard
+    deviations of the tokens of the training documents to transform the documents to classify.
+    The sets are emitted directly as an IFSBatch, or a SparseIFSBatch for scipy.sparse counts, so
+    it can be chained with a FuzzyTextClassifier without intermediate lists of sets:
+
+    >>> from sklearn.pipeline import make_pipeline
+    >>> from sklearn.feature_extraction.text import CountVectorizer
+    >>> model = make_pipeline(CountVectorizer(), IFSTransformer(0.9, 0.9), FuzzyTextClassifier(wang_xin))
+    >>> model.fit(documents, labels).predict(new_documents)
+
+    Follows Transformer API from scikit-learn.
+
+    Attributes
+    ----------
+    membership_weight : float
+        Weight used to calculate the membership values of each token's membership value.
+    non_membership_weight : float
+        Weight used to calculate the non-membership values of each token's membership value.
+    dtype : data-type
+        Data type of the values of the sets.
+    means_ : np.ndarray
+        Mean values for each token of the documents seen.
+    stds_ : np.ndarray
+        Standard deviation values for each token of the documents seen.
+    n_samples_seen_ : int
+        Number of documents seen.
+
+    See also
+    --------
+    fsmpy.utils.calculate_documents_membership, sklearn.feature_extraction.text.CountVectorizer
+    """
+    def __init__(self, membership_weight: float, non_membership_weight: float, *, dtype: type = np.float64):
+        """ Constructor method.
+
+        Parameters
+        ----------
+        membership_weight : float
+            Weight used to calculate the membership values of each token's membership value.
+        non_membership_weight : float
+            Weight used to calculate the non-membership values of each token's membership value.
+        dtype : data-type, optional
+            Data type of the values of the sets, np.float32 or np.float64. Default is np.float64.
+        """
+        self.membership_weight = membership_weight
+        self.non_membership_weight = non_membership_weight
+        self.dtype = dtype
+
+    def fit(self, X: Iterable, y: Iterable = None) -> object:
+        """ Calculates the means and standard deviations of the tokens.
+
+        Parameters
+        ----------
+        X : 2-d Iterable or scipy.sparse matrix
+            Token counts of the training documents.
+        y : None
+            Ignored.
+
+        Returns
+        -------
+        self: Object
+            An instance of the transformer.
+        """
+        self._statistics = None
+        return self.partial_fit(X, y)
+
+    def partial_fit(self, X: Iterable, y: Iterable = None) -> object:
+        """ Updates the means and standard deviations of the tokens with the documents X.
+
+        The statistics of the documents seen are merged with the ones of X, so a dataset can
+        be fitted in chunks, with the same result as fitting it at once.
+
+        Parameters
+        ----------
+        X : 2-d Iterable or scipy.sparse matrix
+            Token counts of documents.
+        y : None
+            Ignored.
+
+        Returns
+        -------
+        self: Object
+            An instance of the transformer.
+        """
+        from . import _chunk_statistics, _merge_statistics, _is_sparse
+
+        if not _is_sparse(X):
+            X = np.asarray(X)
+        statistics = getattr(self, "_statistics", None)
+        if statistics is not None and X.shape[1] != len(statistics[1]):
+            raise ValueError("X must have the same number of tokens as the documents seen ({} and {}).".format(
+                X.shape[1], len(statistics[1])))
+
+        self._statistics = _merge_statistics(statistics, _chunk_statistics(X))
+        self.n_samples_seen_, self.means_, deviations = self._statistics
+        self.stds_ = np.sqrt(deviations / (self.n_samples_seen_ - 1))
+        return self
+
+    def transform(self, X: Iterable) -> Union[IFSBatch, SparseIFSBatch]:
+        """ Calculates the set of each document.
+
+        Parameters
+        ----------
+        X : 2-d Iterable or scipy.sparse matrix
+            Token counts of documents.
+
+        Returns
+        -------
+        IFSBatch or SparseIFSBatch
+            Batch of IntuitionisticFuzzySets, one for each document. For sparse X, a SparseIFSBatch
+            whose baseline holds the values of zero counts.
+        """
+        from . import calculate_documents_membership
+
+        check_is_fitted(self, "means_")
+        return calculate_documents_membership(
+            X, self.membership_weight, self.non_membership_weight, self.means_, self.stds_, self.dtype)[0]
@@ -46,5 +46,6 @@ setup(
         "numpy >= 1.14.6",
         "scikit-learn >=0.24.2",
         "tqdm >= 4.62.1",
+        "joblib >= 0.12",
     ],
 )
\ No newline at end of file